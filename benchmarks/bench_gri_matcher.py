@@ -0,0 +1,75 @@
+"""
+GRI 주제 매칭 벤치마크: 기존 3중 루프 vs 컴파일된 GRIMatcher vs 희소 행렬(analyze_topics)
+
+사용법:
+    python benchmarks/bench_gri_matcher.py --topics 40 --keywords 50 --articles 5000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "service", "gri-service", "app"))
+
+from matcher import GRIMatcher  # noqa: E402
+from vectorized import analyze_topics  # noqa: E402
+
+
+def legacy_count(article_nouns, gri_dict):
+    """기존 count_gri_frequency의 기사 × 단어 × 주제 루프"""
+    gri_counts = {topic: 0 for topic in gri_dict.keys()}
+    for processed_words in article_nouns:
+        found_topics_in_article = set()
+        for word in processed_words:
+            for topic, keywords in gri_dict.items():
+                if word in keywords:
+                    found_topics_in_article.add(topic)
+        for topic in found_topics_in_article:
+            gri_counts[topic] += 1
+    return gri_counts
+
+
+def make_corpus(topics, keywords, articles, words_per_article, seed):
+    rng = random.Random(seed)
+    syllables = [chr(code) for code in range(0xAC00, 0xAC00 + 400)]
+    vocab = list({"".join(rng.choices(syllables, k=rng.randint(2, 4))) for _ in range(topics * keywords * 4)})
+    gri_dict = {f"GRI {300 + i}": rng.sample(vocab, keywords) for i in range(topics)}
+    article_nouns = [set(rng.choices(vocab, k=words_per_article)) for _ in range(articles)]
+    return gri_dict, article_nouns
+
+
+def timed(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--topics", type=int, default=40)
+    parser.add_argument("--keywords", type=int, default=50)
+    parser.add_argument("--articles", type=int, default=5000)
+    parser.add_argument("--words", type=int, default=120)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    gri_dict, article_nouns = make_corpus(args.topics, args.keywords, args.articles, args.words, args.seed)
+
+    legacy, legacy_seconds = timed(legacy_count, article_nouns, gri_dict)
+    matcher, compile_seconds = timed(GRIMatcher, gri_dict)
+    compiled, matcher_seconds = timed(matcher.count_articles, article_nouns)
+    stats, sparse_seconds = timed(analyze_topics, article_nouns, matcher)
+
+    assert legacy == compiled, "GRIMatcher 결과가 기존 루프와 다릅니다"
+    assert legacy == stats.topic_counts, "analyze_topics 결과가 기존 루프와 다릅니다"
+    print(f"topics={args.topics} keywords/topic={args.keywords} articles={args.articles} words/article={args.words}")
+    print(f"legacy loop : {legacy_seconds * 1000:10.1f} ms")
+    print(f"compile     : {compile_seconds * 1000:10.1f} ms")
+    print(f"GRIMatcher  : {matcher_seconds * 1000:10.1f} ms  (x{legacy_seconds / max(matcher_seconds, 1e-9):.1f})")
+    print(f"sparse      : {sparse_seconds * 1000:10.1f} ms  (x{legacy_seconds / max(sparse_seconds, 1e-9):.1f}, 동시 등장/TF-IDF 포함)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+마이크로 벤치마크: preprocess, count_gri_frequency, AuthService.verify_jwt_token
+
+합성 코퍼스(benchmarks/corpus.py)로 각 함수를 반복 호출한 지연 시간 분포를 JSON 결과 파일로 남깁니다.
+preprocess는 Okt(JVM)가 필요하며, 없는 환경에서는 skipped로 기록하고 나머지를 측정합니다.
+
+사용법:
+    python benchmarks/bench_micro.py --articles 2000 --repeat 5
+    python benchmarks/bench_micro.py --only verify_jwt_token --output benchmarks/results/micro-latest.json
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "service", "gri-service", "app"))
+sys.path.insert(0, os.path.join(ROOT, "gateway"))
+
+from corpus import SYNTHETIC_GRI_DICT, generate_articles  # noqa: E402
+from results import summarize, write_results  # noqa: E402
+
+BENCHMARKS = ("preprocess", "count_gri_frequency", "verify_jwt_token")
+
+
+def timed_samples(func, repeat):
+    # 첫 호출(지연 import, 캐시 준비)은 측정에서 제외
+    func()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def bench_preprocess(articles, args):
+    """기사 한 건당 명사 추출 + 불용어 제거 시간"""
+    try:
+        from analysis import preprocess
+        from tokenizer import get_tokenizer
+
+        started = time.perf_counter()
+        get_tokenizer().warmup()
+        warmup_seconds = time.perf_counter() - started
+    except Exception as e:
+        return {"skipped": f"Okt를 사용할 수 없음: {e}"}
+
+    texts = [article.text for article in articles[:args.preprocess_articles]]
+    samples = []
+    for text in texts:
+        started = time.perf_counter()
+        preprocess(text)
+        samples.append(time.perf_counter() - started)
+    result = summarize(samples, sum(samples))
+    result["warmup_ms"] = round(warmup_seconds * 1000, 1)
+    return {"per_article": result}
+
+
+def bench_count_gri_frequency(articles, args):
+    """토큰화가 끝난 기사 명사 집합으로 주제 빈도 계산 (백엔드별 전체 코퍼스 1회 = 표본 1개)"""
+    import pandas as pd
+    from analysis import count_gri_frequency
+
+    df = pd.DataFrame({"article_text": [article.text for article in articles]})
+    article_nouns = [set(article.nouns) for article in articles]
+    results = {}
+    for backend in ("index", "sparse"):
+        samples = timed_samples(
+            lambda: count_gri_frequency(df, SYNTHETIC_GRI_DICT, article_nouns=article_nouns, backend=backend),
+            args.repeat,
+        )
+        result = summarize(samples)
+        result["articles_per_s"] = round(len(articles) / min(samples), 1)
+        results[backend] = result
+    return results
+
+
+def bench_verify_jwt_token(args):
+    """서명 검증(캐시 미스)과 검증 캐시 적중 경로 비교"""
+    os.environ.setdefault("GOOGLE_CLIENT_ID", "bench-client-id")
+    os.environ.setdefault("GOOGLE_CLIENT_SECRET", "bench-client-secret")
+    from app.domain.service.auth_service import AuthService
+
+    service = AuthService()
+    tokens = [
+        service.create_jwt_token({"email": f"user{i}@bench.local", "name": f"user{i}", "google_id": str(i)})
+        for i in range(args.tokens)
+    ]
+
+    async def run():
+        service.token_cache.clear()
+        cold = []
+        for token in tokens:
+            started = time.perf_counter()
+            await service.verify_jwt_token(token)
+            cold.append(time.perf_counter() - started)
+        warm = []
+        for token in tokens:
+            started = time.perf_counter()
+            await service.verify_jwt_token(token)
+            warm.append(time.perf_counter() - started)
+        return cold, warm
+
+    cold, warm = asyncio.run(run())
+    return {"signature": summarize(cold, sum(cold)), "cache_hit": summarize(warm, sum(warm))}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=2000, help="합성 기사 수")
+    parser.add_argument("--preprocess-articles", type=int, default=200, help="preprocess 측정에 쓸 기사 수")
+    parser.add_argument("--repeat", type=int, default=5, help="count_gri_frequency 반복 횟수")
+    parser.add_argument("--tokens", type=int, default=2000, help="verify_jwt_token 측정 토큰 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--only", choices=BENCHMARKS, action="append", help="특정 벤치마크만 실행 (반복 지정 가능)")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: benchmarks/results/micro-<시각>.json)")
+    args = parser.parse_args()
+
+    selected = args.only or BENCHMARKS
+    articles = list(generate_articles(args.articles, args.seed))
+    results = {}
+    if "preprocess" in selected:
+        results["preprocess"] = bench_preprocess(articles, args)
+    if "count_gri_frequency" in selected:
+        results["count_gri_frequency"] = bench_count_gri_frequency(articles, args)
+    if "verify_jwt_token" in selected:
+        results["verify_jwt_token"] = bench_verify_jwt_token(args)
+
+    for name, result in results.items():
+        print(f"{name}: {result}")
+    config = {key: value for key, value in vars(args).items() if key != "output"}
+    write_results("micro", results, config, args.output)
+
+
+if __name__ == "__main__":
+    main()
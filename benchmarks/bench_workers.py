@@ -0,0 +1,223 @@
+"""
+Gateway 워커 수별 처리량 스케일링 벤치마크
+
+워커 수마다 gunicorn(gateway/gunicorn.conf.py)으로 Gateway를 새로 띄우고,
+여러 부하 생성 프로세스에서 loadgen 시나리오를 실행해 처리량과 지연 시간을 비교합니다.
+실행마다 공유 메모리/세션/메트릭 파일을 임시 디렉터리에 따로 두며, 요청 제한은 끕니다.
+
+종료 후 /metrics의 gateway_token_verifications_total도 기록합니다.
+워커 간 검증 토큰 캐시가 공유되면 verify 시나리오의 서명 검증(verified) 횟수가 워커 수와 무관하게 유지됩니다.
+
+사용법:
+    python benchmarks/bench_workers.py --workers 1,2,4 --duration 15 --concurrency 64 --client-processes 4
+    python benchmarks/bench_workers.py --scenario oauth --workers 1,2
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from loadgen import ScenarioStats, oauth_flow, run_user, start_mock_google  # noqa: E402
+from results import summarize, write_results  # noqa: E402
+
+GATEWAY_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "gateway")
+
+
+def gateway_env(args, workers: int, state_dir: str) -> Dict[str, str]:
+    """벤치마크용 Gateway 환경 변수 (구글 목 서버 사용, 실행별 공유 상태 파일 분리)"""
+    mock = f"http://127.0.0.1:{args.mock_google_port}"
+    env = dict(os.environ)
+    env.update({
+        "GATEWAY_BIND": f"127.0.0.1:{args.port}",
+        "GATEWAY_WORKERS": str(workers),
+        "GATEWAY_LOG_LEVEL": "warning",
+        "GOOGLE_CLIENT_ID": env.get("GOOGLE_CLIENT_ID", "bench-client"),
+        "GOOGLE_CLIENT_SECRET": env.get("GOOGLE_CLIENT_SECRET", "bench-secret"),
+        "GOOGLE_AUTH_URL": f"{mock}/auth",
+        "GOOGLE_TOKEN_URL": f"{mock}/token",
+        "GOOGLE_USERINFO_URL": f"{mock}/userinfo",
+        "GOOGLE_VERIFY_ID_TOKEN_LOCALLY": "false",
+        "RATE_LIMIT_ENABLED": "false",
+        "CONCURRENCY_LIMIT_ENABLED": "false",
+        "TOKEN_CACHE_SHM_PATH": os.path.join(state_dir, "token_cache"),
+        "RATE_LIMIT_SHM_PATH": os.path.join(state_dir, "ratelimit"),
+        "SESSION_SQLITE_PATH": os.path.join(state_dir, "sessions.db"),
+        "REGISTRY_SQLITE_PATH": os.path.join(state_dir, "registry.db"),
+        "REVOCATION_SNAPSHOT_PATH": os.path.join(state_dir, "revocations.bin"),
+        "DATABASE_URL": f"sqlite+aiosqlite:///{os.path.join(state_dir, 'gateway.db')}",
+    })
+    if workers > 1:
+        env["PROMETHEUS_MULTIPROC_DIR"] = os.path.join(state_dir, "metrics")
+    else:
+        env.pop("PROMETHEUS_MULTIPROC_DIR", None)
+    return env
+
+
+async def wait_ready(url: str, process: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = time.perf_counter() + timeout
+    async with httpx.AsyncClient(timeout=1.0) as client:
+        while time.perf_counter() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError(f"gunicorn이 종료되었습니다 (exit {process.returncode})")
+            try:
+                if (await client.get(f"{url}/health")).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.2)
+    raise TimeoutError(f"Gateway가 {timeout}초 안에 준비되지 않았습니다: {url}")
+
+
+def stop_gateway(process: subprocess.Popen) -> None:
+    """마스터에 TERM을 보내 워커까지 정리"""
+    if process.poll() is None:
+        process.send_signal(signal.SIGTERM)
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+def client_process(scenario: str, gateway_url: str, token: str, users: int, first_user: int,
+                   duration: float, timeout: float) -> Dict[str, Any]:
+    """부하 생성 프로세스 하나: users명의 가상 사용자를 duration초 동안 실행하고 원시 표본 반환"""
+    args = SimpleNamespace(gateway_url=gateway_url, sasb_url=None, timeout=timeout, poll_interval=0.05)
+    stats = ScenarioStats()
+
+    async def run() -> None:
+        deadline = time.perf_counter() + duration
+        await asyncio.gather(*[
+            run_user(scenario, first_user + index, args, deadline, stats, token, None)
+            for index in range(users)
+        ])
+
+    asyncio.run(run())
+    return {"samples": stats.samples, "statuses": stats.statuses, "errors": stats.errors}
+
+
+async def token_verifications(gateway_url: str) -> Dict[str, float]:
+    """Gateway /metrics에서 JWT 검증 결과별 합계 (멀티 워커는 전체 워커 합산값)"""
+    async with httpx.AsyncClient(timeout=5.0) as client:
+        text = (await client.get(f"{gateway_url}/metrics")).text
+    totals: Dict[str, float] = {}
+    for line in text.splitlines():
+        if line.startswith("gateway_token_verifications_total{"):
+            labels, value = line.rsplit(" ", 1)
+            result = labels.split('result="', 1)[1].split('"', 1)[0]
+            totals[result] = totals.get(result, 0.0) + float(value)
+    return totals
+
+
+async def run_workers(workers: int, args, pool: ProcessPoolExecutor) -> Dict[str, Any]:
+    gateway_url = f"http://127.0.0.1:{args.port}"
+    with tempfile.TemporaryDirectory(prefix=f"gateway-bench-{workers}w-") as state_dir:
+        process = subprocess.Popen(
+            [sys.executable, "-m", "gunicorn", "app.main:app", "-c", "gunicorn.conf.py"],
+            cwd=GATEWAY_DIR,
+            env=gateway_env(args, workers, state_dir),
+        )
+        try:
+            await wait_ready(gateway_url, process)
+            async with httpx.AsyncClient(timeout=args.timeout) as client:
+                token = await oauth_flow(client, gateway_url, "bootstrap", ScenarioStats())
+
+            loop = asyncio.get_running_loop()
+            users_per_process = max(1, args.concurrency // args.client_processes)
+            started = time.perf_counter()
+            parts = await asyncio.gather(*[
+                loop.run_in_executor(
+                    pool, client_process, args.scenario, gateway_url, token,
+                    users_per_process, index * users_per_process, args.duration, args.timeout,
+                )
+                for index in range(args.client_processes)
+            ])
+            elapsed = time.perf_counter() - started
+            verifications = await token_verifications(gateway_url)
+        finally:
+            stop_gateway(process)
+
+    samples: Dict[str, List[float]] = {}
+    statuses: Counter = Counter()
+    errors: Counter = Counter()
+    for part in parts:
+        for step, values in part["samples"].items():
+            samples.setdefault(step, []).extend(values)
+        statuses.update(part["statuses"])
+        errors.update(part["errors"])
+
+    summary = {
+        "workers": workers,
+        "steps": {step: summarize(values, elapsed) for step, values in samples.items()},
+        "statuses": dict(statuses),
+        "errors": dict(errors.most_common(10)),
+        "token_verifications": verifications,
+    }
+    step = summary["steps"].get(args.scenario if args.scenario == "verify" else "flow", {})
+    print(f"[{workers} workers] {step.get('throughput_per_s', 0)}/s  p50={step.get('p50_ms', 0):.1f}ms "
+          f"p99={step.get('p99_ms', 0):.1f}ms  errors={sum(errors.values())}  verifications={verifications}")
+    return summary
+
+
+async def main_async(args) -> None:
+    mock = await start_mock_google(args.mock_google_port, args.mock_latency_ms / 1000)
+    try:
+        results: Dict[str, Any] = {}
+        with ProcessPoolExecutor(max_workers=args.client_processes) as pool:
+            for workers in args.workers:
+                results[f"{workers}w"] = await run_workers(workers, args, pool)
+
+        base = results[f"{args.workers[0]}w"]["steps"]
+        step = args.scenario if args.scenario == "verify" else "flow"
+        base_throughput = base.get(step, {}).get("throughput_per_s") or 0
+        for name, summary in results.items():
+            throughput = summary["steps"].get(step, {}).get("throughput_per_s") or 0
+            summary["speedup"] = round(throughput / base_throughput, 3) if base_throughput else None
+            print(f"  {name:<5} speedup x{summary['speedup']}")
+
+        config = {key: value for key, value in vars(args).items() if key != "output"}
+        write_results("workers", results, config, args.output)
+    finally:
+        server, task = mock
+        server.should_exit = True
+        await task
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", default="1,2,4", help="콤마로 구분한 워커 수 목록")
+    parser.add_argument("--scenario", choices=("verify", "oauth"), default="verify")
+    parser.add_argument("--port", type=int, default=8090, help="벤치마크용 Gateway 포트")
+    parser.add_argument("--concurrency", type=int, default=64, help="전체 동시 가상 사용자 수")
+    parser.add_argument("--client-processes", type=int, default=max(1, min(4, (os.cpu_count() or 2) // 2)),
+                        help="부하 생성 프로세스 수 (부하 생성기가 병목이 되지 않도록 분산)")
+    parser.add_argument("--duration", type=float, default=10.0, help="워커 수별 실행 시간 (초)")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--mock-google-port", type=int, default=9900)
+    parser.add_argument("--mock-latency-ms", type=float, default=0.0, help="구글 목 응답 지연 (ms)")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: benchmarks/results/workers-<시각>.json)")
+    args = parser.parse_args()
+    args.workers = [int(value) for value in args.workers.split(",") if value.strip()]
+    args.client_processes = max(1, args.client_processes)
+
+    try:
+        asyncio.run(main_async(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
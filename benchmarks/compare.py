@@ -0,0 +1,58 @@
+"""
+두 벤치마크 결과 파일 비교 (릴리스 간 회귀 확인)
+
+같은 경로의 지연 시간 지표(*_ms)를 비교하여 threshold 이상 느려진 항목을 표시하고,
+회귀가 하나라도 있으면 종료 코드 1을 반환합니다.
+
+사용법:
+    python benchmarks/compare.py benchmarks/results/micro-old.json benchmarks/results/micro-new.json --threshold 0.1
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, Iterator, Tuple
+
+COMPARED_METRICS = ("p50_ms", "p90_ms", "p99_ms", "mean_ms")
+
+
+def iter_metrics(node: Any, path: str = "") -> Iterator[Tuple[str, float]]:
+    """결과 트리에서 (경로, 값) 형태로 비교 대상 지표를 펼침"""
+    if isinstance(node, dict):
+        for key, value in node.items():
+            child = f"{path}.{key}" if path else key
+            if key in COMPARED_METRICS and isinstance(value, (int, float)):
+                yield child, float(value)
+            else:
+                yield from iter_metrics(value, child)
+
+
+def load_metrics(path: str) -> Dict[str, float]:
+    with open(path, "r", encoding="utf-8") as f:
+        return dict(iter_metrics(json.load(f)["results"]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=0.10, help="회귀로 볼 증가율 (기본 10%%)")
+    args = parser.parse_args()
+
+    baseline, candidate = load_metrics(args.baseline), load_metrics(args.candidate)
+    regressions = 0
+    for path in sorted(baseline.keys() & candidate.keys()):
+        before, after = baseline[path], candidate[path]
+        change = (after - before) / before if before else 0.0
+        marker = ""
+        if change > args.threshold:
+            marker = "  <-- 회귀"
+            regressions += 1
+        print(f"{path:<60} {before:>12.4f} → {after:>12.4f} ms  {change:+7.1%}{marker}")
+
+    print(f"\n비교 지표 {len(baseline.keys() & candidate.keys())}개, 회귀 {regressions}개 (기준 +{args.threshold:.0%})")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
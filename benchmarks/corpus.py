@@ -0,0 +1,112 @@
+"""
+합성 한국어 뉴스 코퍼스 생성기
+
+GRI 키워드 사전의 키워드를 섞은 뉴스 문장을 재현 가능한 난수(seed)로 만들어
+gri-service 입력 형식(article_text 컬럼)의 CSV/Parquet 파일로 저장합니다.
+
+사용법:
+    python benchmarks/corpus.py --size medium --output /tmp/bench/news.csv
+    python benchmarks/corpus.py --articles 50000 --output /tmp/bench/news.parquet --write-dict /tmp/bench/gri_keyword_dict.json
+"""
+
+import argparse
+import json
+import os
+import random
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+# 미리 정해둔 코퍼스 크기 (기사 수)
+CORPUS_SIZES = {"small": 1_000, "medium": 10_000, "large": 100_000}
+
+# 기본 합성 GRI 키워드 사전 (data/gri_keyword_dict.json이 없는 환경에서도 동작하도록)
+SYNTHETIC_GRI_DICT: Dict[str, List[str]] = {
+    "GRI 305: Emissions": ["온실가스", "탄소", "배출", "탄소중립", "메탄"],
+    "GRI 403: Safety": ["안전", "사고", "산업재해", "중대재해", "부상"],
+    "GRI 414: Supplier": ["공급망", "협력사", "하도급", "납품"],
+    "GRI 205: Corruption": ["부패", "뇌물", "횡령", "비리"],
+    "GRI 302: Energy": ["에너지", "전력", "재생에너지", "효율"],
+    "GRI 303: Water": ["용수", "폐수", "수질", "취수"],
+    "GRI 404: Training": ["교육", "훈련", "역량", "연수"],
+    "GRI 405: Diversity": ["다양성", "여성", "임원", "차별"],
+}
+
+COMPANIES = ["한빛전자", "대한중공업", "미래화학", "서울에너지", "동해제철", "새봄식품", "청솔건설", "누리통신"]
+FILLER_NOUNS = ["시장", "투자자", "정부", "발표", "계획", "실적", "분기", "지역", "규제", "전망", "기술", "사업", "관계자", "보고서"]
+TEMPLATES = [
+    "{company}는 {keyword} 관련 {filler} 방안을 {filler2}에서 공개했다.",
+    "{company} 관계자는 올해 {keyword} 목표를 {filler}와 함께 점검하겠다고 밝혔다.",
+    "{filler} 당국은 {company}의 {keyword} 문제에 대해 {filler2} 조사에 착수했다.",
+    "업계에서는 {company}의 {keyword} 대응이 {filler} 평가에 영향을 줄 것으로 보고 있다.",
+    "{company}는 {filler}을 통해 {keyword} 성과를 {filler2} 보고서에 담았다.",
+    "전문가들은 {keyword} 이슈가 {filler} 전반으로 확대될 수 있다고 {filler2} 회의에서 지적했다.",
+]
+
+
+class Article(NamedTuple):
+    text: str
+    # 문장에 넣은 명사 집합 (형태소 분석기 없이 매칭 단계만 측정할 때 사용)
+    nouns: frozenset
+
+
+def generate_articles(count: int, seed: int = 42, gri_dict: Optional[Dict[str, Sequence[str]]] = None,
+                      sentences: Sequence[int] = (4, 12), keyword_ratio: float = 0.6) -> Iterator[Article]:
+    """
+    재현 가능한 합성 기사 생성
+
+    keyword_ratio는 문장에 GRI 키워드(나머지는 일반 명사)를 넣을 확률입니다.
+    기사마다 일련번호가 들어가므로 모든 본문이 서로 다릅니다 (중복 제거 캐시를 우회).
+    """
+    rng = random.Random(seed)
+    keywords = sorted({keyword for words in (gri_dict or SYNTHETIC_GRI_DICT).values() for keyword in words})
+    for index in range(count):
+        nouns = set()
+        lines = [f"[기사 {seed}-{index}]"]
+        for _ in range(rng.randint(*sentences)):
+            company = rng.choice(COMPANIES)
+            keyword = rng.choice(keywords) if rng.random() < keyword_ratio else rng.choice(FILLER_NOUNS)
+            filler, filler2 = rng.sample(FILLER_NOUNS, 2)
+            lines.append(rng.choice(TEMPLATES).format(company=company, keyword=keyword, filler=filler, filler2=filler2))
+            nouns.update((company, keyword, filler, filler2))
+        yield Article(" ".join(lines), frozenset(nouns))
+
+
+def write_corpus(path: str, count: int, seed: int = 42, gri_dict: Optional[Dict[str, Sequence[str]]] = None,
+                 column: str = "article_text") -> None:
+    """확장자에 따라 CSV 또는 Parquet(pyarrow 필요)으로 저장"""
+    import pandas as pd
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    df = pd.DataFrame({column: [article.text for article in generate_articles(count, seed, gri_dict)]})
+    if path.endswith(".parquet"):
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", choices=sorted(CORPUS_SIZES), default="small")
+    parser.add_argument("--articles", type=int, help="기사 수 (지정하면 --size 무시)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--dict", dest="dict_path", help="키워드를 가져올 GRI 사전 JSON (기본: 내장 합성 사전)")
+    parser.add_argument("--write-dict", help="사용한 GRI 사전을 이 경로에 저장")
+    parser.add_argument("--column", default="article_text")
+    parser.add_argument("--output", required=True, help=".csv 또는 .parquet")
+    args = parser.parse_args()
+
+    gri_dict = SYNTHETIC_GRI_DICT
+    if args.dict_path:
+        with open(args.dict_path, "r", encoding="utf-8") as f:
+            gri_dict = json.load(f)
+    count = args.articles or CORPUS_SIZES[args.size]
+
+    write_corpus(args.output, count, args.seed, gri_dict, args.column)
+    print(f"기사 {count}건 저장: {args.output}")
+    if args.write_dict:
+        with open(args.write_dict, "w", encoding="utf-8") as f:
+            json.dump(gri_dict, f, ensure_ascii=False, indent=2)
+        print(f"GRI 사전 저장: {args.write_dict}")
+
+
+if __name__ == "__main__":
+    main()
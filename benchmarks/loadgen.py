@@ -0,0 +1,256 @@
+"""
+비동기 부하 생성기: Gateway 인증 경로와 SASB 분석 경로
+
+시나리오:
+    verify  - GET  /auth/verify (session_token 쿠키)
+    oauth   - GET  /auth/google/login → GET /auth/google/callback (로컬 구글 목 서버 사용)
+    sasb    - POST /analyze → GET /analysis/{id} 폴링 (완료까지의 전체 시간)
+
+OAuth 시나리오는 이 스크립트가 띄우는 구글 목 서버를 Gateway가 바라보도록 실행해야 합니다:
+    GOOGLE_AUTH_URL=http://127.0.0.1:9900/auth \\
+    GOOGLE_TOKEN_URL=http://127.0.0.1:9900/token \\
+    GOOGLE_USERINFO_URL=http://127.0.0.1:9900/userinfo \\
+    GOOGLE_VERIFY_ID_TOKEN_LOCALLY=false \
+    RATE_LIMIT_ENABLED=false  uvicorn app.main:app --port 8080
+
+(부하 생성기는 한 IP에서 요청하므로 요청 제한을 측정하려는 경우가 아니면 RATE_LIMIT_ENABLED=false로 실행)
+
+사용법:
+    python benchmarks/loadgen.py --scenario verify --scenario oauth --concurrency 50 --duration 30
+    python benchmarks/loadgen.py --scenario sasb --sasb-url http://localhost:8002 --concurrency 20
+    python benchmarks/loadgen.py --mock-google-only   # 목 서버만 실행
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import generate_articles  # noqa: E402
+from results import summarize, write_results  # noqa: E402
+
+SCENARIOS = ("verify", "oauth", "sasb")
+
+
+def create_mock_google_app(latency: float = 0.0):
+    """구글 토큰 교환 / 사용자 정보 엔드포인트 목 (latency초 만큼 지연 후 응답)"""
+    from starlette.applications import Starlette
+    from starlette.requests import Request
+    from starlette.responses import JSONResponse
+    from starlette.routing import Route
+
+    async def token(request: Request) -> JSONResponse:
+        form = await request.form()
+        if latency:
+            await asyncio.sleep(latency)
+        return JSONResponse({
+            "access_token": f"mock-{form.get('code', 'anonymous')}",
+            "token_type": "Bearer",
+            "expires_in": 3599,
+            "scope": "openid email profile",
+        })
+
+    async def userinfo(request: Request) -> JSONResponse:
+        user = request.headers.get("authorization", "").removeprefix("Bearer mock-") or "anonymous"
+        if latency:
+            await asyncio.sleep(latency)
+        return JSONResponse({
+            "id": f"g-{user}",
+            "email": f"{user}@bench.local",
+            "verified_email": True,
+            "name": f"bench {user}",
+            "given_name": "bench",
+            "family_name": user,
+            "picture": "",
+            "locale": "ko",
+        })
+
+    return Starlette(routes=[
+        Route("/token", token, methods=["POST"]),
+        Route("/userinfo", userinfo, methods=["GET"]),
+    ])
+
+
+async def start_mock_google(port: int, latency: float):
+    """목 서버를 현재 이벤트 루프에서 시작하고 (server, task) 반환"""
+    import uvicorn
+
+    config = uvicorn.Config(create_mock_google_app(latency), host="127.0.0.1", port=port, log_level="warning")
+    server = uvicorn.Server(config)
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        if task.done():
+            task.result()
+        await asyncio.sleep(0.05)
+    print(f"구글 목 서버: http://127.0.0.1:{port}")
+    return server, task
+
+
+class ScenarioStats:
+    """시나리오별 지연 시간 표본, 상태 코드, 오류 집계"""
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = {}
+        self.statuses: Counter = Counter()
+        self.errors: Counter = Counter()
+
+    def observe(self, step: str, seconds: float) -> None:
+        self.samples.setdefault(step, []).append(seconds)
+
+    def summary(self, elapsed: float) -> Dict[str, Any]:
+        return {
+            "steps": {step: summarize(samples, elapsed) for step, samples in self.samples.items()},
+            "statuses": dict(self.statuses),
+            "errors": dict(self.errors.most_common(10)),
+        }
+
+
+async def oauth_flow(client: httpx.AsyncClient, gateway_url: str, code: str, stats: ScenarioStats) -> Optional[str]:
+    """로그인 URL 발급(state 세션 저장) → 콜백 처리, 발급된 JWT 반환"""
+    started = time.perf_counter()
+    login = await client.get(f"{gateway_url}/auth/google/login")
+    stats.statuses[f"login:{login.status_code}"] += 1
+    login.raise_for_status()
+    state = parse_qs(urlparse(login.json()["auth_url"]).query)["state"][0]
+
+    callback_started = time.perf_counter()
+    callback = await client.get(f"{gateway_url}/auth/google/callback", params={"code": code, "state": state})
+    finished = time.perf_counter()
+    stats.statuses[f"callback:{callback.status_code}"] += 1
+    body = callback.json()
+    if not body.get("success"):
+        raise RuntimeError(f"callback 실패: {body.get('message')}")
+    stats.observe("callback", finished - callback_started)
+    stats.observe("flow", finished - started)
+    return body["token"]["access_token"]
+
+
+async def run_user(scenario: str, user_index: int, args, deadline: float, stats: ScenarioStats,
+                   token: Optional[str], texts) -> None:
+    """가상 사용자 한 명: 마감 시각까지 시나리오를 반복 (사용자마다 별도 쿠키 저장소)"""
+    async with httpx.AsyncClient(timeout=args.timeout) as client:
+        iteration = 0
+        while time.perf_counter() < deadline:
+            iteration += 1
+            try:
+                if scenario == "verify":
+                    started = time.perf_counter()
+                    response = await client.get(f"{args.gateway_url}/auth/verify", cookies={"session_token": token})
+                    stats.observe("verify", time.perf_counter() - started)
+                    stats.statuses[str(response.status_code)] += 1
+                elif scenario == "oauth":
+                    await oauth_flow(client, args.gateway_url, f"u{user_index}-{iteration}", stats)
+                else:
+                    await sasb_flow(client, args.sasb_url, next(texts), args.poll_interval, stats)
+            except Exception as e:
+                stats.errors[type(e).__name__ + (f": {e}" if str(e) else "")] += 1
+
+
+async def sasb_flow(client: httpx.AsyncClient, sasb_url: str, text: str, poll_interval: float,
+                    stats: ScenarioStats) -> None:
+    started = time.perf_counter()
+    submit = await client.post(f"{sasb_url}/analyze", json={"text_data": text})
+    stats.statuses[f"analyze:{submit.status_code}"] += 1
+    stats.observe("submit", time.perf_counter() - started)
+    submit.raise_for_status()
+    analysis_id = submit.json()["analysis_id"]
+
+    while True:
+        result = await client.get(f"{sasb_url}/analysis/{analysis_id}")
+        if result.status_code != 202:
+            break
+        await asyncio.sleep(poll_interval)
+    stats.statuses[f"result:{result.status_code}"] += 1
+    result.raise_for_status()
+    stats.observe("end_to_end", time.perf_counter() - started)
+
+
+def unique_texts(seed: int):
+    """SASB 중복 제거 캐시에 걸리지 않도록 매번 다른 본문 생성 (이전 실행의 저장된 결과와도 겹치지 않게 실행 ID 부여)"""
+    run_id = f"{int(time.time())}-{os.getpid()}"
+    batch = 0
+    while True:
+        for article in generate_articles(1000, seed + batch):
+            yield f"{article.text} [실행 {run_id}]"
+        batch += 1
+
+
+async def run_scenario(scenario: str, args) -> Dict[str, Any]:
+    stats = ScenarioStats()
+    token = args.token
+    if scenario == "verify" and token is None:
+        # 검증할 토큰은 OAuth 흐름 한 번으로 발급
+        async with httpx.AsyncClient(timeout=args.timeout) as client:
+            token = await oauth_flow(client, args.gateway_url, "bootstrap", ScenarioStats())
+
+    texts = unique_texts(args.seed)
+    started = time.perf_counter()
+    deadline = started + args.duration
+    await asyncio.gather(*[
+        run_user(scenario, index, args, deadline, stats, token, texts)
+        for index in range(args.concurrency)
+    ])
+    elapsed = time.perf_counter() - started
+    summary = stats.summary(elapsed)
+    print(f"[{scenario}] {elapsed:.1f}s, statuses={summary['statuses']}, errors={sum(stats.errors.values())}")
+    for step, step_summary in summary["steps"].items():
+        print(f"  {step:<10} n={step_summary['count']:<7} p50={step_summary.get('p50_ms', 0):.1f}ms "
+              f"p99={step_summary.get('p99_ms', 0):.1f}ms  {step_summary.get('throughput_per_s', 0)}/s")
+    return summary
+
+
+async def main_async(args) -> None:
+    mock = None
+    if args.mock_google_only or "oauth" in args.scenarios or ("verify" in args.scenarios and args.token is None):
+        mock = await start_mock_google(args.mock_google_port, args.mock_latency_ms / 1000)
+    try:
+        if args.mock_google_only:
+            await mock[1]
+            return
+
+        results = {}
+        for scenario in args.scenarios:
+            results[scenario] = await run_scenario(scenario, args)
+        config = {key: value for key, value in vars(args).items() if key not in ("output", "token")}
+        write_results("load", results, config, args.output)
+    finally:
+        if mock is not None:
+            server, task = mock
+            server.should_exit = True
+            await task
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", dest="scenarios", choices=SCENARIOS, action="append", help="반복 지정 가능 (기본: 전체)")
+    parser.add_argument("--gateway-url", default=os.getenv("BENCH_GATEWAY_URL", "http://localhost:8080"))
+    parser.add_argument("--sasb-url", default=os.getenv("BENCH_SASB_URL", "http://localhost:8002"))
+    parser.add_argument("--concurrency", type=int, default=20, help="동시 가상 사용자 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="시나리오별 실행 시간 (초)")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--poll-interval", type=float, default=0.05, help="SASB 결과 폴링 간격 (초)")
+    parser.add_argument("--token", help="verify 시나리오에 사용할 JWT (없으면 OAuth 흐름으로 발급)")
+    parser.add_argument("--mock-google-port", type=int, default=9900)
+    parser.add_argument("--mock-latency-ms", type=float, default=0.0, help="구글 목 응답 지연 (ms)")
+    parser.add_argument("--mock-google-only", action="store_true", help="목 서버만 실행")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: benchmarks/results/load-<시각>.json)")
+    args = parser.parse_args()
+    args.scenarios = args.scenarios or list(SCENARIOS)
+
+    try:
+        asyncio.run(main_async(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+벤치마크 결과 공통 유틸리티: 지연 시간 요약, 실행 환경 기록, JSON 결과 파일 저장
+
+결과 파일 형식:
+    {"suite": ..., "created_at": ..., "environment": {...}, "config": {...}, "results": {name: {...}}}
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Sequence
+
+RESULTS_DIR = os.getenv("BENCH_RESULTS_DIR", os.path.join(os.path.dirname(__file__), "results"))
+
+
+def percentile(sorted_samples: Sequence[float], q: float) -> float:
+    """정렬된 표본의 q 분위수 (선형 보간)"""
+    if not sorted_samples:
+        return 0.0
+    position = (len(sorted_samples) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_samples) - 1)
+    return sorted_samples[lower] + (sorted_samples[upper] - sorted_samples[lower]) * (position - lower)
+
+
+def summarize(samples: Sequence[float], elapsed: Optional[float] = None) -> Dict[str, Any]:
+    """초 단위 표본을 ms 단위 요약 통계로 변환 (elapsed가 있으면 처리량 포함)"""
+    ordered = sorted(samples)
+    summary: Dict[str, Any] = {"count": len(ordered)}
+    if ordered:
+        summary.update({
+            "mean_ms": round(statistics.fmean(ordered) * 1000, 4),
+            "min_ms": round(ordered[0] * 1000, 4),
+            "p50_ms": round(percentile(ordered, 0.50) * 1000, 4),
+            "p90_ms": round(percentile(ordered, 0.90) * 1000, 4),
+            "p99_ms": round(percentile(ordered, 0.99) * 1000, 4),
+            "max_ms": round(ordered[-1] * 1000, 4),
+        })
+    if elapsed:
+        summary["elapsed_s"] = round(elapsed, 3)
+        summary["throughput_per_s"] = round(len(ordered) / elapsed, 2)
+    return summary
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, timeout=5, check=True,
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def environment() -> Dict[str, Any]:
+    """결과 비교 시 함께 확인할 실행 환경 정보"""
+    return {
+        "git_revision": _git_revision(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def write_results(suite: str, results: Dict[str, Any], config: Dict[str, Any],
+                  output: Optional[str] = None) -> str:
+    """결과를 JSON 파일로 저장하고 경로 반환 (output이 없으면 results/<suite>-<시각>.json)"""
+    created_at = datetime.now(timezone.utc)
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"{suite}-{created_at:%Y%m%d-%H%M%S}.json")
+    else:
+        os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+
+    document = {
+        "suite": suite,
+        "created_at": created_at.isoformat(),
+        "environment": environment(),
+        "config": config,
+        "results": results,
+    }
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(document, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {output}")
+    return output
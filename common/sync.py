@@ -0,0 +1,65 @@
+"""
+공유 모듈을 각 서비스 app 디렉터리로 복사 (서비스별 Docker 빌드 컨텍스트에 common/이 포함되지 않으므로 복사본을 커밋)
+
+사용법:
+    python common/sync.py          # 복사본 갱신
+    python common/sync.py --check  # 복사본이 원본과 다르면 실패 (make test에서 실행)
+"""
+
+import argparse
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 원본 (common/ 기준) → 복사 위치 (저장소 루트 기준)
+VENDORED = {
+    "metrics_base.py": (
+        "gateway/app/metrics_base.py",
+        "service/sasb-service/app/metrics_base.py",
+        "service/gri-service/app/metrics_base.py",
+    ),
+}
+
+
+def render(source: str, target: str) -> str:
+    """원본의 첫 줄(경로 주석)을 복사 위치와 자동 생성 안내로 바꾼 내용"""
+    with open(os.path.join(ROOT, "common", source), encoding="utf-8") as f:
+        lines = f.read().splitlines(keepends=True)
+    header = f"# {target}\n# 자동 생성 파일: common/{source}를 수정한 뒤 make sync-common으로 다시 만드세요.\n"
+    return header + "".join(lines[1:])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true", help="복사본이 최신인지만 확인")
+    args = parser.parse_args()
+
+    stale = []
+    for source, targets in VENDORED.items():
+        for target in targets:
+            content = render(source, target)
+            path = os.path.join(ROOT, target)
+            try:
+                with open(path, encoding="utf-8") as f:
+                    current = f.read()
+            except FileNotFoundError:
+                current = None
+            if current == content:
+                continue
+            stale.append(target)
+            if not args.check:
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(content)
+                print(f"updated {target}")
+
+    if args.check and stale:
+        print("공유 모듈 복사본이 원본과 다릅니다 (make sync-common 실행 필요):", file=sys.stderr)
+        for target in stale:
+            print(f"  {target}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,6 +7,7 @@ from fastapi.responses import RedirectResponse
 import logging
 
 from ..service.auth_service import AuthService
+from ..service.origin_policy import OriginPolicy
 from ..model.auth_schema import LoginResponse, CallbackResponse, OAuthLoginRequest, OAuthCallbackRequest
 
 logger = logging.getLogger(__name__)
@@ -16,25 +17,15 @@ class AuthController:
         self.auth_service = AuthService()
         self.gateway_url = os.getenv("GATEWAY_URL", "http://localhost:8080")
         # frontend_url을 여기서 고정하지 않고, 각 요청마다 동적으로 결정합니다.
+        # 허용 Origin 정책은 한 번만 파싱하여 CORS 미들웨어와 공유합니다.
+        self.origin_policy = OriginPolicy.from_env()
 
     def get_frontend_url(self, request: Request) -> str:
         """
         요청 헤더의 Origin을 기반으로 동적으로 프론트엔드 URL을 결정합니다.
-        CORS 설정에서 허용된 Origin만 신뢰하여 보안을 유지합니다.
+        CORS 미들웨어와 같은 OriginPolicy로 허용된 Origin만 신뢰하고, 그 외에는 기본 URL을 사용합니다.
         """
-        origin = request.headers.get("origin")
-        allowed_origins_str = os.getenv("FRONTEND_URLS", "http://localhost:3000")
-        allowed_origins = [url.strip() for url in allowed_origins_str.split(',')]
-
-        # 요청의 Origin이 허용된 목록에 있으면 해당 Origin을 사용합니다.
-        if origin and origin in allowed_origins:
-            logger.debug(f"Dynamic frontend URL detected from origin: {origin}")
-            return origin
-        
-        # Origin 헤더가 없거나 허용되지 않은 경우, 목록의 첫 번째 URL을 안전한 기본값으로 사용합니다.
-        default_url = allowed_origins[0]
-        logger.warning(f"Origin '{origin}' not in allowed list or not present. Falling back to default: {default_url}")
-        return default_url
+        return self.origin_policy.frontend_url(request.headers.get("origin"))
 
     async def google_login(self, request: Request, login_request: Optional[OAuthLoginRequest] = None) -> LoginResponse:
         """구글 OAuth 로그인 시작"""
@@ -0,0 +1,115 @@
+# gateway/app/domain/controller/gateway_controller.py
+
+from typing import Dict, Any, Optional
+from fastapi import HTTPException, Request
+from fastapi.responses import StreamingResponse
+import logging
+
+from ..service.auth_service import AuthService
+from ..service.gateway_service import ProxyService, RegistryService
+from ..model.gateway_schema import (
+    RouteInfo, RouteTableResponse, ServiceRegisterRequest, ServiceHeartbeatRequest,
+    ServiceInstanceInfo, RegistryResponse
+)
+
+logger = logging.getLogger(__name__)
+
+
+class GatewayController:
+    def __init__(self, auth_service: AuthService, proxy_service: Optional[ProxyService] = None):
+        # 토큰 캐시를 공유하기 위해 인증 컨트롤러의 AuthService를 그대로 사용
+        self.auth_service = auth_service
+        self.proxy_service = proxy_service or ProxyService()
+        self.registry_service = RegistryService(self.proxy_service.route_repository)
+
+    @staticmethod
+    def extract_token(request: Request) -> Optional[str]:
+        """httpOnly 쿠키 또는 Authorization 헤더에서 JWT 추출"""
+        token = request.cookies.get("session_token")
+        if token:
+            return token
+        authorization = request.headers.get("authorization", "")
+        if authorization.lower().startswith("bearer "):
+            return authorization[7:].strip()
+        return None
+
+    async def resolve_identity(self, request: Request, auth_required: bool) -> Optional[Dict[str, Any]]:
+        """요청자의 검증된 JWT 페이로드 반환"""
+        token = self.extract_token(request)
+        if not token:
+            if auth_required:
+                raise HTTPException(status_code=401, detail="No token provided")
+            return None
+
+        try:
+            return await self.auth_service.verify_jwt_token(token)
+        except HTTPException:
+            if auth_required:
+                raise HTTPException(status_code=401, detail="Invalid or expired token")
+            return None
+
+    async def proxy(self, request: Request) -> StreamingResponse:
+        """라우팅 테이블에 따라 다운스트림 서비스로 요청 전달"""
+        route = self.proxy_service.resolve_route(request.url.path)
+        identity = await self.resolve_identity(request, route.auth_required)
+        return await self.proxy_service.forward(request, route, identity)
+
+    def get_routes(self) -> RouteTableResponse:
+        """현재 라우팅 테이블 조회 (인증 없이 공개되므로 업스트림 내부 주소는 포함하지 않음)"""
+        routes = [
+            RouteInfo(
+                prefix=route.prefix,
+                service=route.pool.name,
+                instances=len(route.pool.instances),
+                healthy_instances=sum(1 for instance in route.pool.instances if instance.healthy),
+                strip_prefix=route.strip_prefix,
+                auth_required=route.auth_required,
+            )
+            for route in self.proxy_service.route_repository.routes
+        ]
+        return RouteTableResponse(routes=routes, total_count=len(routes))
+
+    def register_instance(self, register_request: ServiceRegisterRequest, registry_token: Optional[str]) -> ServiceInstanceInfo:
+        """서비스 인스턴스 자가 등록"""
+        self.registry_service.authorize(registry_token)
+        self.registry_service.validate_url(register_request.url)
+        instance = self.proxy_service.route_repository.register(
+            register_request.service,
+            register_request.url,
+            register_request.instance_id,
+            register_request.metadata,
+        )
+        return self._instance_info(instance)
+
+    def heartbeat(self, heartbeat_request: ServiceHeartbeatRequest, registry_token: Optional[str]) -> Dict[str, Any]:
+        """인스턴스 하트비트 갱신 (미등록 인스턴스는 404로 재등록 유도)"""
+        self.registry_service.authorize(registry_token)
+        if not self.proxy_service.route_repository.heartbeat(heartbeat_request.service, heartbeat_request.instance_id):
+            raise HTTPException(status_code=404, detail="Instance not registered")
+        return {"success": True}
+
+    def deregister_instance(self, service: str, instance_id: str, registry_token: Optional[str]) -> Dict[str, Any]:
+        """인스턴스 등록 해제"""
+        self.registry_service.authorize(registry_token)
+        removed = self.proxy_service.route_repository.deregister(service, instance_id)
+        return {"success": removed}
+
+    def get_registry(self, registry_token: Optional[str]) -> RegistryResponse:
+        """등록된 서비스 인스턴스 및 상태 조회 (내부 주소가 노출되므로 레지스트리 토큰 필요)"""
+        self.registry_service.authorize(registry_token)
+        return RegistryResponse(services={
+            name: [self._instance_info(instance) for instance in pool.instances]
+            for name, pool in self.proxy_service.route_repository.pools.items()
+        })
+
+    @staticmethod
+    def _instance_info(instance) -> ServiceInstanceInfo:
+        return ServiceInstanceInfo(
+            instance_id=instance.instance_id,
+            url=instance.url,
+            healthy=instance.healthy,
+            static=instance.static,
+            outstanding=instance.outstanding,
+            consecutive_failures=instance.consecutive_failures,
+            last_heartbeat=instance.last_heartbeat,
+        )
@@ -0,0 +1,105 @@
+# gateway/app/domain/model/gateway_entity.py
+
+import time
+import random
+from dataclasses import dataclass, field
+from typing import List, Optional, Dict, Any
+
+LEAST_OUTSTANDING = "least_outstanding"
+POWER_OF_TWO = "p2c"
+
+
+@dataclass
+class UpstreamInstance:
+    """프록시 대상이 되는 다운스트림 서비스 인스턴스"""
+    url: str
+    instance_id: str = ""
+    static: bool = True
+    healthy: bool = True
+    outstanding: int = 0
+    consecutive_failures: int = 0
+    last_heartbeat: float = field(default_factory=time.time)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self):
+        self.url = self.url.rstrip("/")
+        if not self.instance_id:
+            self.instance_id = self.url
+
+    def mark_success(self) -> None:
+        self.consecutive_failures = 0
+        self.healthy = True
+
+    def mark_failure(self, threshold: int) -> None:
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= threshold:
+            self.healthy = False
+
+
+@dataclass
+class UpstreamPool:
+    """동일 서비스의 인스턴스 묶음"""
+    name: str
+    instances: List[UpstreamInstance] = field(default_factory=list)
+    strategy: str = LEAST_OUTSTANDING
+
+    def get(self, instance_id: str) -> Optional[UpstreamInstance]:
+        for instance in self.instances:
+            if instance.instance_id == instance_id:
+                return instance
+        return None
+
+    def add(self, instance: UpstreamInstance) -> UpstreamInstance:
+        existing = self.get(instance.instance_id)
+        if existing is not None:
+            existing.url = instance.url
+            existing.metadata = instance.metadata
+            existing.last_heartbeat = time.time()
+            return existing
+        self.instances.append(instance)
+        return instance
+
+    def remove(self, instance_id: str) -> bool:
+        instance = self.get(instance_id)
+        if instance is None:
+            return False
+        self.instances.remove(instance)
+        return True
+
+    def pick(self) -> Optional[UpstreamInstance]:
+        """정상 인스턴스 중 처리 중인 요청이 가장 적은 인스턴스 선택"""
+        candidates = [instance for instance in self.instances if instance.healthy]
+        if not candidates:
+            return None
+        if len(candidates) == 1:
+            return candidates[0]
+
+        if self.strategy == POWER_OF_TWO:
+            # 무작위 두 후보 중 부하가 적은 쪽 선택 (O(1), 쏠림 방지)
+            first, second = random.sample(candidates, 2)
+            return first if first.outstanding <= second.outstanding else second
+
+        lowest = min(instance.outstanding for instance in candidates)
+        return random.choice([instance for instance in candidates if instance.outstanding == lowest])
+
+
+@dataclass
+class Route:
+    """경로 접두사 → 업스트림 풀 매핑"""
+    prefix: str
+    pool: UpstreamPool
+    strip_prefix: bool = True
+    auth_required: bool = True
+    # 클라이언트의 Cookie/Authorization 헤더를 업스트림에 그대로 전달할지 여부 (기본: 전달하지 않음)
+    forward_credentials: bool = False
+
+    def __post_init__(self):
+        self.prefix = "/" + self.prefix.strip("/")
+
+    def matches(self, path: str) -> bool:
+        return path == self.prefix or path.startswith(self.prefix + "/")
+
+    def upstream_path(self, path: str) -> str:
+        if not self.strip_prefix:
+            return path
+        return path[len(self.prefix):] or "/"
@@ -0,0 +1,44 @@
+# gateway/app/domain/model/gateway_schema.py
+
+from pydantic import BaseModel, Field
+from typing import List, Dict, Any
+
+
+class RouteInfo(BaseModel):
+    prefix: str = Field(..., description="요청 경로 접두사")
+    service: str = Field(..., description="업스트림 서비스 이름")
+    instances: int = Field(0, description="업스트림 인스턴스 수 (내부 주소는 레지스트리 토큰이 필요한 GET /registry에서 조회)")
+    healthy_instances: int = Field(0, description="헬스 체크를 통과한 인스턴스 수")
+    strip_prefix: bool = True
+    auth_required: bool = True
+
+
+class RouteTableResponse(BaseModel):
+    routes: List[RouteInfo]
+    total_count: int
+
+
+class ServiceRegisterRequest(BaseModel):
+    service: str = Field(..., description="서비스 이름 (예: sasb)")
+    url: str = Field(..., description="게이트웨이가 접근할 인스턴스 기본 URL")
+    instance_id: str = Field(..., description="인스턴스 고유 ID")
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
+
+class ServiceHeartbeatRequest(BaseModel):
+    service: str
+    instance_id: str
+
+
+class ServiceInstanceInfo(BaseModel):
+    instance_id: str
+    url: str
+    healthy: bool
+    static: bool
+    outstanding: int
+    consecutive_failures: int
+    last_heartbeat: float
+
+
+class RegistryResponse(BaseModel):
+    services: Dict[str, List[ServiceInstanceInfo]]
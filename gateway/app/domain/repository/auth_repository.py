@@ -0,0 +1,361 @@
+# gateway/app/domain/repository/auth_repository.py
+
+import os
+import time
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from ..model.auth_entity import Base, User, OAuthSession
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DATABASE_URL = "sqlite+aiosqlite:///./gateway.db"
+
+
+def async_database_url(url: str) -> str:
+    """동기 드라이버 URL을 비동기 드라이버 URL로 변환 (postgres:// → postgresql+asyncpg://)"""
+    for prefix in ("postgres://", "postgresql://", "postgresql+psycopg2://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    if url.startswith("sqlite:///"):
+        return "sqlite+aiosqlite:///" + url[len("sqlite:///"):]
+    return url
+
+
+def create_engine_from_env() -> AsyncEngine:
+    """DATABASE_URL 기반 비동기 커넥션 풀 엔진 생성"""
+    url = async_database_url(os.getenv("DATABASE_URL", DEFAULT_DATABASE_URL))
+    options: Dict[str, Any] = {"pool_pre_ping": True}
+    if not url.startswith("sqlite"):
+        options.update(
+            pool_size=int(os.getenv("DATABASE_POOL_SIZE", "5")),
+            max_overflow=int(os.getenv("DATABASE_MAX_OVERFLOW", "10")),
+            pool_recycle=int(os.getenv("DATABASE_POOL_RECYCLE", "1800")),
+        )
+    return create_async_engine(url, **options)
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """재시도하면 성공할 수 있는 오류인지 (연결 끊김, 타임아웃, 잠금, 테이블 미생성 등)"""
+    if isinstance(error, (OperationalError, InterfaceError)):
+        return True
+    if isinstance(error, DBAPIError):
+        return bool(error.connection_invalidated)
+    return isinstance(error, (OSError, ConnectionError, asyncio.TimeoutError))
+
+
+@dataclass
+class LoginRecord:
+    """쓰기 버퍼에 쌓이는 로그인 1건 (사용자 upsert + OAuth 세션 insert)"""
+    google_id: str
+    email: str
+    name: str
+    picture: Optional[str]
+    access_token: str
+    refresh_token: Optional[str] = None
+    token_type: str = "Bearer"
+    expires_in: Optional[int] = None
+    scope: Optional[str] = None
+    attempts: int = 0
+
+
+class AuthRepository:
+    """
+    User / OAuthSession 영속화 저장소 (비동기 커넥션 풀 + write-behind 배치)
+
+    로그인 기록은 메모리 버퍼에 넣고 즉시 반환하므로 OAuth 콜백 응답 경로에 DB 왕복이 없습니다.
+    백그라운드 작업이 flush_interval_ms마다 또는 버퍼가 flush_max_rows에 도달하면
+    사용자를 google_id 기준으로 upsert하고 세션을 한 트랜잭션으로 일괄 insert합니다.
+
+    - 일시적 오류(연결 끊김, 잠금 등)는 배치를 버퍼 앞에 되돌려 지수 백오프로 최대 max_retries번 재시도합니다.
+    - 그 외 오류(제약 조건 위반 등)는 한 건씩 별도 트랜잭션으로 다시 기록하여 문제 있는 기록만 버립니다.
+    - 같은 이메일을 다른 google_id가 이미 쓰고 있으면 해당 기록만 충돌로 건너뜁니다
+      (google_id가 없는 기존 사용자는 그 google_id로 연결).
+    - 테이블 생성이 시작 시 실패했으면 성공할 때까지 flush마다 다시 시도합니다.
+    """
+
+    def __init__(
+        self,
+        engine: Optional[AsyncEngine] = None,
+        flush_interval_ms: int = 200,
+        flush_max_rows: int = 500,
+        buffer_max_rows: int = 10000,
+        create_tables: bool = True,
+        max_retries: int = 5,
+        retry_backoff_ms: int = 500,
+        retry_backoff_max_ms: int = 30000,
+    ):
+        self.engine = engine
+        self.flush_interval = max(1, flush_interval_ms) / 1000
+        self.flush_max_rows = max(1, flush_max_rows)
+        self.buffer_max_rows = max(self.flush_max_rows, buffer_max_rows)
+        self.create_tables = create_tables
+        self.max_retries = max(0, max_retries)
+        self.retry_backoff = max(1, retry_backoff_ms) / 1000
+        self.retry_backoff_max = max(retry_backoff_ms, retry_backoff_max_ms) / 1000
+
+        self._tables_ready = not create_tables
+        self._consecutive_failures = 0
+        self._retry_at = 0.0
+        self._buffer: List[LoginRecord] = []
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+
+        self.flushed_rows = 0
+        self.flushed_batches = 0
+        self.dropped_rows = 0
+        self.retried_rows = 0
+        self.conflict_rows = 0
+
+    @classmethod
+    def from_env(cls) -> "AuthRepository":
+        return cls(
+            flush_interval_ms=int(os.getenv("AUTH_DB_FLUSH_INTERVAL_MS", "200")),
+            flush_max_rows=int(os.getenv("AUTH_DB_FLUSH_MAX_ROWS", "500")),
+            buffer_max_rows=int(os.getenv("AUTH_DB_BUFFER_MAX_ROWS", "10000")),
+            create_tables=os.getenv("AUTH_DB_CREATE_TABLES", "true").lower() == "true",
+            max_retries=int(os.getenv("AUTH_DB_MAX_RETRIES", "5")),
+            retry_backoff_ms=int(os.getenv("AUTH_DB_RETRY_BACKOFF_MS", "500")),
+            retry_backoff_max_ms=int(os.getenv("AUTH_DB_RETRY_BACKOFF_MAX_MS", "30000")),
+        )
+
+    async def start(self) -> None:
+        """엔진 생성, 테이블 준비, 백그라운드 flush 작업 시작"""
+        if self.engine is None:
+            self.engine = create_engine_from_env()
+        try:
+            await self._ensure_tables()
+        except Exception as e:
+            # DB가 아직 준비되지 않았어도 게이트웨이는 기동하고, 이후 flush에서 재시도
+            logger.error(f"Auth DB table setup failed, will retry on flush: {str(e)}")
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+        logger.info(f"Auth repository started: {self.engine.url.render_as_string(hide_password=True)}")
+
+    async def stop(self) -> None:
+        """남은 버퍼를 모두 기록한 뒤 엔진 정리"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        await self.flush(force=True)
+        if self.engine is not None:
+            await self.engine.dispose()
+
+    def record_login(self, user_info: Any, token_data: Dict[str, Any]) -> bool:
+        """
+        로그인 기록을 쓰기 버퍼에 추가 (DB 접근 없이 즉시 반환)
+
+        버퍼가 가득 차면 기록을 버리고 False를 반환합니다.
+        """
+        if len(self._buffer) >= self.buffer_max_rows:
+            self.dropped_rows += 1
+            logger.warning("Auth DB write buffer full, dropping login record")
+            return False
+
+        self._buffer.append(LoginRecord(
+            google_id=user_info.id,
+            email=user_info.email,
+            name=user_info.name,
+            picture=user_info.picture or None,
+            access_token=token_data["access_token"],
+            refresh_token=token_data.get("refresh_token"),
+            token_type=token_data.get("token_type", "Bearer"),
+            expires_in=token_data.get("expires_in"),
+            scope=token_data.get("scope"),
+        ))
+        if len(self._buffer) >= self.flush_max_rows:
+            self._wakeup.set()
+        return True
+
+    async def _flush_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def _ensure_tables(self) -> None:
+        if self._tables_ready:
+            return
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        self._tables_ready = True
+
+    async def flush(self, force: bool = False) -> int:
+        """
+        버퍼의 로그인 기록을 기록하고 기록한 행 수 반환
+
+        재시도 대기 중이면 force가 아닌 한 건너뜁니다.
+        """
+        async with self._flush_lock:
+            if not self._buffer or self.engine is None:
+                return 0
+            if not force and time.monotonic() < self._retry_at:
+                return 0
+            batch, self._buffer = self._buffer, []
+
+            try:
+                await self._ensure_tables()
+                written = await self._write(batch)
+            except Exception as e:
+                if is_transient_error(e):
+                    self._requeue(batch, e)
+                    return 0
+                logger.warning(f"Auth DB batch flush failed, retrying {len(batch)} records one by one: {str(e)}")
+                written = await self._write_each(batch)
+
+            self.flushed_rows += written
+            self.flushed_batches += 1
+            return written
+
+    async def _write_each(self, batch: List[LoginRecord]) -> int:
+        """한 건씩 별도 트랜잭션으로 기록 (영구 오류인 기록만 버리고, 일시적 오류면 남은 기록을 재시도 대기열로)"""
+        written = 0
+        for index, record in enumerate(batch):
+            try:
+                written += await self._write([record])
+            except Exception as e:
+                if is_transient_error(e):
+                    self._requeue(batch[index:], e)
+                    break
+                self.dropped_rows += 1
+                logger.error(f"Auth DB dropped login record for google_id={record.google_id}: {str(e)}")
+        return written
+
+    def _requeue(self, batch: List[LoginRecord], error: BaseException) -> None:
+        """일시적 오류로 실패한 기록을 버퍼 앞에 되돌리고 지수 백오프 설정 (재시도 한도를 넘은 기록은 버림)"""
+        retry = []
+        for record in batch:
+            record.attempts += 1
+            if record.attempts > self.max_retries:
+                self.dropped_rows += 1
+            else:
+                retry.append(record)
+        expired = len(batch) - len(retry)
+        self.retried_rows += len(retry)
+        self._buffer[:0] = retry
+
+        self._consecutive_failures += 1
+        delay = min(self.retry_backoff_max, self.retry_backoff * 2 ** (self._consecutive_failures - 1))
+        self._retry_at = time.monotonic() + delay
+        logger.error(
+            f"Auth DB flush failed ({str(error)}); retrying {len(retry)} records in {delay:.1f}s"
+            + (f", dropped {expired} records after {self.max_retries} retries" if expired else "")
+        )
+
+    async def _write(self, batch: List[LoginRecord]) -> int:
+        """사용자 upsert + 세션 insert를 한 트랜잭션으로 기록하고 기록한 세션 수 반환"""
+        async with self.engine.begin() as conn:
+            accepted = await self._resolve_email_conflicts(conn, batch)
+            if accepted:
+                user_ids = await self._upsert_users(conn, accepted)
+                await conn.execute(OAuthSession.__table__.insert(), [
+                    {
+                        "user_id": user_ids[record.google_id],
+                        "access_token": record.access_token,
+                        "refresh_token": record.refresh_token,
+                        "token_type": record.token_type,
+                        "expires_in": record.expires_in,
+                        "scope": record.scope,
+                    }
+                    for record in accepted
+                ])
+        self._consecutive_failures = 0
+        self._retry_at = 0.0
+        return len(accepted)
+
+    async def _resolve_email_conflicts(self, conn, batch: List[LoginRecord]) -> List[LoginRecord]:
+        """
+        users.email UNIQUE 충돌을 미리 처리하고 기록할 로그인 목록 반환
+
+        - 배치 안에서 서로 다른 google_id가 같은 이메일을 쓰면 마지막 로그인만 이메일을 가짐
+        - 이메일을 가진 기존 사용자의 google_id가 비어 있으면 해당 사용자에 google_id를 연결
+        - 다른 google_id가 이미 그 이메일을 쓰고 있으면 충돌로 보고 해당 기록을 건너뜀
+        """
+        owner_by_email: Dict[str, str] = {}
+        for record in batch:
+            owner_by_email[record.email] = record.google_id
+
+        existing = {
+            row.email: row
+            for row in await conn.execute(
+                select(User.id, User.email, User.google_id).where(User.email.in_(list(owner_by_email)))
+            )
+        }
+        known_google_ids = set()
+        if existing:
+            known_google_ids = {
+                google_id for (google_id,) in await conn.execute(
+                    select(User.google_id).where(User.google_id.in_(list(set(owner_by_email.values()))))
+                )
+            }
+
+        accepted, conflicts, linked = [], set(), set()
+        for record in batch:
+            holder = existing.get(record.email)
+            if owner_by_email[record.email] != record.google_id:
+                conflicts.add(record.google_id)
+                continue
+            if holder is not None and holder.google_id != record.google_id:
+                if holder.google_id is None and record.google_id not in known_google_ids:
+                    if record.google_id not in linked:
+                        await conn.execute(update(User).where(User.id == holder.id).values(google_id=record.google_id))
+                        linked.add(record.google_id)
+                else:
+                    conflicts.add(record.google_id)
+                    continue
+            accepted.append(record)
+
+        if conflicts:
+            self.conflict_rows += len(batch) - len(accepted)
+            logger.warning(f"Auth DB skipped login records with an email owned by another account: {sorted(conflicts)}")
+        return accepted
+
+    async def _upsert_users(self, conn, batch: List[LoginRecord]) -> Dict[str, int]:
+        """google_id 기준 사용자 upsert (배치 내 중복은 마지막 로그인 정보 사용), google_id → users.id 반환"""
+        latest: Dict[str, LoginRecord] = {record.google_id: record for record in batch}
+        dialect = sqlite if conn.dialect.name == "sqlite" else postgresql
+        stmt = dialect.insert(User).values([
+            {"google_id": record.google_id, "email": record.email, "name": record.name, "picture": record.picture}
+            for record in latest.values()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[User.google_id],
+            set_={
+                "email": stmt.excluded.email,
+                "name": stmt.excluded.name,
+                "picture": stmt.excluded.picture,
+                "updated_at": func.now(),
+            },
+        ).returning(User.google_id, User.id)
+        result = await conn.execute(stmt)
+        return {google_id: user_id for google_id, user_id in result.all()}
+
+    async def get_user_by_google_id(self, google_id: str) -> Optional[User]:
+        if self.engine is None:
+            return None
+        async with self.engine.connect() as conn:
+            row = (await conn.execute(select(User.__table__).where(User.google_id == google_id))).first()
+            return User(**row._mapping) if row else None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "buffered": len(self._buffer),
+            "flushed_rows": self.flushed_rows,
+            "flushed_batches": self.flushed_batches,
+            "dropped_rows": self.dropped_rows,
+            "retried_rows": self.retried_rows,
+            "conflict_rows": self.conflict_rows,
+            "consecutive_failures": self._consecutive_failures,
+        }
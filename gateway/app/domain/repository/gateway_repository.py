@@ -0,0 +1,252 @@
+# gateway/app/domain/repository/gateway_repository.py
+
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from typing import Dict, List, Optional, Any, Tuple
+
+from ..model.gateway_entity import Route, UpstreamPool, UpstreamInstance, LEAST_OUTSTANDING
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROUTES = "/api/sasb=http://localhost:8002,/api/gri=http://localhost:8003"
+
+
+class SQLiteRegistryStore:
+    """
+    동적으로 등록된 서비스 인스턴스를 보관하는 로컬 SQLite 저장소 (같은 호스트의 여러 게이트웨이 워커 간 공유)
+
+    등록/하트비트/해제 요청은 어느 워커가 받든 이 저장소에 기록되고,
+    각 워커는 헬스 체크 주기마다 저장소 내용으로 자신의 라우팅 테이블을 맞춥니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connection().execute(
+            "CREATE TABLE IF NOT EXISTS instances ("
+            " service TEXT NOT NULL,"
+            " instance_id TEXT NOT NULL,"
+            " url TEXT NOT NULL,"
+            " metadata TEXT NOT NULL,"
+            " last_heartbeat REAL NOT NULL,"
+            " PRIMARY KEY (service, instance_id))"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 연결은 스레드 간 공유하지 않고 스레드마다 하나씩 유지
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def upsert(self, service: str, instance_id: str, url: str, metadata: Dict[str, Any]) -> None:
+        self._connection().execute(
+            "INSERT INTO instances (service, instance_id, url, metadata, last_heartbeat) VALUES (?, ?, ?, ?, ?)"
+            " ON CONFLICT(service, instance_id) DO UPDATE SET"
+            " url = excluded.url, metadata = excluded.metadata, last_heartbeat = excluded.last_heartbeat",
+            (service, instance_id, url, json.dumps(metadata, separators=(",", ":")), time.time()),
+        )
+
+    def heartbeat(self, service: str, instance_id: str) -> bool:
+        cursor = self._connection().execute(
+            "UPDATE instances SET last_heartbeat = ? WHERE service = ? AND instance_id = ?",
+            (time.time(), service, instance_id),
+        )
+        return cursor.rowcount > 0
+
+    def delete(self, service: str, instance_id: str) -> bool:
+        cursor = self._connection().execute(
+            "DELETE FROM instances WHERE service = ? AND instance_id = ?", (service, instance_id)
+        )
+        return cursor.rowcount > 0
+
+    def evict(self, deadline: float) -> List[Tuple[str, str]]:
+        """deadline 이전에 마지막 하트비트를 보낸 인스턴스 삭제 후 (service, instance_id) 목록 반환"""
+        conn = self._connection()
+        stale = conn.execute(
+            "SELECT service, instance_id FROM instances WHERE last_heartbeat < ?", (deadline,)
+        ).fetchall()
+        if stale:
+            conn.execute("DELETE FROM instances WHERE last_heartbeat < ?", (deadline,))
+        return [(service, instance_id) for service, instance_id in stale]
+
+    def load(self) -> List[Tuple[str, str, str, Dict[str, Any], float]]:
+        return [
+            (service, instance_id, url, json.loads(metadata), last_heartbeat)
+            for service, instance_id, url, metadata, last_heartbeat in self._connection().execute(
+                "SELECT service, instance_id, url, metadata, last_heartbeat FROM instances"
+            )
+        ]
+
+
+def create_registry_store(backend: str) -> Optional[SQLiteRegistryStore]:
+    """REGISTRY_BACKEND 값(memory | sqlite)에 맞는 레지스트리 저장소 생성 (memory는 프로세스 내 라우팅 테이블만 사용)"""
+    if backend == "memory":
+        return None
+    if backend == "sqlite":
+        return SQLiteRegistryStore(os.getenv("REGISTRY_SQLITE_PATH", "/tmp/gateway_registry.db"))
+    raise ValueError(f"Unknown registry backend: {backend}")
+
+
+class RouteRepository:
+    """
+    프록시 라우팅 테이블 및 서비스 레지스트리
+
+    GATEWAY_ROUTES 환경 변수 형식:
+        /api/sasb=http://sasb-1:8002|http://sasb-2:8002,/api/gri=http://gri:8003
+
+    GATEWAY_FORWARD_CREDENTIALS_ROUTES에 나열한 접두사만 클라이언트의 Cookie/Authorization 헤더를 업스트림에 전달합니다.
+
+    환경 변수로 등록된 인스턴스는 고정(static) 인스턴스이며,
+    서비스가 직접 등록한 인스턴스는 하트비트가 끊기면 제거됩니다.
+    REGISTRY_BACKEND=sqlite이면 동적 인스턴스를 공유 저장소에 기록하여 모든 워커가 같은 테이블을 보게 합니다.
+    """
+
+    def __init__(
+        self,
+        routes_config: Optional[str] = None,
+        auth_required: Optional[bool] = None,
+        strategy: Optional[str] = None,
+        registry_store: Optional[SQLiteRegistryStore] = None,
+    ):
+        if routes_config is None:
+            routes_config = os.getenv("GATEWAY_ROUTES", DEFAULT_ROUTES)
+        if auth_required is None:
+            auth_required = os.getenv("GATEWAY_PROXY_REQUIRE_AUTH", "true").lower() == "true"
+        self.auth_required = auth_required
+        self.strategy = strategy or os.getenv("GATEWAY_LB_STRATEGY", LEAST_OUTSTANDING)
+        self.credential_routes = frozenset(
+            "/" + prefix.strip().strip("/")
+            for prefix in os.getenv("GATEWAY_FORWARD_CREDENTIALS_ROUTES", "").split(",")
+            if prefix.strip()
+        )
+
+        self.registry_store = registry_store or create_registry_store(os.getenv("REGISTRY_BACKEND", "memory").lower())
+
+        self.pools: Dict[str, UpstreamPool] = {}
+        self.routes: List[Route] = []
+
+        for entry in filter(None, (item.strip() for item in routes_config.split(","))):
+            prefix, _, targets = entry.partition("=")
+            urls = [url.strip() for url in targets.split("|") if url.strip()]
+            if not prefix or not urls:
+                logger.warning(f"Ignoring malformed gateway route: '{entry}'")
+                continue
+            self.add_route(prefix, urls, auth_required=auth_required)
+
+    @staticmethod
+    def service_name(prefix: str) -> str:
+        """접두사의 마지막 경로 조각을 서비스 이름으로 사용 (/api/sasb → sasb)"""
+        return prefix.strip("/").split("/")[-1]
+
+    def get_pool(self, name: str) -> UpstreamPool:
+        if name not in self.pools:
+            self.pools[name] = UpstreamPool(name=name, strategy=self.strategy)
+        return self.pools[name]
+
+    def add_route(self, prefix: str, urls: List[str], auth_required: bool = True) -> Route:
+        pool = self.get_pool(self.service_name(prefix))
+        for url in urls:
+            pool.add(UpstreamInstance(url=url))
+
+        route = Route(prefix=prefix, pool=pool, auth_required=auth_required)
+        route.forward_credentials = route.prefix in self.credential_routes
+        self.routes.append(route)
+        # 가장 긴 접두사가 먼저 매칭되도록 정렬
+        self.routes.sort(key=lambda r: len(r.prefix), reverse=True)
+        logger.info(f"Gateway route registered: {route.prefix} -> {urls}")
+        return route
+
+    def match(self, path: str) -> Optional[Route]:
+        for route in self.routes:
+            if route.matches(path):
+                return route
+        return None
+
+    # --- 서비스 레지스트리 ---
+
+    def register(self, service: str, url: str, instance_id: str, metadata: Optional[Dict[str, Any]] = None) -> UpstreamInstance:
+        """서비스 인스턴스 등록 (라우트가 없으면 /api/{service} 자동 생성)"""
+        if self.registry_store is not None:
+            self.registry_store.upsert(service, instance_id, url, metadata or {})
+        instance = self._add_dynamic(service, url, instance_id, metadata or {})
+        logger.info(f"Service instance registered: {service}/{instance_id} -> {url}")
+        return instance
+
+    def _add_dynamic(self, service: str, url: str, instance_id: str, metadata: Dict[str, Any]) -> UpstreamInstance:
+        pool = self.get_pool(service)
+        if not any(route.pool is pool for route in self.routes):
+            self.add_route(f"/api/{service}", [], auth_required=self.auth_required)
+        return pool.add(UpstreamInstance(
+            url=url,
+            instance_id=instance_id,
+            static=False,
+            metadata=metadata,
+        ))
+
+    def heartbeat(self, service: str, instance_id: str) -> bool:
+        if self.registry_store is not None:
+            # 다른 워커가 등록을 받은 인스턴스도 공유 저장소에 있으면 유효한 하트비트
+            if not self.registry_store.heartbeat(service, instance_id):
+                return False
+            pool = self.pools.get(service)
+            if pool is None or pool.get(instance_id) is None:
+                self.sync()
+        pool = self.pools.get(service)
+        instance = pool.get(instance_id) if pool else None
+        if instance is None:
+            return False
+        instance.last_heartbeat = time.time()
+        return True
+
+    def deregister(self, service: str, instance_id: str) -> bool:
+        pool = self.pools.get(service)
+        removed = bool(pool and pool.remove(instance_id))
+        if self.registry_store is not None:
+            removed = self.registry_store.delete(service, instance_id) or removed
+        if removed:
+            logger.info(f"Service instance deregistered: {service}/{instance_id}")
+        return removed
+
+    def sync(self) -> None:
+        """공유 저장소의 동적 인스턴스 목록으로 이 워커의 라우팅 테이블 갱신 (헬스 상태는 워커별로 유지)"""
+        if self.registry_store is None:
+            return
+        registered = set()
+        for service, instance_id, url, metadata, last_heartbeat in self.registry_store.load():
+            instance = self._add_dynamic(service, url, instance_id, metadata)
+            instance.last_heartbeat = last_heartbeat
+            registered.add((service, instance_id))
+        for pool in self.pools.values():
+            pool.instances = [
+                instance for instance in pool.instances
+                if instance.static or (pool.name, instance.instance_id) in registered
+            ]
+
+    def evict_stale(self, heartbeat_ttl: float) -> List[str]:
+        """하트비트가 끊긴 동적 인스턴스 제거"""
+        deadline = time.time() - heartbeat_ttl
+        if self.registry_store is not None:
+            evicted = [f"{service}/{instance_id}" for service, instance_id in self.registry_store.evict(deadline)]
+            self.sync()
+        else:
+            evicted = []
+            for pool in self.pools.values():
+                for instance in list(pool.instances):
+                    if not instance.static and instance.last_heartbeat < deadline:
+                        pool.instances.remove(instance)
+                        evicted.append(f"{pool.name}/{instance.instance_id}")
+        if evicted:
+            logger.warning(f"Evicted stale service instances: {evicted}")
+        return evicted
+
+    def all_instances(self) -> List[UpstreamInstance]:
+        return [instance for pool in self.pools.values() for instance in pool.instances]
@@ -1,8 +1,10 @@
 import os
+import uuid
 import secrets
 import httpx
 import logging
-from typing import Dict, Any, Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Any, Optional
 from urllib.parse import urlencode
 from fastapi import HTTPException
 from datetime import datetime, timedelta, timezone
@@ -10,18 +12,34 @@ from jose import JWTError, jwt
 
 from ..model.auth_entity import User, OAuthSession
 from ..model.auth_schema import LoginResponse, CallbackResponse, UserResponse, OAuthToken, GoogleUserInfo, AuthResponse
+from ..repository.auth_repository import AuthRepository
+from .token_cache import create_token_cache
+from .jwks_cache import GoogleJWKSCache
+from .revocation import TokenRevocationList
+from ...metrics import TOKEN_VERIFICATIONS, observe_outbound
 
 logger = logging.getLogger(__name__)
 
 
 class AuthService:
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
         self.google_client_id = os.getenv("GOOGLE_CLIENT_ID")
         self.google_client_secret = os.getenv("GOOGLE_CLIENT_SECRET")
         self.jwt_secret = os.getenv("JWT_SECRET", "your-secret-key")
         self.jwt_algorithm = "HS256"
         self.jwt_expiration_hours = 24
         
+        # 구글 API 호출에 사용할 공유 HTTP 클라이언트 (lifespan에서 주입)
+        self.http_client = http_client
+        
+        # 검증된 토큰 캐시 (동일 쿠키의 반복 검증 시 서명 검증 생략, TOKEN_CACHE_BACKEND=shm이면 워커 간 공유)
+        self.token_cache = create_token_cache(
+            os.getenv("TOKEN_CACHE_BACKEND", "memory").lower(), namespace=self.jwt_secret
+        )
+        
+        # 로그아웃으로 폐기된 토큰 ID (블룸 필터 우선 확인, 워커 간 스냅샷 공유)
+        self.revocation_list = TokenRevocationList.from_env()
+        
         # 환경 변수 로깅 (보안을 위해 일부만 표시)
         logger.info(f"Google Client ID: {self.google_client_id[:10] if self.google_client_id else 'None'}...")
         logger.info(f"Google Client Secret configured: {bool(self.google_client_secret)}")
@@ -30,10 +48,32 @@ class AuthService:
             logger.error("Google OAuth credentials not configured")
             raise ValueError("Google OAuth credentials not configured")
         
-        # 구글 OAuth 엔드포인트
-        self.google_auth_url = "https://accounts.google.com/o/oauth2/v2/auth"
-        self.google_token_url = "https://oauth2.googleapis.com/token"
-        self.google_userinfo_url = "https://www.googleapis.com/oauth2/v2/userinfo"
+        # 구글 OAuth 엔드포인트 (부하 테스트 시 로컬 목 서버로 교체 가능)
+        self.google_auth_url = os.getenv("GOOGLE_AUTH_URL", "https://accounts.google.com/o/oauth2/v2/auth")
+        self.google_token_url = os.getenv("GOOGLE_TOKEN_URL", "https://oauth2.googleapis.com/token")
+        self.google_userinfo_url = os.getenv("GOOGLE_USERINFO_URL", "https://www.googleapis.com/oauth2/v2/userinfo")
+        self.google_issuers = ("https://accounts.google.com", "accounts.google.com")
+        
+        # id_token 로컬 검증 모드 (userinfo 조회 왕복 생략)
+        self.verify_id_token_locally = os.getenv("GOOGLE_VERIFY_ID_TOKEN_LOCALLY", "false").lower() == "true"
+        self.jwks_cache = GoogleJWKSCache.from_env()
+        
+        # 사용자/OAuth 세션 영속화 (write-behind 배치, lifespan에서 start/stop)
+        self.auth_repository = AuthRepository.from_env()
+    
+    def bind_http_client(self, http_client: Optional[httpx.AsyncClient]) -> None:
+        """애플리케이션 범위의 공유 HTTP 클라이언트 주입"""
+        self.http_client = http_client
+        self.jwks_cache.bind_http_client(http_client)
+    
+    @asynccontextmanager
+    async def _get_http_client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """공유 클라이언트가 있으면 재사용하고, 없으면 일회용 클라이언트 생성"""
+        if self.http_client is not None:
+            yield self.http_client
+        else:
+            async with httpx.AsyncClient(timeout=30.0) as client:
+                yield client
     
     def generate_state(self) -> str:
         """OAuth state 파라미터 생성"""
@@ -74,14 +114,15 @@ class AuthService:
             "Accept": "application/json"
         }
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self._get_http_client() as client:
             try:
-                response = await client.post(
-                    self.google_token_url, 
-                    data=token_data,
-                    headers=headers
-                )
-                response.raise_for_status()
+                with observe_outbound("google_token"):
+                    response = await client.post(
+                        self.google_token_url, 
+                        data=token_data,
+                        headers=headers
+                    )
+                    response.raise_for_status()
                 return response.json()
             except httpx.HTTPStatusError as e:
                 logger.error(f"Token exchange HTTP error: {e.response.status_code} - {e.response.text}")
@@ -100,10 +141,11 @@ class AuthService:
             "Accept": "application/json"
         }
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self._get_http_client() as client:
             try:
-                response = await client.get(self.google_userinfo_url, headers=headers)
-                response.raise_for_status()
+                with observe_outbound("google_userinfo"):
+                    response = await client.get(self.google_userinfo_url, headers=headers)
+                    response.raise_for_status()
                 user_data = response.json()
                 return GoogleUserInfo(**user_data)
             except httpx.HTTPStatusError as e:
@@ -119,6 +161,44 @@ class AuthService:
                 logger.error(f"User info parsing error: {str(e)}")
                 raise HTTPException(status_code=500, detail=f"Failed to parse user info: {str(e)}")
     
+    async def verify_google_id_token(self, id_token: str, access_token: Optional[str] = None) -> GoogleUserInfo:
+        """구글 id_token을 캐시된 공개키로 로컬 검증하여 사용자 정보 생성"""
+        header = jwt.get_unverified_header(id_token)
+        key = await self.jwks_cache.get_key(header.get("kid"))
+        if key is None:
+            raise JWTError(f"Unknown signing key: {header.get('kid')}")
+        
+        claims = jwt.decode(
+            id_token,
+            key,
+            algorithms=["RS256"],
+            audience=self.google_client_id,
+            issuer=self.google_issuers,
+            access_token=access_token
+        )
+        
+        return GoogleUserInfo(
+            id=claims["sub"],
+            email=claims["email"],
+            verified_email=bool(claims.get("email_verified", False)),
+            name=claims.get("name", claims["email"]),
+            given_name=claims.get("given_name", ""),
+            family_name=claims.get("family_name", ""),
+            picture=claims.get("picture", ""),
+            locale=claims.get("locale")
+        )
+    
+    async def resolve_google_user_info(self, token_data: Dict[str, Any]) -> GoogleUserInfo:
+        """토큰 응답으로부터 사용자 정보 확보 (로컬 검증 실패 시 userinfo API로 대체)"""
+        id_token = token_data.get("id_token")
+        if self.verify_id_token_locally and id_token:
+            try:
+                return await self.verify_google_id_token(id_token, token_data.get("access_token"))
+            except Exception as e:
+                logger.warning(f"Local id_token verification failed, falling back to userinfo: {str(e)}")
+        
+        return await self.get_google_user_info(token_data["access_token"])
+    
     def create_jwt_token(self, user_data: Dict[str, Any]) -> str:
         """JWT 토큰 생성"""
         now = datetime.now(timezone.utc)
@@ -130,13 +210,24 @@ class AuthService:
             "picture": user_data.get("picture"),
             "google_id": user_data.get("google_id"),
             "exp": expire,
-            "iat": now
+            "iat": now,
+            "jti": uuid.uuid4().hex
         }
         
         return jwt.encode(payload, self.jwt_secret, algorithm=self.jwt_algorithm)
     
     async def verify_jwt_token(self, token: str) -> Dict[str, Any]:
         """JWT 토큰 검증"""
+        cached_payload = self.token_cache.get(token)
+        if cached_payload is not None:
+            # 다른 워커에서 폐기된 토큰이 캐시에 남아 있을 수 있으므로 캐시 적중 시에도 폐기 여부 확인
+            if self.revocation_list.is_revoked(self.revocation_key(token, cached_payload)):
+                self.token_cache.invalidate(token)
+                TOKEN_VERIFICATIONS.labels("revoked").inc()
+                raise HTTPException(status_code=401, detail="Token has been revoked")
+            TOKEN_VERIFICATIONS.labels("cache_hit").inc()
+            return cached_payload
+        
         try:
             payload = jwt.decode(
                 token, 
@@ -152,17 +243,45 @@ class AuthService:
                 if exp_datetime < datetime.now(timezone.utc):
                     raise HTTPException(status_code=401, detail="Token has expired")
             
+            if self.revocation_list.is_revoked(self.revocation_key(token, payload)):
+                TOKEN_VERIFICATIONS.labels("revoked").inc()
+                raise HTTPException(status_code=401, detail="Token has been revoked")
+            
+            self.token_cache.put(token, payload)
+            TOKEN_VERIFICATIONS.labels("verified").inc()
             return payload
+        except HTTPException:
+            raise
         except jwt.ExpiredSignatureError:
             logger.warning("Token has expired")
+            TOKEN_VERIFICATIONS.labels("rejected").inc()
             raise HTTPException(status_code=401, detail="Token has expired")
-        except jwt.InvalidTokenError as e:
+        except JWTError as e:
             logger.warning(f"Invalid token: {str(e)}")
+            TOKEN_VERIFICATIONS.labels("rejected").inc()
             raise HTTPException(status_code=401, detail=f"Invalid token: {str(e)}")
         except Exception as e:
             logger.error(f"Token verification error: {str(e)}")
+            TOKEN_VERIFICATIONS.labels("rejected").inc()
             raise HTTPException(status_code=401, detail="Token verification failed")
     
+    def revocation_key(self, token: str, payload: Dict[str, Any]) -> str:
+        """폐기 목록 키: jti 클레임 (jti가 없는 이전 토큰은 토큰 다이제스트)"""
+        return payload.get("jti") or self.token_cache.digest(token)
+    
+    def revoke_token(self, token: str) -> bool:
+        """토큰을 만료 시각까지 폐기하고 검증 캐시에서 제거 (유효하지 않은 토큰이면 False)"""
+        self.token_cache.invalidate(token)
+        try:
+            payload = jwt.decode(token, self.jwt_secret, algorithms=[self.jwt_algorithm])
+        except JWTError:
+            return False
+        exp = payload.get("exp")
+        if not exp:
+            return False
+        self.revocation_list.revoke(self.revocation_key(token, payload), float(exp))
+        return True
+    
     async def process_google_callback(self, code: str, state: str, redirect_uri: str) -> AuthResponse:
         """구글 OAuth 콜백 처리"""
         try:
@@ -176,9 +295,10 @@ class AuthService:
                 raise HTTPException(status_code=400, detail="No access token received from Google")
             
             # 2. 사용자 정보 조회
-            google_user_info = await self.get_google_user_info(token_data["access_token"])
+            google_user_info = await self.resolve_google_user_info(token_data)
             
-            # 3. 사용자 응답 객체 생성 (실제 DB 저장은 repository에서 처리)
+            # 3. 사용자 응답 객체 생성 (DB 저장은 repository 쓰기 버퍼에 넣고 백그라운드에서 일괄 처리)
+            self.auth_repository.record_login(google_user_info, token_data)
             now = datetime.now(timezone.utc)
             user_response = UserResponse(
                 email=google_user_info.email,
@@ -0,0 +1,294 @@
+# gateway/app/domain/service/gateway_service.py
+
+import os
+import hmac
+import time
+import asyncio
+import logging
+import ipaddress
+from typing import Dict, Any, Optional, List, Tuple, AsyncIterator
+from urllib.parse import urlsplit
+import httpx
+from fastapi import HTTPException, Request
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+
+from ..model.gateway_entity import Route, UpstreamInstance
+from ..repository.gateway_repository import RouteRepository
+from ...metrics import UPSTREAM_LATENCY
+
+logger = logging.getLogger(__name__)
+
+# RFC 7230 6.1 hop-by-hop 헤더 (프록시 구간마다 소비되므로 전달하지 않음)
+HOP_BY_HOP_HEADERS = frozenset({
+    "connection",
+    "keep-alive",
+    "proxy-authenticate",
+    "proxy-authorization",
+    "te",
+    "trailer",
+    "transfer-encoding",
+    "upgrade",
+})
+
+# 클라이언트가 위조할 수 없도록 게이트웨이에서만 설정하는 신원 헤더
+IDENTITY_HEADERS = frozenset({
+    "x-authenticated-user",
+    "x-user-email",
+    "x-user-google-id",
+})
+
+# 게이트웨이 세션(session_token 쿠키)과 Bearer 토큰은 게이트웨이에서 검증 후 신원 헤더로 대체하므로 전달하지 않음
+# (라우트별 forward_credentials로만 명시적으로 허용)
+CREDENTIAL_HEADERS = frozenset({
+    "cookie",
+    "authorization",
+})
+
+METHODS_WITHOUT_BODY = frozenset({"GET", "HEAD", "OPTIONS", "DELETE"})
+
+# 동적 등록을 허용할 업스트림 주소 (사설망/루프백 CIDR, 호스트 이름, '.'으로 시작하면 도메인 접미사)
+DEFAULT_REGISTRY_ALLOWED_UPSTREAMS = (
+    "127.0.0.0/8,::1/128,10.0.0.0/8,172.16.0.0/12,192.168.0.0/16,fc00::/7,localhost,.railway.internal"
+)
+
+
+def filter_headers(raw_headers: List[Tuple[bytes, bytes]], drop: frozenset = frozenset()) -> List[Tuple[str, str]]:
+    """hop-by-hop 헤더 및 Connection 헤더에 나열된 헤더 제거"""
+    connection_tokens = set()
+    for name, value in raw_headers:
+        if name.lower() == b"connection":
+            connection_tokens.update(token.strip().lower() for token in value.decode("latin-1").split(","))
+
+    filtered = []
+    for name, value in raw_headers:
+        key = name.decode("latin-1").lower()
+        if key in HOP_BY_HOP_HEADERS or key in connection_tokens or key in drop:
+            continue
+        filtered.append((key, value.decode("latin-1")))
+    return filtered
+
+
+class ProxyService:
+    """요청/응답 본문을 버퍼링 없이 업스트림으로 스트리밍하는 리버스 프록시"""
+
+    def __init__(self, route_repository: Optional[RouteRepository] = None, http_client: Optional[httpx.AsyncClient] = None):
+        self.route_repository = route_repository or RouteRepository()
+        self.http_client = http_client
+        self.failure_threshold = int(os.getenv("REGISTRY_UNHEALTHY_THRESHOLD", "2"))
+
+    def bind_http_client(self, http_client: Optional[httpx.AsyncClient]) -> None:
+        """업스트림 전용 공유 HTTP 클라이언트 주입"""
+        self.http_client = http_client
+
+    def resolve_route(self, path: str) -> Route:
+        route = self.route_repository.match(path)
+        if route is None:
+            raise HTTPException(status_code=404, detail=f"No upstream route for path: {path}")
+        return route
+
+    def build_upstream_headers(self, request: Request, identity: Optional[Dict[str, Any]],
+                               forward_credentials: bool = False) -> List[Tuple[str, str]]:
+        drop = IDENTITY_HEADERS | {"host"}
+        if not forward_credentials:
+            drop = drop | CREDENTIAL_HEADERS
+        headers = filter_headers(request.headers.raw, drop=drop)
+
+        client_host = request.client.host if request.client else ""
+        forwarded_for = request.headers.get("x-forwarded-for")
+        headers = [(k, v) for k, v in headers if k not in ("x-forwarded-for", "x-forwarded-proto", "x-forwarded-host")]
+        headers.append(("x-forwarded-for", f"{forwarded_for}, {client_host}" if forwarded_for else client_host))
+        headers.append(("x-forwarded-proto", request.url.scheme))
+        headers.append(("x-forwarded-host", request.headers.get("host", "")))
+
+        if identity:
+            headers.append(("x-authenticated-user", str(identity.get("sub", ""))))
+            if identity.get("email"):
+                headers.append(("x-user-email", identity["email"]))
+            if identity.get("google_id"):
+                headers.append(("x-user-google-id", identity["google_id"]))
+        return headers
+
+    @staticmethod
+    async def _stream_body(upstream_response: httpx.Response, release) -> AsyncIterator[bytes]:
+        """업스트림 응답을 청크 단위로 전달하고, 중단되더라도 연결을 반납"""
+        try:
+            async for chunk in upstream_response.aiter_raw():
+                yield chunk
+        finally:
+            await release()
+
+    async def forward(self, request: Request, route: Route, identity: Optional[Dict[str, Any]] = None) -> StreamingResponse:
+        """요청을 업스트림으로 전달하고 응답을 스트리밍으로 반환"""
+        if self.http_client is None:
+            raise HTTPException(status_code=503, detail="Proxy client not initialized")
+
+        instance = route.pool.pick()
+        if instance is None:
+            raise HTTPException(status_code=503, detail=f"No available upstream for service: {route.pool.name}")
+
+        url = instance.url + route.upstream_path(request.url.path)
+        if request.url.query:
+            url = f"{url}?{request.url.query}"
+
+        has_body = request.method not in METHODS_WITHOUT_BODY or "content-length" in request.headers \
+            or "transfer-encoding" in request.headers
+        upstream_request = self.http_client.build_request(
+            request.method,
+            url,
+            headers=self.build_upstream_headers(request, identity, route.forward_credentials),
+            content=request.stream() if has_body else None,
+        )
+
+        instance.outstanding += 1
+        started = time.perf_counter()
+        try:
+            upstream_response = await self.http_client.send(upstream_request, stream=True)
+        except httpx.TimeoutException as e:
+            instance.outstanding -= 1
+            UPSTREAM_LATENCY.labels(route.pool.name, "timeout").observe(time.perf_counter() - started)
+            logger.error(f"Upstream timeout ({route.pool.name} {instance.url}): {str(e)}")
+            raise HTTPException(status_code=504, detail="Upstream timeout")
+        except httpx.RequestError as e:
+            instance.outstanding -= 1
+            # 연결 실패는 헬스 체크를 기다리지 않고 즉시 실패 횟수에 반영
+            instance.mark_failure(self.failure_threshold)
+            UPSTREAM_LATENCY.labels(route.pool.name, "error").observe(time.perf_counter() - started)
+            logger.error(f"Upstream request error ({route.pool.name} {instance.url}): {str(e)}")
+            raise HTTPException(status_code=502, detail="Upstream unavailable")
+        UPSTREAM_LATENCY.labels(route.pool.name, str(upstream_response.status_code)).observe(time.perf_counter() - started)
+
+        released = False
+
+        async def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                instance.outstanding -= 1
+                await upstream_response.aclose()
+
+        response = StreamingResponse(
+            self._stream_body(upstream_response, release),
+            status_code=upstream_response.status_code,
+            background=BackgroundTask(release),
+        )
+        # Set-Cookie 등 중복 가능한 헤더를 보존하기 위해 raw 헤더를 그대로 설정
+        response.raw_headers = [
+            (key.encode("latin-1"), value.encode("latin-1"))
+            for key, value in filter_headers(upstream_response.headers.raw)
+        ]
+        return response
+
+
+class RegistryService:
+    """
+    서비스 레지스트리 관리 및 능동 헬스 체크
+
+    주기적으로 각 인스턴스의 /health를 호출하여 연속 실패 시 라우팅에서 제외하고,
+    하트비트가 끊긴 동적 인스턴스는 레지스트리에서 제거합니다.
+    """
+
+    def __init__(self, route_repository: RouteRepository, http_client: Optional[httpx.AsyncClient] = None):
+        self.route_repository = route_repository
+        self.http_client = http_client
+        self.probe_interval = float(os.getenv("REGISTRY_HEALTH_INTERVAL", "5"))
+        self.probe_timeout = float(os.getenv("REGISTRY_HEALTH_TIMEOUT", "2"))
+        self.failure_threshold = int(os.getenv("REGISTRY_UNHEALTHY_THRESHOLD", "2"))
+        self.heartbeat_ttl = float(os.getenv("REGISTRY_HEARTBEAT_TTL", "30"))
+        self.registry_token = os.getenv("REGISTRY_TOKEN") or None
+        self.allowed_networks: List[Any] = []
+        self.allowed_hosts: List[str] = []
+        for entry in os.getenv("REGISTRY_ALLOWED_UPSTREAMS", DEFAULT_REGISTRY_ALLOWED_UPSTREAMS).split(","):
+            entry = entry.strip().lower()
+            if not entry:
+                continue
+            try:
+                self.allowed_networks.append(ipaddress.ip_network(entry, strict=False))
+            except ValueError:
+                self.allowed_hosts.append(entry)
+        self._task: Optional[asyncio.Task] = None
+
+    def bind_http_client(self, http_client: Optional[httpx.AsyncClient]) -> None:
+        self.http_client = http_client
+
+    @property
+    def enabled(self) -> bool:
+        """REGISTRY_TOKEN이 설정된 경우에만 동적 등록 API 사용 (미설정 시 /registry 비활성화)"""
+        return self.registry_token is not None
+
+    def authorize(self, token: Optional[str]) -> None:
+        """레지스트리 요청 인증 (토큰 미설정 시 모든 요청 거부)"""
+        if not self.enabled:
+            raise HTTPException(status_code=404, detail="Service registry is disabled")
+        if not token or not hmac.compare_digest(token.encode("utf-8"), self.registry_token.encode("utf-8")):
+            raise HTTPException(status_code=403, detail="Invalid registry token")
+
+    def validate_url(self, url: str) -> None:
+        """등록할 인스턴스 URL이 허용된 내부 네트워크/호스트인지 확인 (외부 주소로의 트래픽 유출 및 SSRF 방지)"""
+        try:
+            parts = urlsplit(url)
+            host = (parts.hostname or "").lower()
+            parts.port  # 잘못된 포트면 ValueError
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid instance URL")
+        if parts.scheme not in ("http", "https") or not host or parts.username or parts.password:
+            raise HTTPException(status_code=400, detail="Invalid instance URL")
+
+        try:
+            address = ipaddress.ip_address(host)
+        except ValueError:
+            allowed = any(
+                host.endswith(entry) if entry.startswith(".") else host == entry
+                for entry in self.allowed_hosts
+            )
+        else:
+            allowed = any(address in network for network in self.allowed_networks)
+        if not allowed:
+            logger.warning(f"Rejected service registration for non-allowed upstream: {url}")
+            raise HTTPException(status_code=403, detail="Instance URL is not an allowed upstream")
+
+    async def probe(self, instance: UpstreamInstance) -> bool:
+        try:
+            response = await self.http_client.get(f"{instance.url}/health", timeout=self.probe_timeout)
+            ok = response.status_code < 500
+        except httpx.HTTPError:
+            ok = False
+
+        was_healthy = instance.healthy
+        if ok:
+            instance.mark_success()
+        else:
+            instance.mark_failure(self.failure_threshold)
+
+        if was_healthy != instance.healthy:
+            state = "healthy" if instance.healthy else "ejected"
+            logger.warning(f"Upstream instance {instance.instance_id} ({instance.url}) is now {state}")
+        return ok
+
+    async def probe_all(self) -> None:
+        self.route_repository.evict_stale(self.heartbeat_ttl)
+        instances = self.route_repository.all_instances()
+        if instances and self.http_client is not None:
+            await asyncio.gather(*(self.probe(instance) for instance in instances))
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.probe_all()
+            except Exception as e:
+                logger.error(f"Health probe cycle failed: {str(e)}")
+            await asyncio.sleep(self.probe_interval)
+
+    def start(self) -> None:
+        """백그라운드 헬스 체크 시작"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,61 @@
+# gateway/app/domain/service/http_client.py
+
+import os
+import logging
+import importlib.util
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, str(default)))
+
+
+def _env_float(name: str, default: float) -> float:
+    return float(os.getenv(name, str(default)))
+
+
+def http2_available() -> bool:
+    """h2 패키지가 설치되어 있을 때만 HTTP/2 사용 가능"""
+    return importlib.util.find_spec("h2") is not None
+
+
+def create_http_client(
+    env_prefix: str = "OUTBOUND_HTTP",
+    max_connections: int = 100,
+    max_keepalive_connections: int = 20,
+    keepalive_expiry: float = 30.0,
+    connect_timeout: float = 5.0,
+    read_timeout: float = 15.0,
+    write_timeout: float = 10.0,
+    pool_timeout: float = 5.0,
+) -> httpx.AsyncClient:
+    """
+    애플리케이션 전역에서 공유하는 커넥션 풀 기반 AsyncClient 생성
+
+    모든 값은 `{env_prefix}_*` 환경 변수로 덮어쓸 수 있습니다.
+    (예: OUTBOUND_HTTP_MAX_CONNECTIONS, OUTBOUND_HTTP_READ_TIMEOUT)
+    """
+    limits = httpx.Limits(
+        max_connections=_env_int(f"{env_prefix}_MAX_CONNECTIONS", max_connections),
+        max_keepalive_connections=_env_int(f"{env_prefix}_MAX_KEEPALIVE", max_keepalive_connections),
+        keepalive_expiry=_env_float(f"{env_prefix}_KEEPALIVE_EXPIRY", keepalive_expiry),
+    )
+    timeout = httpx.Timeout(
+        connect=_env_float(f"{env_prefix}_CONNECT_TIMEOUT", connect_timeout),
+        read=_env_float(f"{env_prefix}_READ_TIMEOUT", read_timeout),
+        write=_env_float(f"{env_prefix}_WRITE_TIMEOUT", write_timeout),
+        pool=_env_float(f"{env_prefix}_POOL_TIMEOUT", pool_timeout),
+    )
+
+    http2 = os.getenv(f"{env_prefix}_HTTP2", "true").lower() == "true"
+    if http2 and not http2_available():
+        logger.info("h2 package not installed, falling back to HTTP/1.1")
+        http2 = False
+
+    logger.info(
+        f"Creating shared HTTP client ({env_prefix}): "
+        f"max_connections={limits.max_connections}, keepalive={limits.max_keepalive_connections}, http2={http2}"
+    )
+    return httpx.AsyncClient(limits=limits, timeout=timeout, http2=http2)
@@ -0,0 +1,191 @@
+# gateway/app/domain/service/jwks_cache.py
+
+import os
+import re
+import json
+import time
+import asyncio
+import logging
+import tempfile
+from typing import Dict, Any, Optional
+import httpx
+
+from ...metrics import observe_outbound
+
+logger = logging.getLogger(__name__)
+
+_MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+def parse_max_age(cache_control: Optional[str], default: int) -> int:
+    """Cache-Control 헤더에서 max-age(초) 추출"""
+    if cache_control:
+        match = _MAX_AGE_PATTERN.search(cache_control)
+        if match:
+            return int(match.group(1))
+    return default
+
+
+class GoogleJWKSCache:
+    """
+    구글 id_token 서명 검증용 공개키(JWKS) 캐시
+
+    메모리 → 디스크 → 네트워크 순으로 키를 조회하며,
+    응답의 Cache-Control max-age에 맞춰 백그라운드에서 갱신합니다.
+    `fixture_path`가 지정되면 네트워크 대신 로컬 JSON 파일을 사용합니다(테스트용).
+    """
+
+    def __init__(
+        self,
+        jwks_url: str = "https://www.googleapis.com/oauth2/v3/certs",
+        cache_path: Optional[str] = None,
+        fixture_path: Optional[str] = None,
+        default_max_age: int = 3600,
+        refresh_margin: int = 300,
+        min_refresh_interval: int = 60,
+    ):
+        self.jwks_url = jwks_url
+        self.cache_path = cache_path
+        self.fixture_path = fixture_path
+        self.default_max_age = default_max_age
+        self.refresh_margin = refresh_margin
+        self.min_refresh_interval = min_refresh_interval
+
+        self.http_client: Optional[httpx.AsyncClient] = None
+        self._keys: Dict[str, Dict[str, Any]] = {}
+        self._expires_at = 0.0
+        self._last_fetch = 0.0
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_env(cls) -> "GoogleJWKSCache":
+        return cls(
+            jwks_url=os.getenv("GOOGLE_JWKS_URL", "https://www.googleapis.com/oauth2/v3/certs"),
+            cache_path=os.getenv("GOOGLE_JWKS_CACHE_PATH", "/tmp/google_jwks.json"),
+            fixture_path=os.getenv("GOOGLE_JWKS_FIXTURE_PATH") or None,
+            default_max_age=int(os.getenv("GOOGLE_JWKS_DEFAULT_MAX_AGE", "3600")),
+        )
+
+    def bind_http_client(self, http_client: Optional[httpx.AsyncClient]) -> None:
+        """공유 HTTP 클라이언트 주입"""
+        self.http_client = http_client
+
+    @property
+    def is_fresh(self) -> bool:
+        return bool(self._keys) and time.time() < self._expires_at
+
+    async def get_key(self, kid: Optional[str]) -> Optional[Dict[str, Any]]:
+        """kid에 해당하는 JWK 반환 (알 수 없는 kid면 한 번 강제 갱신)"""
+        if not self.is_fresh:
+            await self.refresh()
+
+        key = self._keys.get(kid) if kid else None
+        if key is None and kid and time.time() - self._last_fetch >= self.min_refresh_interval:
+            # 구글 키 교체 직후일 수 있으므로 한 번만 재조회
+            await self.refresh(force=True)
+            key = self._keys.get(kid)
+        return key
+
+    async def refresh(self, force: bool = False) -> None:
+        """키 갱신 (디스크 캐시가 유효하면 네트워크 호출 생략)"""
+        async with self._lock:
+            if not force and self.is_fresh:
+                return
+            if not force and self._load_from_disk():
+                return
+
+            if self.fixture_path:
+                with open(self.fixture_path, "r", encoding="utf-8") as f:
+                    jwks = json.load(f)
+                max_age = self.default_max_age
+            else:
+                jwks, max_age = await self._fetch()
+
+            self._set_keys(jwks, time.time() + max_age)
+            self._last_fetch = time.time()
+            self._save_to_disk(jwks)
+            logger.info(f"Google JWKS refreshed: {len(self._keys)} keys, max-age={max_age}s")
+
+    async def _fetch(self):
+        with observe_outbound("google_jwks"):
+            if self.http_client is not None:
+                response = await self.http_client.get(self.jwks_url)
+            else:
+                async with httpx.AsyncClient(timeout=10.0) as client:
+                    response = await client.get(self.jwks_url)
+            response.raise_for_status()
+        max_age = parse_max_age(response.headers.get("cache-control"), self.default_max_age)
+        return response.json(), max_age
+
+    def _set_keys(self, jwks: Dict[str, Any], expires_at: float) -> None:
+        self._keys = {key["kid"]: key for key in jwks.get("keys", []) if "kid" in key}
+        self._expires_at = expires_at
+
+    def _load_from_disk(self) -> bool:
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return False
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("expires_at", 0) <= time.time():
+                return False
+            self._set_keys(cached["jwks"], cached["expires_at"])
+            logger.debug(f"Google JWKS loaded from disk cache: {self.cache_path}")
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to read JWKS disk cache: {str(e)}")
+            return False
+
+    def _save_to_disk(self, jwks: Dict[str, Any]) -> None:
+        if not self.cache_path:
+            return
+        tmp_path = None
+        try:
+            # 여러 워커가 동시에 갱신해도 서로의 임시 파일에 섞여 쓰지 않도록 워커마다 고유한 임시 파일 사용
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=os.path.basename(self.cache_path) + ".", suffix=".tmp",
+                dir=os.path.dirname(os.path.abspath(self.cache_path)),
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"jwks": jwks, "expires_at": self._expires_at}, f)
+            os.replace(tmp_path, self.cache_path)
+            tmp_path = None
+        except Exception as e:
+            logger.warning(f"Failed to write JWKS disk cache: {str(e)}")
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    async def _refresh_loop(self) -> None:
+        force = False
+        while True:
+            try:
+                await self.refresh(force=force)
+            except Exception as e:
+                logger.warning(f"Background JWKS refresh failed: {str(e)}")
+                await asyncio.sleep(self.min_refresh_interval)
+                continue
+
+            delay = self._expires_at - time.time() - self.refresh_margin
+            await asyncio.sleep(max(delay, self.min_refresh_interval))
+            # 만료 직전에 디스크 캐시를 건너뛰고 미리 갱신
+            force = True
+
+    def start(self) -> None:
+        """백그라운드 갱신 태스크 시작"""
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        """백그라운드 갱신 태스크 종료"""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
@@ -0,0 +1,99 @@
+# gateway/app/domain/service/origin_policy.py
+
+import os
+import re
+import logging
+from typing import Dict, Iterable, Optional, Pattern
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FRONTEND_URL = "http://localhost:3000"
+
+
+def normalize_origin(origin: str) -> str:
+    """Origin 비교용 정규화 (앞뒤 공백과 끝의 / 제거, 소문자)"""
+    return origin.strip().rstrip("/").lower()
+
+
+def wildcard_pattern(entry: str) -> str:
+    """
+    와일드카드 서브도메인 항목을 정규식으로 변환
+
+    https://*.kimyounggon.com → https의 모든 하위 도메인(여러 단계 포함, 기준 도메인 자체는 제외)
+    *.kimyounggon.com         → http/https 모두 허용
+    """
+    scheme, _, host = entry.rpartition("://")
+    if not host.startswith("*."):
+        raise ValueError(f"Only leading '*.' subdomain wildcards are supported: {entry}")
+    scheme_pattern = re.escape(scheme) if scheme else "https?"
+    return rf"{scheme_pattern}://(?:[a-z0-9-]+\.)+{re.escape(host[2:])}"
+
+
+class OriginPolicy:
+    """
+    허용 Origin 정책 (CORS 미들웨어와 프론트엔드 리디렉션 URL 결정에 공유)
+
+    설정은 생성 시 한 번만 파싱하여 정확히 일치하는 Origin은 frozenset으로,
+    와일드카드 서브도메인은 하나의 정규식으로 컴파일해 둡니다.
+    와일드카드 판정 결과는 Origin별로 기억하므로 같은 Origin의 반복 요청은 집합 조회 한 번으로 끝납니다.
+    """
+
+    def __init__(self, origins: Iterable[str], default_url: Optional[str] = None, memo_size: int = 1024):
+        exact = []
+        patterns = []
+        for entry in (normalize_origin(origin) for origin in origins):
+            if not entry:
+                continue
+            if entry == "*":
+                # 자격 증명(쿠키)을 포함하는 CORS에서 모든 Origin 허용은 지원하지 않음
+                logger.warning("Ignoring '*' in allowed origins; list origins or '*.domain' patterns explicitly")
+            elif "*" in entry:
+                patterns.append(wildcard_pattern(entry))
+            else:
+                exact.append(entry)
+
+        self.exact = frozenset(exact)
+        self.pattern: Optional[Pattern[str]] = re.compile("|".join(f"(?:{p})" for p in patterns)) if patterns else None
+        self.default_url = default_url or (exact[0] if exact else DEFAULT_FRONTEND_URL)
+        self.memo_size = max(0, memo_size)
+        self._memo: Dict[str, bool] = {}
+        self.rejected = 0
+
+    @classmethod
+    def from_env(cls) -> "OriginPolicy":
+        """FRONTEND_URLS(콤마 구분, '*.도메인' 허용)로 정책 생성, 첫 번째 정확한 URL이 기본 프론트엔드 URL"""
+        return cls(os.getenv("FRONTEND_URLS", DEFAULT_FRONTEND_URL).split(","))
+
+    def is_allowed(self, origin: Optional[str]) -> bool:
+        if not origin:
+            return False
+        if origin in self.exact:
+            return True
+        allowed = self._memo.get(origin)
+        if allowed is None:
+            normalized = normalize_origin(origin)
+            allowed = normalized in self.exact or bool(self.pattern and self.pattern.fullmatch(normalized))
+            if len(self._memo) >= self.memo_size:
+                # 임의의 Origin을 보내는 클라이언트로 메모가 무한히 커지지 않도록 비움
+                self._memo.clear()
+            if self.memo_size:
+                self._memo[origin] = allowed
+        if not allowed:
+            self.rejected += 1
+        return allowed
+
+    def frontend_url(self, origin: Optional[str]) -> str:
+        """허용된 Origin이면 그대로, 아니면 기본 프론트엔드 URL 반환"""
+        if self.is_allowed(origin):
+            return origin
+        logger.debug(f"Origin '{origin}' not allowed or not present. Falling back to default: {self.default_url}")
+        return self.default_url
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "exact": len(self.exact),
+            "wildcard": bool(self.pattern),
+            "default_url": self.default_url,
+            "memo_size": len(self._memo),
+            "rejected": self.rejected,
+        }
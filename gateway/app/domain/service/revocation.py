@@ -0,0 +1,340 @@
+# gateway/app/domain/service/revocation.py
+
+import os
+import json
+import heapq
+import struct
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"GWRV1\0"
+SNAPSHOT_HEADER = struct.Struct("<6sIII")  # magic, 카운터 수, 해시 수, 항목 JSON 길이
+
+
+class CountingBloomFilter:
+    """
+    삭제를 지원하는 카운팅 블룸 필터 (카운터당 1바이트, 255에서 포화)
+
+    might_contain이 False이면 확실히 없는 항목이며, True이면 정확한 집합으로 다시 확인해야 합니다.
+    """
+
+    def __init__(self, size: int = 1 << 20, hashes: int = 7, counters: Optional[bytearray] = None):
+        self.size = max(64, size)
+        self.hashes = max(1, hashes)
+        self.counters = counters if counters is not None else bytearray(self.size)
+
+    def _positions(self, item: str) -> List[int]:
+        # 128비트 다이제스트 하나로 k개 위치 생성 (double hashing)
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            if self.counters[position] < 255:
+                self.counters[position] += 1
+
+    def remove(self, item: str) -> None:
+        for position in self._positions(item):
+            # 포화된 카운터는 실제 개수를 알 수 없으므로 줄이지 않음 (거짓 음성 방지)
+            if 0 < self.counters[position] < 255:
+                self.counters[position] -= 1
+
+    def might_contain(self, item: str) -> bool:
+        counters = self.counters
+        return all(counters[position] for position in self._positions(item))
+
+
+class TokenRevocationList:
+    """
+    폐기된 토큰 ID(jti) 목록: 카운팅 블룸 필터 + 정확한 jti → exp 맵
+
+    - 검증 경로에서는 블룸 필터만 확인하고, 필터가 적중한 경우에만 정확한 맵을 조회합니다.
+    - 각 항목은 토큰의 exp 시각에 자동으로 제거됩니다 (만료된 토큰은 서명 검증에서 이미 거부됨).
+    - snapshot_path가 있으면 같은 호스트의 다른 게이트웨이 워커와 파일로 동기화합니다.
+      폐기는 로그 파일(snapshot_path + ".log")에 한 줄씩 추가하고, 각 워커는 마지막으로 읽은 위치 이후만 읽습니다.
+      로그가 compact_bytes를 넘거나 종료할 때 한 워커가 필터와 항목을 스냅샷으로 압축하고 로그를 비웁니다.
+    """
+
+    def __init__(
+        self,
+        size: int = 1 << 20,
+        hashes: int = 7,
+        snapshot_path: Optional[str] = None,
+        sync_interval: float = 1.0,
+        compact_bytes: int = 1 << 20,
+    ):
+        self.filter = CountingBloomFilter(size, hashes)
+        self.snapshot_path = snapshot_path
+        self.log_path = f"{snapshot_path}.log" if snapshot_path else None
+        self.sync_interval = sync_interval
+        self.compact_bytes = max(1, compact_bytes)
+        self._entries: Dict[str, float] = {}
+        self._expiry: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+        # 마지막으로 반영한 로그/스냅샷 파일 버전과 로그에서 읽은 위치
+        self._log_version: Optional[Tuple[Any, Any]] = None
+        self._log_offset = 0
+        self._sync_task: Optional[asyncio.Task] = None
+        self.filter_hits = 0
+        self.false_positives = 0
+        self.compactions = 0
+
+    @classmethod
+    def from_env(cls) -> "TokenRevocationList":
+        return cls(
+            size=int(os.getenv("REVOCATION_BLOOM_SIZE", str(1 << 20))),
+            hashes=int(os.getenv("REVOCATION_BLOOM_HASHES", "7")),
+            snapshot_path=os.getenv("REVOCATION_SNAPSHOT_PATH", "/tmp/gateway_revocations.bin") or None,
+            sync_interval=float(os.getenv("REVOCATION_SYNC_INTERVAL", "1.0")),
+            compact_bytes=int(os.getenv("REVOCATION_COMPACT_BYTES", str(1 << 20))),
+        )
+
+    def start(self) -> None:
+        """스냅샷과 로그를 읽은 뒤 주기적 동기화 작업 시작"""
+        self.sync()
+        if self.snapshot_path and self._sync_task is None:
+            self._sync_task = asyncio.create_task(self._sync_loop())
+
+    async def stop(self) -> None:
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            try:
+                await self._sync_task
+            except asyncio.CancelledError:
+                pass
+            self._sync_task = None
+        if self.snapshot_path:
+            try:
+                self.compact(force=True)
+            except Exception as e:
+                logger.warning(f"Revocation log compaction failed: {str(e)}")
+
+    def revoke(self, jti: str, exp: float) -> None:
+        """토큰 ID 폐기 (exp 이후 자동 제거) 및 로그에 추가"""
+        if exp <= time.time():
+            return
+        with self._lock:
+            self._add(jti, float(exp))
+        if self.log_path:
+            self._append_log(jti, float(exp))
+
+    def is_revoked(self, jti: str) -> bool:
+        if self._expiry and self._expiry[0][0] <= time.time():
+            self.purge_expired()
+        if not self.filter.might_contain(jti):
+            return False
+        with self._lock:
+            self.filter_hits += 1
+            if jti in self._entries:
+                return True
+            self.false_positives += 1
+            return False
+
+    def _add(self, jti: str, exp: float) -> None:
+        if jti in self._entries:
+            self._entries[jti] = max(self._entries[jti], exp)
+            return
+        self._entries[jti] = exp
+        self.filter.add(jti)
+        heapq.heappush(self._expiry, (exp, jti))
+
+    def purge_expired(self) -> int:
+        """exp가 지난 항목을 필터와 맵에서 제거"""
+        now = time.time()
+        removed = 0
+        with self._lock:
+            while self._expiry and self._expiry[0][0] <= now:
+                _, jti = heapq.heappop(self._expiry)
+                exp = self._entries.get(jti)
+                if exp is None:
+                    continue
+                if exp > now:
+                    # 더 늦은 exp로 다시 폐기된 항목
+                    heapq.heappush(self._expiry, (exp, jti))
+                    continue
+                del self._entries[jti]
+                self.filter.remove(jti)
+                removed += 1
+        return removed
+
+    # --- 워커 간 공유 (추가 전용 로그 + 주기적 스냅샷) ---
+
+    async def _sync_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.sync_interval)
+            try:
+                self.sync()
+                if self._log_offset >= self.compact_bytes:
+                    self.compact()
+            except Exception as e:
+                logger.warning(f"Revocation log sync failed: {str(e)}")
+
+    def _file_lock(self, exclusive: bool, blocking: bool = True):
+        """
+        로그 파일 잠금 (추가는 공유 잠금, 압축은 배타 잠금)
+
+        잠금을 얻지 못하면(비차단 모드) None을 반환합니다.
+        """
+        import fcntl
+
+        lock_file = open(self.snapshot_path + ".lock", "a")
+        flags = (fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH) | (0 if blocking else fcntl.LOCK_NB)
+        try:
+            fcntl.flock(lock_file, flags)
+        except BlockingIOError:
+            lock_file.close()
+            return None
+        return lock_file
+
+    def _append_log(self, jti: str, exp: float) -> None:
+        """폐기 항목 한 줄을 로그 끝에 추가 (O_APPEND 한 번의 write로 워커 간 줄이 섞이지 않음)"""
+        record = (json.dumps([jti, exp], separators=(",", ":")) + "\n").encode("utf-8")
+        lock_file = self._file_lock(exclusive=False)
+        try:
+            # 압축 중에는 배타 잠금에 막히므로 항상 교체된 뒤의 현재 로그에 추가됨
+            fd = os.open(self.log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+            try:
+                os.write(fd, record)
+            finally:
+                os.close(fd)
+        finally:
+            lock_file.close()
+
+    def sync(self) -> None:
+        """다른 워커가 추가한 로그 항목 반영 (압축으로 로그가 교체되었으면 스냅샷부터 다시 읽음)"""
+        if not self.log_path:
+            return
+        try:
+            log_stat = os.stat(self.log_path)
+        except FileNotFoundError:
+            log_stat = None
+        try:
+            snapshot_stat = os.stat(self.snapshot_path)
+        except FileNotFoundError:
+            snapshot_stat = None
+        # 압축하면 스냅샷과 로그가 모두 새 파일로 바뀜 (inode가 재사용되어도 스냅샷 수정 시각은 달라짐)
+        version = (
+            log_stat.st_ino if log_stat else None,
+            (snapshot_stat.st_ino, snapshot_stat.st_mtime_ns) if snapshot_stat else None,
+        )
+        if version != self._log_version:
+            # 압축은 스냅샷을 먼저 쓰고 로그를 교체하므로 바뀐 로그를 보면 스냅샷도 이미 최신
+            self._load_snapshot()
+            self._log_version, self._log_offset = version, 0
+        if log_stat is not None and log_stat.st_size > self._log_offset:
+            self._read_log()
+
+    def _read_log(self) -> None:
+        with open(self.log_path, "rb") as f:
+            f.seek(self._log_offset)
+            data = f.read()
+        # 다른 워커가 쓰는 중인 마지막 줄은 다음 동기화에서 읽음
+        end = data.rfind(b"\n") + 1
+        if not end:
+            return
+        with self._lock:
+            for line in data[:end].splitlines():
+                try:
+                    jti, exp = json.loads(line)
+                except ValueError:
+                    logger.warning("Ignoring malformed revocation log record")
+                    continue
+                self._add(jti, float(exp))
+        self._log_offset += end
+
+    def _load_snapshot(self) -> None:
+        try:
+            snapshot = self._read_snapshot()
+        except FileNotFoundError:
+            return
+        if snapshot is not None:
+            self._merge(*snapshot)
+
+    def _read_snapshot(self) -> Optional[Tuple[int, int, bytes, Dict[str, float]]]:
+        with open(self.snapshot_path, "rb") as f:
+            data = f.read()
+        if len(data) < SNAPSHOT_HEADER.size:
+            return None
+        magic, size, hashes, entries_length = SNAPSHOT_HEADER.unpack_from(data)
+        if magic != SNAPSHOT_MAGIC:
+            logger.warning(f"Ignoring unknown revocation snapshot format: {self.snapshot_path}")
+            return None
+        offset = SNAPSHOT_HEADER.size
+        counters = data[offset:offset + size]
+        entries = json.loads(data[offset + size:offset + size + entries_length])
+        return size, hashes, counters, entries
+
+    def _merge(self, size: int, hashes: int, counters: bytes, entries: Dict[str, float]) -> None:
+        now = time.time()
+        with self._lock:
+            local_only = {jti: exp for jti, exp in self._entries.items() if jti not in entries and exp > now}
+            same_shape = size == self.filter.size and hashes == self.filter.hashes and len(counters) == size
+            if same_shape and not local_only:
+                # 스냅샷의 필터를 그대로 사용 (다시 해시하지 않음)
+                self.filter = CountingBloomFilter(size, hashes, bytearray(counters))
+                self._entries = dict(entries)
+                self._expiry = [(exp, jti) for jti, exp in entries.items()]
+                heapq.heapify(self._expiry)
+            else:
+                self.filter = CountingBloomFilter(self.filter.size, self.filter.hashes)
+                self._entries, self._expiry = {}, []
+                for jti, exp in {**entries, **local_only}.items():
+                    self._add(jti, exp)
+
+    def compact(self, force: bool = False) -> bool:
+        """
+        로그를 스냅샷으로 압축하고 로그를 빈 파일로 교체
+
+        배타 잠금 아래에서 로그 끝까지 반영한 상태를 스냅샷으로 쓰고 로그를 교체합니다.
+        force가 아니면 다른 워커가 이미 압축 중일 때 기다리지 않고 건너뜁니다.
+        """
+        if not self.snapshot_path:
+            return False
+        lock_file = self._file_lock(exclusive=True, blocking=force)
+        if lock_file is None:
+            return False
+        try:
+            self.sync()
+            if not self._log_offset:
+                # 이미 다른 워커가 압축했거나 추가된 항목이 없음
+                return False
+            self.purge_expired()
+            with self._lock:
+                entries = json.dumps(self._entries, separators=(",", ":")).encode("utf-8")
+                header = SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, self.filter.size, self.filter.hashes, len(entries))
+                payload = header + bytes(self.filter.counters) + entries
+            temp_path = f"{self.snapshot_path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(payload)
+            os.replace(temp_path, self.snapshot_path)
+
+            temp_log = f"{self.log_path}.{os.getpid()}.tmp"
+            open(temp_log, "wb").close()
+            os.replace(temp_log, self.log_path)
+            self._log_version, self._log_offset = None, 0
+            self.sync()
+            self.compactions += 1
+            return True
+        finally:
+            lock_file.close()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "revoked": len(self._entries),
+                "filter_size": self.filter.size,
+                "filter_hashes": self.filter.hashes,
+                "filter_hits": self.filter_hits,
+                "false_positives": self.false_positives,
+                "snapshot_path": self.snapshot_path,
+                "log_offset": self._log_offset,
+                "compactions": self.compactions,
+            }
@@ -0,0 +1,161 @@
+# gateway/app/domain/service/session_store.py
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class SessionStore(ABC):
+    """
+    서버 측 세션 저장소 인터페이스
+
+    쿠키에는 불투명한 세션 ID만 담고 세션 데이터는 저장소에 보관합니다.
+    세션 ID는 추측할 수 없는 난수이므로 서명 없이 그대로 키로 사용합니다.
+    blocking이 True인 저장소는 디스크 I/O를 하므로 미들웨어가 스레드 풀에서 호출합니다.
+    """
+
+    blocking = False
+
+    @abstractmethod
+    def load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """세션 데이터 조회 (없거나 만료되었으면 None)"""
+
+    @abstractmethod
+    def save(self, session_id: str, data: Dict[str, Any], ttl: int) -> None:
+        """세션 데이터 저장 (ttl초 후 만료)"""
+
+    @abstractmethod
+    def delete(self, session_id: str) -> None:
+        """세션 데이터 삭제"""
+
+    def stats(self) -> Dict[str, Any]:
+        return {}
+
+    def close(self) -> None:
+        pass
+
+
+class MemorySessionStore(SessionStore):
+    """프로세스 메모리 LRU 세션 저장소 (항목별 TTL, 단일 인스턴스용)"""
+
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max(1, max_size)
+        self._entries: "OrderedDict[str, tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+            expires_at, data = entry
+            if expires_at <= time.time():
+                del self._entries[session_id]
+                return None
+            self._entries.move_to_end(session_id)
+            return dict(data)
+
+    def save(self, session_id: str, data: Dict[str, Any], ttl: int) -> None:
+        with self._lock:
+            self._entries[session_id] = (time.time() + ttl, dict(data))
+            self._entries.move_to_end(session_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "backend": "memory",
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "evictions": self.evictions,
+            }
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    로컬 SQLite 세션 저장소 (재시작 및 같은 호스트의 여러 워커 프로세스 간 공유)
+
+    만료된 세션은 조회 시 무시되며, purge_interval번 저장할 때마다 한 번씩 일괄 삭제됩니다.
+    """
+
+    blocking = True
+
+    def __init__(self, path: str, purge_interval: int = 1000):
+        self.path = path
+        self.purge_interval = max(1, purge_interval)
+        self._writes = 0
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                " session_id TEXT PRIMARY KEY,"
+                " data TEXT NOT NULL,"
+                " expires_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_expires_at ON sessions (expires_at)")
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 연결은 스레드 간 공유하지 않고 스레드마다 하나씩 유지
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        row = self._connection().execute(
+            "SELECT data FROM sessions WHERE session_id = ? AND expires_at > ?",
+            (session_id, time.time()),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save(self, session_id: str, data: Dict[str, Any], ttl: int) -> None:
+        conn = self._connection()
+        now = time.time()
+        conn.execute(
+            "INSERT INTO sessions (session_id, data, expires_at) VALUES (?, ?, ?)"
+            " ON CONFLICT(session_id) DO UPDATE SET data = excluded.data, expires_at = excluded.expires_at",
+            (session_id, json.dumps(data, separators=(",", ":")), now + ttl),
+        )
+        self._writes += 1
+        if self._writes % self.purge_interval == 0:
+            conn.execute("DELETE FROM sessions WHERE expires_at <= ?", (now,))
+
+    def delete(self, session_id: str) -> None:
+        self._connection().execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+
+    def stats(self) -> Dict[str, Any]:
+        size = self._connection().execute(
+            "SELECT COUNT(*) FROM sessions WHERE expires_at > ?", (time.time(),)
+        ).fetchone()[0]
+        return {"backend": "sqlite", "path": self.path, "size": size}
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def create_session_store(backend: str) -> SessionStore:
+    """SESSION_BACKEND 값(memory | sqlite)에 맞는 세션 저장소 생성"""
+    if backend == "memory":
+        return MemorySessionStore(max_size=int(os.getenv("SESSION_MAX_ENTRIES", "10000")))
+    if backend == "sqlite":
+        return SQLiteSessionStore(os.getenv("SESSION_SQLITE_PATH", "/tmp/gateway_sessions.db"))
+    raise ValueError(f"Unknown session backend: {backend}")
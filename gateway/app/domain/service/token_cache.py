@@ -0,0 +1,230 @@
+# gateway/app/domain/service/token_cache.py
+
+import os
+import json
+import mmap
+import struct
+import fcntl
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+
+class VerifiedTokenCache:
+    """
+    검증이 끝난 JWT 페이로드를 보관하는 LRU 캐시
+
+    토큰 원문 대신 SHA-256 다이제스트를 키로 사용하며,
+    각 항목은 토큰 자체의 `exp` 시각에 만료됩니다.
+    """
+
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max(0, max_size)
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def digest(token: str) -> str:
+        """토큰 원문을 캐시 키로 변환"""
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """캐시된 페이로드 조회 (만료되었거나 없으면 None)"""
+        if not self.max_size:
+            return None
+
+        key = self.digest(token)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, payload = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(payload)
+
+    def peek(self, token: str) -> Optional[Dict[str, Any]]:
+        """적중/실패 카운터와 LRU 순서를 바꾸지 않고 유효한 페이로드 조회"""
+        entry = self._entries.get(self.digest(token)) if self.max_size else None
+        if entry is None or entry[0] <= time.time():
+            return None
+        return entry[1]
+
+    def put(self, token: str, payload: Dict[str, Any]) -> None:
+        """검증된 페이로드 저장 (exp 클레임이 없으면 저장하지 않음)"""
+        exp = payload.get("exp")
+        if not self.max_size or not exp:
+            return
+
+        expires_at = float(exp)
+        if expires_at <= time.time():
+            return
+
+        key = self.digest(token)
+        with self._lock:
+            self._entries[key] = (expires_at, dict(payload))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, token: str) -> None:
+        """특정 토큰을 캐시에서 제거"""
+        with self._lock:
+            self._entries.pop(self.digest(token), None)
+
+    def clear(self) -> None:
+        """캐시 전체 비우기"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중/실패 카운터"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            }
+
+
+class SharedMemoryTokenCache(VerifiedTokenCache):
+    """
+    여러 워커 프로세스가 공유하는 mmap 검증 토큰 캐시 (/dev/shm 파일)
+
+    한 워커가 검증한 토큰은 다른 워커에서도 적중하므로 워커 수를 늘려도 서명 검증 횟수가 늘지 않습니다.
+    키 해시로 고정 크기 슬롯에 직접 매핑하며(충돌 시 덮어씀), 쓰기는 슬롯 단위 파일 잠금으로 직렬화하고
+    읽기는 잠금 없이 버전 번호(seqlock)로 쓰는 중이거나 도중에 바뀐 슬롯을 걸러냅니다.
+    키는 namespace(JWT 서명 키)로 키잉한 해시이므로 다른 서명 키로 검증된 이전 항목은 적중하지 않습니다.
+    적중/실패 카운터는 워커별 값입니다 (전체 합계는 Prometheus 메트릭 참고).
+    """
+
+    SLOT_HEADER = struct.Struct("<Q32sdH")  # 버전(홀수면 쓰는 중), 키 해시, 만료 시각(exp), 페이로드 길이
+
+    def __init__(self, path: str, slots: int = 10000, slot_bytes: int = 1024, namespace: str = ""):
+        super().__init__(max_size=slots)
+        self.path = path
+        self.slot_bytes = max(self.SLOT_HEADER.size + 64, slot_bytes)
+        self.payload_limit = self.slot_bytes - self.SLOT_HEADER.size
+        self.namespace = hashlib.sha256(namespace.encode("utf-8")).digest()
+        self.oversized = 0
+        size = self.slot_bytes * self.max_size
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        if os.fstat(self._fd).st_size < size:
+            os.ftruncate(self._fd, size)
+        self._mmap = mmap.mmap(self._fd, size)
+
+    def _key(self, token: str) -> Tuple[bytes, int]:
+        key = hashlib.blake2b(token.encode("utf-8"), digest_size=32, key=self.namespace).digest()
+        return key, (int.from_bytes(key[:8], "little") % self.max_size) * self.slot_bytes
+
+    def _read(self, token: str) -> Optional[Dict[str, Any]]:
+        key, offset = self._key(token)
+        version, stored_key, expires_at, length = self.SLOT_HEADER.unpack_from(self._mmap, offset)
+        if version & 1 or stored_key != key or expires_at <= time.time():
+            return None
+        start = offset + self.SLOT_HEADER.size
+        data = self._mmap[start:start + length]
+        if self.SLOT_HEADER.unpack_from(self._mmap, offset)[0] != version:
+            # 읽는 도중 다른 워커가 슬롯을 덮어씀
+            return None
+        return json.loads(data)
+
+    def _write(self, offset: int, key: bytes, expires_at: float, data: bytes) -> None:
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, self.slot_bytes, offset)
+        try:
+            version = self.SLOT_HEADER.unpack_from(self._mmap, offset)[0]
+            self.SLOT_HEADER.pack_into(self._mmap, offset, version + 1, key, expires_at, len(data))
+            start = offset + self.SLOT_HEADER.size
+            self._mmap[start:start + len(data)] = data
+            self.SLOT_HEADER.pack_into(self._mmap, offset, version + 2, key, expires_at, len(data))
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, self.slot_bytes, offset)
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        payload = self._read(token)
+        if payload is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return payload
+
+    def peek(self, token: str) -> Optional[Dict[str, Any]]:
+        return self._read(token)
+
+    def put(self, token: str, payload: Dict[str, Any]) -> None:
+        exp = payload.get("exp")
+        if not exp or float(exp) <= time.time():
+            return
+
+        data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        if len(data) > self.payload_limit:
+            self.oversized += 1
+            return
+
+        key, offset = self._key(token)
+        stored_key, stored_expires_at = self.SLOT_HEADER.unpack_from(self._mmap, offset)[1:3]
+        if stored_key != key and stored_expires_at > time.time():
+            self.evictions += 1
+        self._write(offset, key, float(exp), data)
+
+    def invalidate(self, token: str) -> None:
+        key, offset = self._key(token)
+        if self.SLOT_HEADER.unpack_from(self._mmap, offset)[1] == key:
+            self._write(offset, bytes(32), 0.0, b"")
+
+    def clear(self) -> None:
+        for index in range(self.max_size):
+            self._write(index * self.slot_bytes, bytes(32), 0.0, b"")
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.time()
+        size = sum(
+            1 for index in range(self.max_size)
+            if self.SLOT_HEADER.unpack_from(self._mmap, index * self.slot_bytes)[2] > now
+        )
+        total = self.hits + self.misses
+        return {
+            "backend": "shm",
+            "path": self.path,
+            "size": size,
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "oversized": self.oversized,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            "pid": os.getpid(),
+        }
+
+
+def create_token_cache(backend: str, namespace: str = "") -> VerifiedTokenCache:
+    """TOKEN_CACHE_BACKEND 값(memory | shm)에 맞는 검증 토큰 캐시 생성 (TOKEN_CACHE_MAX_SIZE=0이면 비활성화)"""
+    max_size = int(os.getenv("TOKEN_CACHE_MAX_SIZE", "10000"))
+    if backend == "memory" or max_size <= 0:
+        return VerifiedTokenCache(max_size=max_size)
+    if backend == "shm":
+        return SharedMemoryTokenCache(
+            os.getenv("TOKEN_CACHE_SHM_PATH", "/dev/shm/gateway_token_cache"),
+            slots=max_size,
+            slot_bytes=int(os.getenv("TOKEN_CACHE_SHM_SLOT_BYTES", "1024")),
+            namespace=namespace,
+        )
+    raise ValueError(f"Unknown token cache backend: {backend}")
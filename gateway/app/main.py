@@ -1,51 +1,157 @@
 # gateway/main.py
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 import os
+import logging
 from dotenv import load_dotenv
-from app.router.auth_router import auth_router
 
+# 라우터 import 시점에 컨트롤러/서비스가 환경 변수를 읽으므로 .env를 먼저 로드
 load_dotenv()
 
-app = FastAPI()
+from app.router.auth_router import auth_router, auth_controller
+from app.router.gateway_router import gateway_router, registry_router, gateway_controller
+from app.domain.service.http_client import create_http_client
+from app.domain.service.session_store import create_session_store
+from app.middleware.session import ServerSessionMiddleware
+from app.middleware.cors import DEFAULT_ALLOW_METHODS, OriginPolicyCORSMiddleware
+from app.middleware.rate_limit import (
+    DEFAULT_POLICIES, DEFAULT_TRUSTED_PROXIES, AdaptiveConcurrencyLimiter, RateLimitMiddleware,
+    create_bucket_store, parse_networks, parse_policies,
+)
+from app.metrics import MetricsMiddleware, metrics_endpoint
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 생명주기 관리"""
+    # 구글 OAuth 호출용 공유 커넥션 풀 생성 후 AuthService에 주입
+    http_client = create_http_client("OUTBOUND_HTTP")
+    app.state.http_client = http_client
+    auth_controller.auth_service.bind_http_client(http_client)
+
+    # 사용자/OAuth 세션 저장소 (비동기 커넥션 풀 + 백그라운드 배치 flush)
+    auth_repository = auth_controller.auth_service.auth_repository
+    await auth_repository.start()
+
+    # 로그아웃 토큰 폐기 목록 (다른 워커와 스냅샷 파일로 동기화)
+    revocation_list = auth_controller.auth_service.revocation_list
+    revocation_list.start()
+
+    # id_token 로컬 검증 모드에서는 구글 공개키를 미리 받아두고 주기적으로 갱신
+    jwks_cache = auth_controller.auth_service.jwks_cache
+    if auth_controller.auth_service.verify_id_token_locally:
+        jwks_cache.start()
+
+    # 다운스트림 서비스 프록시용 keep-alive 커넥션 풀 (대용량 스트리밍을 위해 읽기 타임아웃을 길게 설정)
+    upstream_client = create_http_client("UPSTREAM_HTTP", max_keepalive_connections=100, read_timeout=300.0)
+    gateway_controller.proxy_service.bind_http_client(upstream_client)
+
+    # 서비스 레지스트리 헬스 체크 (실패한 인스턴스 자동 제외)
+    registry_service = gateway_controller.registry_service
+    registry_service.bind_http_client(upstream_client)
+    registry_service.start()
+
+    yield
+
+    await registry_service.stop()
+    await jwks_cache.stop()
+    await revocation_list.stop()
+    gateway_controller.proxy_service.bind_http_client(None)
+    await upstream_client.aclose()
+    auth_controller.auth_service.bind_http_client(None)
+    await http_client.aclose()
+    await auth_repository.stop()
+
+
+app = FastAPI(lifespan=lifespan)
 
 # --- 설정값 로드 ---
-# 환경 변수에서 콤마(,)로 구분된 여러 URL을 하나의 문자열로 가져옵니다.
-# 변수 이름도 복수형인 FRONTEND_URLS로 변경하여 명확하게 합니다.
-FRONTEND_URLS_STR = os.getenv("FRONTEND_URLS", "http://localhost:3000")
+# 허용 Origin은 FRONTEND_URLS(콤마 구분, https://*.example.com 형식의 서브도메인 와일드카드 허용)에서
+# AuthController가 한 번 파싱한 OriginPolicy를 CORS 미들웨어와 함께 사용합니다.
+ORIGIN_POLICY = auth_controller.origin_policy
 
-# 가져온 문자열을 콤마(,) 기준으로 잘라서 파이썬 리스트로 만듭니다.
-# 이렇게 하면 여러 개의 출처(origin)를 동적으로 관리할 수 있습니다.
-ALLOWED_ORIGINS = [url.strip() for url in FRONTEND_URLS_STR.split(',')]
+# 프리플라이트 결과 캐시 시간 (초, 브라우저별 상한 적용)
+CORS_MAX_AGE = int(os.getenv("CORS_MAX_AGE", "86400"))
+CORS_ALLOW_METHODS = [m.strip() for m in os.getenv("CORS_ALLOW_METHODS", ",".join(DEFAULT_ALLOW_METHODS)).split(",") if m.strip()]
+# 비워두면 프리플라이트에서 요청한 헤더를 그대로 허용
+CORS_ALLOW_HEADERS = [h.strip() for h in os.getenv("CORS_ALLOW_HEADERS", "").split(",") if h.strip() and h.strip() != "*"]
 
 SESSION_SECRET_KEY = os.getenv("SESSION_SECRET_KEY", "your-secret-key")
 
+# 세션 저장 방식: memory(기본) | sqlite - 쿠키에는 세션 ID만 담김
+# cookie를 지정하면 기존처럼 세션 전체를 서명된 쿠키에 담음
+SESSION_BACKEND = os.getenv("SESSION_BACKEND", "memory").lower()
+SESSION_MAX_AGE = int(os.getenv("SESSION_MAX_AGE", "86400"))  # 24시간
+
+# 요청 제한: 경로별 토큰 버킷 + 적응형 동시 처리 한도 (RATE_LIMIT_BACKEND=shm이면 워커 간 버킷 공유)
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+CONCURRENCY_LIMIT_ENABLED = os.getenv("CONCURRENCY_LIMIT_ENABLED", "true").lower() == "true"
+
 # 현재 환경이 프로덕션(배포) 환경인지 확인합니다.
 IS_PRODUCTION = os.getenv("RAILWAY_ENVIRONMENT") == "production"
 
+# X-Forwarded-For를 신뢰할 프록시 대역 (프로덕션은 Railway 프록시 뒤이므로 사설망 대역을 기본으로 신뢰)
+# 비워두면 연결 상대 IP를 그대로 쓰므로, 프록시 뒤에서는 모든 클라이언트가 IP 기준 버킷 하나를 나눠 쓰게 됨
+RATE_LIMIT_TRUSTED_PROXIES = parse_networks(
+    os.getenv("RATE_LIMIT_TRUSTED_PROXIES", DEFAULT_TRUSTED_PROXIES if IS_PRODUCTION else "")
+)
+if RATE_LIMIT_ENABLED and IS_PRODUCTION and not RATE_LIMIT_TRUSTED_PROXIES:
+    logger.warning(
+        "RATE_LIMIT_TRUSTED_PROXIES is empty in production; behind a reverse proxy every client shares "
+        "the proxy IP, so IP-keyed rate limits act as global limits"
+    )
 
-# --- 미들웨어 설정 ---
 
-# CORS 설정: 위에서 만든 리스트(ALLOWED_ORIGINS)를 사용합니다.
-# 이제 여기에 포함된 모든 주소에서의 요청을 허용합니다.
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=ALLOWED_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# --- 미들웨어 설정 ---
 
-# 세션 미들웨어 추가 (기존과 동일)
+# 요청 제한 (CORS 안쪽에 두어 429/503 응답에도 CORS 헤더가 붙도록 먼저 추가)
+if RATE_LIMIT_ENABLED or CONCURRENCY_LIMIT_ENABLED:
+    app.add_middleware(
+        RateLimitMiddleware,
+        policies=parse_policies(os.getenv("RATE_LIMIT_POLICIES", DEFAULT_POLICIES)) if RATE_LIMIT_ENABLED else [],
+        store=create_bucket_store(os.getenv("RATE_LIMIT_BACKEND", "memory").lower()),
+        limiter=AdaptiveConcurrencyLimiter.from_env() if CONCURRENCY_LIMIT_ENABLED else None,
+        token_cache=auth_controller.auth_service.token_cache,
+        exempt_paths=[p.strip() for p in os.getenv("RATE_LIMIT_EXEMPT_PATHS", "/health,/metrics").split(",") if p.strip()],
+        trusted_proxies=RATE_LIMIT_TRUSTED_PROXIES,
+    )
+
+# 세션 미들웨어 추가
+if SESSION_BACKEND == "cookie":
+    app.add_middleware(
+        SessionMiddleware,
+        secret_key=SESSION_SECRET_KEY,
+        session_cookie="session",
+        max_age=SESSION_MAX_AGE,
+        same_site="none" if IS_PRODUCTION else "lax",
+        https_only=IS_PRODUCTION,
+    )
+else:
+    app.add_middleware(
+        ServerSessionMiddleware,
+        store=create_session_store(SESSION_BACKEND),
+        session_cookie="session",
+        max_age=SESSION_MAX_AGE,
+        same_site="none" if IS_PRODUCTION else "lax",
+        https_only=IS_PRODUCTION,
+    )
+
+
+# 요청 지연 시간/처리 중 요청 수 기록 (CORS 바로 안쪽에서 전체 처리 시간을 측정)
+app.add_middleware(MetricsMiddleware)
+
+# CORS 설정: 가장 바깥에 두어 OPTIONS 요청은 세션/메트릭/라우터를 거치지 않고 바로 응답
+# (프리플라이트 수는 gateway_cors_preflight_total 메트릭으로 집계)
 app.add_middleware(
-    SessionMiddleware,
-    secret_key=SESSION_SECRET_KEY,
-    session_cookie="session",
-    max_age=86400,  # 24시간
-    same_site="none" if IS_PRODUCTION else "lax",
-    https_only=IS_PRODUCTION,
+    OriginPolicyCORSMiddleware,
+    policy=ORIGIN_POLICY,
+    allow_methods=CORS_ALLOW_METHODS,
+    allow_headers=CORS_ALLOW_HEADERS or None,
+    max_age=CORS_MAX_AGE,
 )
 
 
@@ -53,12 +159,22 @@ app.add_middleware(
 
 # 라우터 등록 (기존과 동일)
 app.include_router(auth_router, tags=["auth"])
+app.include_router(gateway_router)
+
+# 서비스 레지스트리: 토큰이 없으면 누구나 업스트림을 등록해 사용자 트래픽을 가로챌 수 있으므로 아예 등록하지 않음
+if gateway_controller.registry_service.enabled:
+    app.include_router(registry_router)
+else:
+    logger.warning("REGISTRY_TOKEN is not set; /registry endpoints are disabled (use GATEWAY_ROUTES for static routing)")
 
 @app.get("/health")
 async def health_check():
     """Gateway 서비스 헬스 체크"""
     return {"status": "healthy", "service": "gateway"}
 
+# Prometheus 메트릭 (텍스트 노출 형식)
+app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+
 @app.get("/")
 async def root():
     return {"message": "Gateway Service"}
\ No newline at end of file
@@ -0,0 +1,58 @@
+# gateway/app/metrics.py
+
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from prometheus_client import Counter, Gauge, Histogram
+
+# 공통 HTTP 메트릭과 미들웨어는 common/metrics_base.py의 복사본 (make sync-common)
+from .metrics_base import (  # noqa: F401
+    LATENCY_BUCKETS, REQUEST_LATENCY, REQUESTS_IN_FLIGHT, MetricsMiddleware, collect_registry, metrics_endpoint,
+    route_template,
+)
+
+OUTBOUND_LATENCY = Histogram(
+    "outbound_request_duration_seconds",
+    "외부 API 호출 시간 (구글 OAuth 토큰 교환, 사용자 정보, JWKS)",
+    ["target", "outcome"],
+    buckets=LATENCY_BUCKETS,
+)
+UPSTREAM_LATENCY = Histogram(
+    "gateway_upstream_response_seconds",
+    "다운스트림 서비스 응답 헤더 수신까지의 시간",
+    ["service", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+TOKEN_VERIFICATIONS = Counter(
+    "gateway_token_verifications_total",
+    "JWT 검증 결과 (cache_hit / verified / revoked / rejected)",
+    ["result"],
+)
+RATE_LIMITED = Counter(
+    "gateway_rate_limited_total",
+    "요청 제한으로 거절된 요청 수 (rate: 토큰 버킷 429 / concurrency: 동시 처리 한도 503)",
+    ["reason", "policy"],
+)
+CORS_PREFLIGHTS = Counter(
+    "gateway_cors_preflight_total",
+    "라우터를 거치지 않고 응답한 CORS 프리플라이트 요청 수 (allowed / rejected)",
+    ["result"],
+)
+CONCURRENCY_LIMIT = Gauge(
+    "gateway_concurrency_limit",
+    "적응형 동시 처리 한도 현재 값 (멀티 워커에서는 워커별 한도의 합)",
+    multiprocess_mode="livesum",
+)
+
+
+@contextmanager
+def observe_outbound(target: str) -> Iterator[None]:
+    """외부 호출 시간 기록 (예외가 전파되면 outcome=error)"""
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        OUTBOUND_LATENCY.labels(target, outcome).observe(time.perf_counter() - started)
@@ -0,0 +1,104 @@
+# gateway/app/metrics_base.py
+# 자동 생성 파일: common/metrics_base.py를 수정한 뒤 make sync-common으로 다시 만드세요.
+#
+# Gateway와 각 서비스가 공유하는 HTTP 메트릭 (미들웨어, 레지스트리, /metrics 엔드포인트)
+# 서비스별 메트릭은 각 서비스의 metrics.py에 두고, 이 파일은 make sync-common으로 각 서비스에 복사합니다.
+# 서비스마다 import 방식(패키지 상대 경로 / app 디렉터리 절대 경로)이 달라 외부 라이브러리만 import 합니다.
+
+import os
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Gauge, Histogram, generate_latest, multiprocess
+)
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# 지연 시간 히스토그램 버킷 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간 (라우트 템플릿 기준)",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "처리 중인 HTTP 요청 수",
+    ["method", "route"],
+    multiprocess_mode="livesum",
+)
+
+UNMATCHED_ROUTE = "unmatched"
+
+# prometheus_client는 import 시점의 이 값으로 값 저장 방식(mmap 파일)을 정하므로 같은 시점의 값을 사용
+PROMETHEUS_MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+
+
+def route_template(scope: Scope) -> str:
+    """요청 경로에 대응하는 라우트 템플릿 (경로 파라미터로 인한 레이블 폭증 방지)"""
+    app = scope.get("app")
+    router = getattr(app, "router", None)
+    for route in getattr(router, "routes", ()):
+        match, _ = route.matches(scope)
+        if match != Match.NONE:
+            return getattr(route, "path", UNMATCHED_ROUTE)
+    return UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """
+    요청 지연 시간 히스토그램과 처리 중 요청 게이지를 기록하는 ASGI 미들웨어
+
+    스트리밍 응답은 본문 전송이 끝날 때까지를 처리 시간으로 봅니다.
+    """
+
+    def __init__(self, app: ASGIApp, excluded_paths: tuple = ("/metrics",)):
+        self.app = app
+        self.excluded_paths = frozenset(excluded_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        route = route_template(scope)
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_flight = REQUESTS_IN_FLIGHT.labels(method, route)
+        in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_flight.dec()
+            REQUEST_LATENCY.labels(method, route, str(status_code)).observe(time.perf_counter() - started)
+
+
+def collect_registry() -> CollectorRegistry:
+    """
+    노출할 메트릭 레지스트리
+
+    PROMETHEUS_MULTIPROC_DIR가 설정된 멀티 워커 모드에서는 각 워커가 공유 디렉터리의 mmap 파일에 기록한 값을
+    합산하므로, 어느 워커가 스크레이프 요청을 받아도 전체 워커의 값이 노출됩니다.
+    """
+    if not PROMETHEUS_MULTIPROC_DIR:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    """Prometheus 텍스트 노출 형식"""
+    return Response(content=generate_latest(collect_registry()), headers={"Content-Type": CONTENT_TYPE_LATEST})
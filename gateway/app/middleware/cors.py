@@ -0,0 +1,99 @@
+# gateway/app/middleware/cors.py
+
+from typing import List, Optional, Sequence, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..domain.service.origin_policy import OriginPolicy
+from ..metrics import CORS_PREFLIGHTS
+
+DEFAULT_ALLOW_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+
+
+class OriginPolicyCORSMiddleware:
+    """
+    OriginPolicy 기반 CORS 미들웨어 (starlette CORSMiddleware 대체)
+
+    - OPTIONS 요청은 라우터나 안쪽 미들웨어를 거치지 않고 여기서 바로 응답합니다.
+    - 프리플라이트 응답에 긴 Access-Control-Max-Age를 붙여 브라우저가 프리플라이트 결과를 캐시하도록 합니다.
+      (브라우저별 상한: Chrome 2시간, Firefox 24시간)
+    - 허용된 Origin만 응답 헤더에 그대로 되돌려주고, 자격 증명(쿠키)을 허용합니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        policy: OriginPolicy,
+        allow_methods: Sequence[str] = DEFAULT_ALLOW_METHODS,
+        allow_headers: Optional[Sequence[str]] = None,
+        expose_headers: Sequence[str] = (),
+        max_age: int = 86400,
+    ):
+        self.app = app
+        self.policy = policy
+        self.allow_methods = ", ".join(allow_methods)
+        # None이면 요청한 헤더를 그대로 허용 (allow_headers=["*"]와 동일)
+        self.allow_headers = ", ".join(allow_headers) if allow_headers else None
+        # 응답마다 다시 만들지 않도록 고정 헤더를 미리 인코딩
+        self.preflight_headers: List[Tuple[bytes, bytes]] = [
+            (b"access-control-allow-methods", self.allow_methods.encode("latin-1")),
+            (b"access-control-allow-credentials", b"true"),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+            (b"vary", b"Origin, Access-Control-Request-Headers"),
+            (b"content-length", b"0"),
+        ]
+        self.expose_headers = ", ".join(expose_headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        origin = headers.get("origin")
+
+        if scope["method"] == "OPTIONS":
+            await self.options(origin, headers, send)
+            return
+
+        if origin is None or not self.policy.is_allowed(origin):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                response_headers["Access-Control-Allow-Origin"] = origin
+                response_headers["Access-Control-Allow-Credentials"] = "true"
+                if self.expose_headers:
+                    response_headers["Access-Control-Expose-Headers"] = self.expose_headers
+                response_headers.add_vary_header("Origin")
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def options(self, origin: Optional[str], headers: Headers, send: Send) -> None:
+        """OPTIONS 요청 즉시 응답 (프리플라이트면 CORS 허용 헤더, 아니면 Allow 헤더만)"""
+        request_method = headers.get("access-control-request-method")
+        if origin is None or request_method is None:
+            await self._respond(send, 204, [(b"allow", self.allow_methods.encode("latin-1")), (b"content-length", b"0")])
+            return
+
+        if not self.policy.is_allowed(origin):
+            CORS_PREFLIGHTS.labels("rejected").inc()
+            await self._respond(send, 400, [(b"content-length", b"0"), (b"vary", b"Origin")])
+            return
+
+        CORS_PREFLIGHTS.labels("allowed").inc()
+        response_headers = [(b"access-control-allow-origin", origin.encode("latin-1")), *self.preflight_headers]
+        requested_headers = headers.get("access-control-request-headers")
+        allow_headers = self.allow_headers or requested_headers
+        if allow_headers:
+            response_headers.append((b"access-control-allow-headers", allow_headers.encode("latin-1")))
+        await self._respond(send, 204, response_headers)
+
+    @staticmethod
+    async def _respond(send: Send, status: int, headers: List[Tuple[bytes, bytes]]) -> None:
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
@@ -0,0 +1,342 @@
+# gateway/app/middleware/rate_limit.py
+
+import os
+import math
+import mmap
+import time
+import struct
+import hashlib
+import logging
+import ipaddress
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from starlette.requests import HTTPConnection
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..domain.service.token_cache import VerifiedTokenCache
+from ..metrics import CONCURRENCY_LIMIT, RATE_LIMITED
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLICIES = "/auth/google=5/1s:20,/auth=50/1s:100,/api=20/1s:50"
+PERIOD_UNITS = {"s": 1, "m": 60, "h": 3600}
+# 프로덕션(Railway 등 리버스 프록시 뒤)에서 X-Forwarded-For를 신뢰할 기본 프록시 대역 (사설망/CGNAT/루프백)
+DEFAULT_TRUSTED_PROXIES = "10.0.0.0/8,172.16.0.0/12,192.168.0.0/16,100.64.0.0/10,127.0.0.0/8,::1/128,fc00::/7"
+
+Network = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+def parse_networks(config: str) -> List[Network]:
+    """콤마로 구분한 CIDR 목록 파싱 (잘못된 항목은 경고 후 무시)"""
+    networks = []
+    for entry in filter(None, (item.strip() for item in config.split(","))):
+        try:
+            networks.append(ipaddress.ip_network(entry, strict=False))
+        except ValueError:
+            logger.warning(f"Ignoring malformed trusted proxy network: '{entry}'")
+    return networks
+
+
+@dataclass(frozen=True)
+class RatePolicy:
+    """경로 접두사별 토큰 버킷 정책 (초당 rate개 보충, 최대 burst개)"""
+    prefix: str
+    rate: float
+    burst: float
+
+    def matches(self, path: str) -> bool:
+        return path == self.prefix or path.startswith(self.prefix.rstrip("/") + "/")
+
+
+def parse_policies(config: str) -> List[RatePolicy]:
+    """
+    RATE_LIMIT_POLICIES 파싱 (가장 긴 접두사가 먼저 매칭되도록 정렬)
+
+    형식: /auth/google=5/1s:20,/api=20/1s:50  (접두사=요청 수/기간[:버스트], 기간 단위 s|m|h)
+    버스트를 생략하면 기간당 요청 수와 같습니다.
+    """
+    policies = []
+    for entry in filter(None, (item.strip() for item in config.split(","))):
+        try:
+            prefix, _, spec = entry.partition("=")
+            limit, _, burst = spec.partition(":")
+            count, _, period = limit.partition("/")
+            period = period or "1s"
+            unit = period[-1] if period[-1] in PERIOD_UNITS else "s"
+            seconds = float(period.rstrip("smh") or 1) * PERIOD_UNITS[unit]
+            if float(count) <= 0 or seconds <= 0:
+                raise ValueError(entry)
+            policies.append(RatePolicy(
+                prefix="/" + prefix.strip().strip("/"),
+                rate=float(count) / seconds,
+                burst=float(burst or count),
+            ))
+        except (ValueError, IndexError):
+            logger.warning(f"Ignoring malformed rate limit policy: '{entry}'")
+    return sorted(policies, key=lambda policy: len(policy.prefix), reverse=True)
+
+
+def _take(tokens: float, updated: float, rate: float, burst: float, now: float) -> Tuple[float, float]:
+    """경과 시간만큼 보충한 뒤 1개 소비 → (남은 토큰, 재시도까지 초; 0이면 허용)"""
+    tokens = min(burst, tokens + max(0.0, now - updated) * rate)
+    if tokens >= 1.0:
+        return tokens - 1.0, 0.0
+    return tokens, (1.0 - tokens) / rate
+
+
+class MemoryBucketStore:
+    """
+    프로세스 내 토큰 버킷 저장소
+
+    이벤트 루프 한 스레드에서 await 없이 읽고 갱신하므로 잠금이 필요 없습니다.
+    키가 max_keys를 넘으면 이미 가득 찬(오래 쉬고 있는) 버킷부터 정리합니다.
+    """
+
+    def __init__(self, max_keys: int = 100000):
+        self.max_keys = max(1, max_keys)
+        # 키 → [토큰, 갱신 시각, 가득 차는 시각]
+        self._buckets: Dict[str, List[float]] = {}
+
+    def take(self, key: str, rate: float, burst: float) -> Tuple[bool, float]:
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.max_keys:
+                self._sweep(now)
+            bucket = self._buckets[key] = [burst, now, now]
+        tokens, retry_after = _take(bucket[0], bucket[1], rate, burst, now)
+        bucket[0], bucket[1], bucket[2] = tokens, now, now + (burst - tokens) / rate
+        return retry_after == 0.0, retry_after
+
+    def _sweep(self, now: float) -> None:
+        idle = [key for key, bucket in self._buckets.items() if bucket[2] <= now]
+        for key in idle:
+            del self._buckets[key]
+        if len(self._buckets) >= self.max_keys:
+            # 그래도 가득 차면 오래된 절반 제거 (dict는 삽입 순서 유지)
+            for key in list(self._buckets)[:len(self._buckets) // 2]:
+                del self._buckets[key]
+
+    def stats(self) -> Dict[str, object]:
+        return {"backend": "memory", "keys": len(self._buckets), "max_keys": self.max_keys}
+
+
+class SharedMemoryBucketStore:
+    """
+    여러 워커 프로세스가 공유하는 mmap 토큰 버킷 저장소 (/dev/shm 파일)
+
+    키 해시로 고정 크기 슬롯에 직접 매핑하며 잠금 없이 슬롯 단위로 읽고 씁니다.
+    동시에 같은 슬롯을 갱신하면 일부 소비가 누락되어 약간 더 허용될 수 있고,
+    해시 충돌 시 버킷이 가득 찬 상태로 초기화됩니다 (차단 방향의 오류는 없음).
+    """
+
+    SLOT = struct.Struct("<Qdd")  # 키 해시, 토큰, 갱신 시각(time.time)
+
+    def __init__(self, path: str, slots: int = 65536):
+        self.path = path
+        self.slots = max(1, slots)
+        size = self.SLOT.size * self.slots
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if os.fstat(fd).st_size < size:
+                os.ftruncate(fd, size)
+            self._mmap = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+
+    def take(self, key: str, rate: float, burst: float) -> Tuple[bool, float]:
+        # 0은 빈 슬롯 표시로 쓰므로 해시의 최하위 비트를 1로 고정
+        key_hash = int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little") | 1
+        offset = (key_hash % self.slots) * self.SLOT.size
+        now = time.time()
+        stored_hash, tokens, updated = self.SLOT.unpack_from(self._mmap, offset)
+        if stored_hash != key_hash:
+            tokens, updated = burst, now
+        tokens, retry_after = _take(tokens, updated, rate, burst, now)
+        self.SLOT.pack_into(self._mmap, offset, key_hash, tokens, now)
+        return retry_after == 0.0, retry_after
+
+    def stats(self) -> Dict[str, object]:
+        return {"backend": "shm", "path": self.path, "slots": self.slots}
+
+
+def create_bucket_store(backend: str):
+    """RATE_LIMIT_BACKEND 값(memory | shm)에 맞는 토큰 버킷 저장소 생성"""
+    if backend == "memory":
+        return MemoryBucketStore(max_keys=int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000")))
+    if backend == "shm":
+        return SharedMemoryBucketStore(
+            os.getenv("RATE_LIMIT_SHM_PATH", "/dev/shm/gateway_ratelimit"),
+            slots=int(os.getenv("RATE_LIMIT_SHM_SLOTS", "65536")),
+        )
+    raise ValueError(f"Unknown rate limit backend: {backend}")
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    지연 시간 기반 AIMD 동시 처리 한도
+
+    응답 헤더까지의 지연 시간이 목표를 넘으면 한도를 backoff 비율로 줄이고(목표 시간당 최대 1회),
+    목표 이내이며 한도의 절반 이상을 쓰고 있으면 한도를 1/limit씩 늘립니다.
+    한도를 넘는 요청은 큐에 쌓지 않고 즉시 거절하여 꼬리 지연이 무너지기 전에 부하를 덜어냅니다.
+    """
+
+    def __init__(self, initial: int = 100, min_limit: int = 10, max_limit: int = 1000,
+                 latency_target: float = 0.5, backoff: float = 0.9):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(max(initial, self.min_limit), self.max_limit))
+        self.latency_target = latency_target
+        self.backoff = backoff
+        self.inflight = 0
+        self.shed = 0
+        self._last_decrease = 0.0
+        CONCURRENCY_LIMIT.set(self.limit)
+
+    @classmethod
+    def from_env(cls) -> "AdaptiveConcurrencyLimiter":
+        return cls(
+            initial=int(os.getenv("CONCURRENCY_LIMIT_INITIAL", "100")),
+            min_limit=int(os.getenv("CONCURRENCY_LIMIT_MIN", "10")),
+            max_limit=int(os.getenv("CONCURRENCY_LIMIT_MAX", "1000")),
+            latency_target=int(os.getenv("CONCURRENCY_LATENCY_TARGET_MS", "500")) / 1000,
+            backoff=float(os.getenv("CONCURRENCY_LIMIT_BACKOFF", "0.9")),
+        )
+
+    def try_acquire(self) -> bool:
+        if self.inflight >= int(self.limit):
+            self.shed += 1
+            return False
+        self.inflight += 1
+        return True
+
+    def release(self, latency: float) -> None:
+        self.inflight -= 1
+        if latency > self.latency_target:
+            now = time.monotonic()
+            if now - self._last_decrease >= self.latency_target:
+                self.limit = max(self.min_limit, self.limit * self.backoff)
+                self._last_decrease = now
+                CONCURRENCY_LIMIT.set(self.limit)
+        elif self.inflight * 2 >= self.limit and self.limit < self.max_limit:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            CONCURRENCY_LIMIT.set(self.limit)
+
+    def stats(self) -> Dict[str, object]:
+        return {"limit": round(self.limit, 2), "inflight": self.inflight, "shed": self.shed}
+
+
+class RateLimitMiddleware:
+    """
+    요청 제한 ASGI 미들웨어
+
+    - 경로 정책별 토큰 버킷: 검증 캐시에 있는 JWT면 subject, 아니면 클라이언트 IP 기준 (초과 시 429)
+    - 전역 적응형 동시 처리 한도 (초과 시 503)
+
+    클라이언트 IP는 직접 연결한 상대가 trusted_proxies 대역일 때만 X-Forwarded-For에서 찾습니다.
+    오른쪽(가장 가까운 프록시)부터 신뢰 대역의 주소를 건너뛰고 처음 만나는 주소를 사용하므로
+    클라이언트가 헤더 앞쪽에 임의의 IP를 넣어도 버킷을 바꿀 수 없습니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        policies: Iterable[RatePolicy],
+        store,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        token_cache: Optional[VerifiedTokenCache] = None,
+        exempt_paths: Iterable[str] = ("/health", "/metrics"),
+        trusted_proxies: Iterable[Network] = (),
+    ):
+        self.app = app
+        self.policies = list(policies)
+        self.store = store
+        self.limiter = limiter
+        self.token_cache = token_cache
+        self.exempt_paths = tuple(exempt_paths)
+        self.trusted_proxies = tuple(trusted_proxies)
+
+    def identity(self, scope: Scope) -> str:
+        """버킷 키 주체: 이미 검증된 토큰의 sub (위조된 sub로 다른 사용자 버킷을 소모하지 못하도록), 없으면 IP"""
+        connection = HTTPConnection(scope)
+        if self.token_cache is not None:
+            token = connection.cookies.get("session_token")
+            authorization = connection.headers.get("authorization", "")
+            if not token and authorization.lower().startswith("bearer "):
+                token = authorization[7:]
+            payload = self.token_cache.peek(token) if token else None
+            if payload and payload.get("sub"):
+                return f"sub:{payload['sub']}"
+
+        client = scope.get("client")
+        return f"ip:{self.client_ip(client[0] if client else 'unknown', connection.headers.get('x-forwarded-for'))}"
+
+    def _is_trusted(self, address: str) -> bool:
+        try:
+            ip = ipaddress.ip_address(address)
+        except ValueError:
+            return False
+        return any(ip in network for network in self.trusted_proxies)
+
+    def client_ip(self, peer: str, forwarded: Optional[str]) -> str:
+        """신뢰하는 프록시를 거친 요청이면 X-Forwarded-For에서 실제 클라이언트 IP, 아니면 연결 상대 IP"""
+        if not forwarded or not self.trusted_proxies or not self._is_trusted(peer):
+            return peer
+        hops = [hop.strip() for hop in forwarded.split(",") if hop.strip()]
+        for hop in reversed(hops):
+            if not self._is_trusted(hop):
+                return hop
+        # 모든 주소가 신뢰 대역이면 가장 앞쪽 주소가 클라이언트
+        return hops[0] if hops else peer
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.exempt_paths):
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        policy = next((policy for policy in self.policies if policy.matches(path)), None)
+        if policy is not None:
+            allowed, retry_after = self.store.take(f"{policy.prefix}|{self.identity(scope)}", policy.rate, policy.burst)
+            if not allowed:
+                RATE_LIMITED.labels("rate", policy.prefix).inc()
+                await self._reject(scope, receive, send, 429, "요청이 너무 많습니다. 잠시 후 다시 시도해주세요", retry_after)
+                return
+
+        if self.limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not self.limiter.try_acquire():
+            RATE_LIMITED.labels("concurrency", policy.prefix if policy else "").inc()
+            await self._reject(scope, receive, send, 503, "서버가 혼잡합니다. 잠시 후 다시 시도해주세요", 1.0)
+            return
+
+        # 응답 헤더를 보내는 시점에 슬롯 반환 (스트리밍 본문이 슬롯을 오래 점유하지 않도록)
+        started = time.perf_counter()
+        released = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal released
+            if message["type"] == "http.response.start" and not released:
+                released = True
+                self.limiter.release(time.perf_counter() - started)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if not released:
+                self.limiter.release(time.perf_counter() - started)
+
+    @staticmethod
+    async def _reject(scope: Scope, receive: Receive, send: Send, status_code: int, detail: str,
+                      retry_after: float) -> None:
+        response = JSONResponse(
+            {"detail": detail},
+            status_code=status_code,
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+        await response(scope, receive, send)
@@ -0,0 +1,142 @@
+# gateway/app/middleware/session.py
+
+import re
+import secrets
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..domain.service.session_store import SessionStore
+
+# secrets.token_urlsafe(32) 형식의 세션 ID만 저장소 조회에 사용
+SESSION_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{43}$")
+
+
+class LazySession(MutableMapping):
+    """
+    처음 접근할 때만 저장소에서 불러오는 세션 dict
+
+    세션을 건드리지 않는 요청은 저장소 조회가 없고, 값을 바꾼 요청만 dirty로 표시되어 다시 저장됩니다.
+    """
+
+    def __init__(self, store: SessionStore, session_id: Optional[str]):
+        self.store = store
+        self.session_id = session_id
+        self.exists = False
+        self.dirty = False
+        self._data: Optional[Dict[str, Any]] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._data is not None
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        if self._data is None:
+            stored = self.store.load(self.session_id) if self.session_id else None
+            self.exists = stored is not None
+            self._data = stored or {}
+        return self._data
+
+    def __getitem__(self, key: str) -> Any:
+        return self.data[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.data[key] = value
+        self.dirty = True
+
+    def __delitem__(self, key: str) -> None:
+        del self.data[key]
+        self.dirty = True
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def clear(self) -> None:
+        if self.data:
+            self.data.clear()
+            self.dirty = True
+
+
+class ServerSessionMiddleware:
+    """
+    서버 측 세션 미들웨어 (starlette SessionMiddleware 대체)
+
+    쿠키에는 불투명한 세션 ID만 담아 헤더 크기를 줄이고, 요청마다 세션 전체를 서명/직렬화하지 않습니다.
+    쿠키는 세션이 바뀐 응답에만 내려보냅니다. (새 세션 발급, 기존 세션의 TTL 연장, 세션 삭제)
+    디스크 기반 저장소(store.blocking)는 이벤트 루프를 막지 않도록 스레드 풀에서 조회/저장하며,
+    이 경우 세션 쿠키가 있는 요청은 핸들러 실행 전에 세션을 미리 불러옵니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        store: SessionStore,
+        session_cookie: str = "session",
+        max_age: int = 86400,
+        path: str = "/",
+        same_site: str = "lax",
+        https_only: bool = False,
+    ):
+        self.app = app
+        self.store = store
+        self.session_cookie = session_cookie
+        self.max_age = max_age
+        self.path = path
+        self.security_flags = f"httponly; samesite={same_site}" + ("; secure" if https_only else "")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        session_id = HTTPConnection(scope).cookies.get(self.session_cookie)
+        if session_id and not SESSION_ID_PATTERN.match(session_id):
+            session_id = None
+        session = LazySession(self.store, session_id)
+        if session_id and self.store.blocking:
+            # LazySession.data는 동기 속성이라 핸들러 안에서 처음 접근하면 이벤트 루프에서 조회하게 됨
+            await run_in_threadpool(lambda: session.data)
+        scope["session"] = session
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and session.dirty:
+                cookie = await self._commit(session)
+                if cookie is not None:
+                    MutableHeaders(scope=message).append("Set-Cookie", cookie)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _store_call(self, method: Callable[..., Any], *args: Any) -> Any:
+        if self.store.blocking:
+            return await run_in_threadpool(method, *args)
+        return method(*args)
+
+    async def _commit(self, session: LazySession) -> Optional[str]:
+        """변경된 세션 저장 후 내려보낼 Set-Cookie 값 반환 (내려보낼 쿠키가 없으면 None)"""
+        if not session.data:
+            if session.exists:
+                await self._store_call(self.store.delete, session.session_id)
+                return self._cookie("null", expires="expires=Thu, 01 Jan 1970 00:00:00 GMT; ")
+            return None
+
+        if session.exists:
+            # 저장소 TTL을 연장했으므로 쿠키 Max-Age도 다시 내려 브라우저 쪽 만료 시각을 맞춤
+            await self._store_call(self.store.save, session.session_id, session.data, self.max_age)
+            return self._cookie(session.session_id, expires=f"Max-Age={self.max_age}; ")
+
+        # 저장소에 없는 ID(만료 또는 클라이언트가 임의로 보낸 값)는 재사용하지 않고 새로 발급 (세션 고정 방지)
+        session.session_id = secrets.token_urlsafe(32)
+        await self._store_call(self.store.save, session.session_id, session.data, self.max_age)
+        return self._cookie(session.session_id, expires=f"Max-Age={self.max_age}; ")
+
+    def _cookie(self, value: str, expires: str) -> str:
+        return f"{self.session_cookie}={value}; path={self.path}; {expires}{self.security_flags}"
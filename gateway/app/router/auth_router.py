@@ -1,6 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, Request, Query
 from fastapi.responses import RedirectResponse
+from fastapi.concurrency import run_in_threadpool
 from typing import Optional, Dict, Any
+import os
 import logging
 
 from ..domain.controller.auth_controller import AuthController
@@ -122,9 +124,14 @@ async def logout(request: Request):
     """
     로그아웃
     
-    httpOnly 쿠키에서 토큰을 삭제합니다.
+    httpOnly 쿠키의 토큰을 만료 시각까지 폐기하고 쿠키를 삭제합니다.
     """
     try:
+        token = request.cookies.get("session_token")
+        if token:
+            # 스냅샷 파일 쓰기가 있으므로 스레드 풀에서 실행
+            await run_in_threadpool(auth_controller.auth_service.revoke_token, token)
+        
         response = {"message": "Logged out successfully"}
         
         # 쿠키 삭제를 위한 응답 생성
@@ -162,7 +169,9 @@ async def auth_health_check():
             "google_callback": "/auth/google/callback",
             "verify_token": "/auth/verify",
             "current_user": "/auth/me"
-        }
+        },
+        "token_cache": auth_controller.auth_service.token_cache.stats(),
+        "revocation": auth_controller.auth_service.revocation_list.stats()
     }
 
 
@@ -0,0 +1,94 @@
+from fastapi import APIRouter, Header, Request
+from fastapi.responses import StreamingResponse
+from typing import Optional, Dict, Any
+import logging
+
+from ..domain.controller.gateway_controller import GatewayController
+from ..domain.model.gateway_schema import (
+    RouteTableResponse, ServiceRegisterRequest, ServiceHeartbeatRequest,
+    ServiceInstanceInfo, RegistryResponse
+)
+from .auth_router import auth_controller
+
+logger = logging.getLogger(__name__)
+
+# 라우터 생성
+gateway_router = APIRouter(
+    tags=["Gateway"],
+    responses={404: {"description": "Not found"}},
+)
+
+# 서비스 레지스트리 라우터 (REGISTRY_TOKEN이 설정된 경우에만 main에서 등록)
+registry_router = APIRouter(
+    prefix="/registry",
+    tags=["Registry"],
+    responses={404: {"description": "Not found"}},
+)
+
+# GatewayController 인스턴스 생성 (토큰 캐시 공유를 위해 AuthService 재사용)
+gateway_controller = GatewayController(auth_controller.auth_service)
+
+PROXY_METHODS = ["GET", "POST", "PUT", "PATCH", "DELETE", "HEAD"]
+
+
+@gateway_router.get("/gateway/routes", response_model=RouteTableResponse)
+async def get_routes() -> RouteTableResponse:
+    """
+    프록시 라우팅 테이블 조회
+    """
+    return gateway_controller.get_routes()
+
+
+@registry_router.post("/register", response_model=ServiceInstanceInfo)
+async def register_instance(
+    register_request: ServiceRegisterRequest,
+    x_registry_token: Optional[str] = Header(None)
+) -> ServiceInstanceInfo:
+    """
+    서비스 인스턴스 자가 등록
+
+    등록된 인스턴스는 /api/{service} 경로로 라우팅됩니다.
+    """
+    return gateway_controller.register_instance(register_request, x_registry_token)
+
+
+@registry_router.post("/heartbeat")
+async def heartbeat(
+    heartbeat_request: ServiceHeartbeatRequest,
+    x_registry_token: Optional[str] = Header(None)
+) -> Dict[str, Any]:
+    """
+    서비스 인스턴스 하트비트
+    """
+    return gateway_controller.heartbeat(heartbeat_request, x_registry_token)
+
+
+@registry_router.delete("/{service}/{instance_id}")
+async def deregister_instance(
+    service: str,
+    instance_id: str,
+    x_registry_token: Optional[str] = Header(None)
+) -> Dict[str, Any]:
+    """
+    서비스 인스턴스 등록 해제
+    """
+    return gateway_controller.deregister_instance(service, instance_id, x_registry_token)
+
+
+@registry_router.get("", response_model=RegistryResponse)
+async def get_registry(x_registry_token: Optional[str] = Header(None)) -> RegistryResponse:
+    """
+    등록된 서비스 인스턴스 및 헬스 상태 조회
+    """
+    return gateway_controller.get_registry(x_registry_token)
+
+
+@gateway_router.api_route("/api/{path:path}", methods=PROXY_METHODS)
+async def proxy(request: Request, path: str) -> StreamingResponse:
+    """
+    다운스트림 서비스 리버스 프록시
+
+    요청/응답 본문은 버퍼링 없이 스트리밍되며,
+    검증된 JWT 사용자 정보는 X-Authenticated-User 헤더로 전달됩니다.
+    """
+    return await gateway_controller.proxy(request)
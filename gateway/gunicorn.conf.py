@@ -0,0 +1,70 @@
+# gateway/gunicorn.conf.py
+#
+# 멀티 워커 실행 설정 (gunicorn 마스터 + UvicornWorker)
+#
+#   gunicorn app.main:app -c gunicorn.conf.py
+#
+# 무중단 재시작: 마스터에 HUP 신호를 보내면 새 워커를 띄운 뒤 기존 워커를 graceful_timeout 안에 정리합니다.
+#   kill -HUP <마스터 PID>   (supervisord: supervisorctl signal HUP gateway)
+#
+# 워커가 2개 이상이면 워커 간에 공유해야 하는 상태의 기본 저장소를 공유 메모리/로컬 파일로 바꿉니다.
+# 환경 변수로 직접 지정한 값이 있으면 그 값을 그대로 사용합니다.
+#   - 검증 토큰 캐시: TOKEN_CACHE_BACKEND=shm (/dev/shm mmap)
+#   - 요청 제한 버킷: RATE_LIMIT_BACKEND=shm (/dev/shm mmap)
+#   - Prometheus 메트릭: PROMETHEUS_MULTIPROC_DIR (/dev/shm 디렉터리의 워커별 mmap 파일을 스크레이프 시 합산)
+#   - 세션: SESSION_BACKEND=sqlite (로그인과 콜백이 다른 워커로 가도 state 확인 가능)
+#   - 서비스 레지스트리: REGISTRY_BACKEND=sqlite (등록/하트비트를 어느 워커가 받든 모든 워커가 같은 인스턴스 목록 사용)
+#   - 토큰 폐기 목록은 원래 REVOCATION_SNAPSHOT_PATH 스냅샷과 추가 전용 로그(.log)로 공유됩니다.
+# 적응형 동시 처리 한도와 업스트림 헬스 상태는 워커별 지연 시간/헬스 체크로 정해지므로 워커마다 따로 유지됩니다.
+
+import multiprocessing
+import os
+import shutil
+
+# child_exit는 신호 처리 중에 호출되므로 모듈 import를 미리 끝내 둠
+from prometheus_client import multiprocess
+
+bind = os.getenv("GATEWAY_BIND", "0.0.0.0:8000")
+workers = max(1, int(os.getenv("GATEWAY_WORKERS", str(multiprocessing.cpu_count()))))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# 종료/재시작 시 처리 중인 요청을 마칠 때까지 기다리는 시간 (초)
+graceful_timeout = int(os.getenv("GATEWAY_GRACEFUL_TIMEOUT", "30"))
+timeout = int(os.getenv("GATEWAY_WORKER_TIMEOUT", "60"))
+keepalive = int(os.getenv("GATEWAY_KEEPALIVE", "5"))
+
+# 메모리 누수 대비 워커 주기적 교체 (0이면 비활성화)
+max_requests = int(os.getenv("GATEWAY_MAX_REQUESTS", "0"))
+max_requests_jitter = int(os.getenv("GATEWAY_MAX_REQUESTS_JITTER", "0"))
+
+accesslog = os.getenv("GATEWAY_ACCESS_LOG") or None
+errorlog = "-"
+loglevel = os.getenv("GATEWAY_LOG_LEVEL", "info")
+
+if workers > 1:
+    # 워커 프로세스는 마스터의 환경 변수를 상속하므로 앱 import 전에 기본값을 정해 둠
+    os.environ.setdefault("TOKEN_CACHE_BACKEND", "shm")
+    os.environ.setdefault("RATE_LIMIT_BACKEND", "shm")
+    os.environ.setdefault("SESSION_BACKEND", "sqlite")
+    os.environ.setdefault("REGISTRY_BACKEND", "sqlite")
+    os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/dev/shm/gateway_metrics")
+
+
+def on_starting(server):
+    """마스터 시작 시 이전 실행의 워커별 메트릭 파일 정리 (HUP 재시작 때는 호출되지 않아 누적값 유지)"""
+    metrics_dir = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+    if metrics_dir:
+        shutil.rmtree(metrics_dir, ignore_errors=True)
+        os.makedirs(metrics_dir, exist_ok=True)
+    server.log.info(f"Gateway workers: {workers}, metrics dir: {metrics_dir or 'single process'}")
+    if workers > 1 and os.getenv("REGISTRY_TOKEN") and os.getenv("REGISTRY_BACKEND", "memory").lower() == "memory":
+        server.log.warning(
+            "Dynamic service registration is enabled with REGISTRY_BACKEND=memory and multiple workers; "
+            "each worker will see a different routing table. Use REGISTRY_BACKEND=sqlite or static GATEWAY_ROUTES."
+        )
+
+
+def child_exit(server, worker):
+    """종료된 워커의 live 게이지 파일 정리 (카운터/히스토그램 누적값은 유지)"""
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(worker.pid)
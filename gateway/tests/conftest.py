@@ -0,0 +1,7 @@
+# gateway/tests/conftest.py
+
+import os
+import sys
+
+# 게이트웨이는 gateway/ 디렉터리에서 app 패키지로 실행되므로 같은 경로를 import 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,150 @@
+# gateway/tests/test_auth_repository.py
+
+import asyncio
+import gc
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.domain.model.auth_entity import OAuthSession, User
+from app.domain.repository.auth_repository import AuthRepository
+
+
+def user(google_id: str, email: str, name="Name"):
+    return SimpleNamespace(id=google_id, email=email, name=name, picture=None)
+
+
+TOKEN = {"access_token": "access", "expires_in": 3600}
+
+
+@pytest.fixture
+def database_url(tmp_path):
+    return f"sqlite+aiosqlite:///{tmp_path / 'auth.db'}"
+
+
+@pytest.fixture
+def run():
+    """
+    테스트마다 이벤트 루프 하나를 쓰고, 루프를 닫기 전에 만든 엔진을 모두 정리
+
+    aiosqlite 연결 스레드가 닫힌 루프에 결과를 돌려주지 않도록 같은 루프에서 dispose 합니다.
+    """
+    loop = asyncio.new_event_loop()
+    engines = []
+
+    def run_scenario(scenario):
+        return loop.run_until_complete(scenario(engines))
+
+    yield run_scenario
+
+    async def dispose():
+        for engine in engines:
+            await engine.dispose()
+
+    loop.run_until_complete(dispose())
+    gc.collect()
+    loop.run_until_complete(asyncio.sleep(0))
+    loop.run_until_complete(loop.shutdown_default_executor())
+    loop.close()
+
+
+def broken_url(tmp_path) -> str:
+    return f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'auth.db'}"
+
+
+def engine_for(engines, url):
+    engine = create_async_engine(url)
+    engines.append(engine)
+    return engine
+
+
+async def rows(engine, model):
+    async with engine.connect() as conn:
+        return (await conn.execute(select(model.__table__))).all()
+
+
+def test_flush_writes_users_and_sessions(run, database_url):
+    async def scenario(engines):
+        repository = AuthRepository(engine_for(engines, database_url))
+        repository.record_login(user("g1", "a@example.com"), TOKEN)
+        repository.record_login(user("g1", "a@example.com", name="Renamed"), TOKEN)
+
+        assert await repository.flush() == 2
+        return await rows(repository.engine, User), await rows(repository.engine, OAuthSession)
+
+    users, sessions = run(scenario)
+    assert [(row.google_id, row.name) for row in users] == [("g1", "Renamed")]
+    assert len(sessions) == 2
+
+
+def test_transient_failure_requeues_with_backoff_then_recovers(run, tmp_path, database_url):
+    async def scenario(engines):
+        # 존재하지 않는 디렉터리의 DB 파일은 열 수 없어 OperationalError (DB 장애 상황)
+        repository = AuthRepository(engine_for(engines, broken_url(tmp_path)), retry_backoff_ms=60000)
+        repository.record_login(user("g1", "a@example.com"), TOKEN)
+        repository.record_login(user("g2", "b@example.com"), TOKEN)
+
+        assert await repository.flush() == 0
+        failed = repository.stats()
+        # 백오프 중에는 강제 flush가 아니면 다시 시도하지 않음
+        assert await repository.flush() == 0
+
+        repository.engine = engine_for(engines, database_url)
+        return failed, await repository.flush(force=True), repository.stats()
+
+    failed, written, recovered = run(scenario)
+    assert failed["buffered"] == 2 and failed["retried_rows"] == 2 and failed["consecutive_failures"] == 1
+    assert written == 2
+    assert recovered["buffered"] == 0 and recovered["consecutive_failures"] == 0 and recovered["dropped_rows"] == 0
+
+
+def test_records_are_dropped_after_max_retries(run, tmp_path):
+    async def scenario(engines):
+        repository = AuthRepository(engine_for(engines, broken_url(tmp_path)), max_retries=1)
+        repository.record_login(user("g1", "a@example.com"), TOKEN)
+        await repository.flush(force=True)
+        await repository.flush(force=True)
+        return repository.stats()
+
+    stats = run(scenario)
+    assert stats["buffered"] == 0 and stats["dropped_rows"] == 1
+
+
+def test_permanent_error_only_drops_the_bad_record(run, database_url):
+    async def scenario(engines):
+        repository = AuthRepository(engine_for(engines, database_url))
+        repository.record_login(user("g1", "a@example.com"), TOKEN)
+        # name NOT NULL 위반 → 배치 전체가 아니라 이 기록만 버려짐
+        repository.record_login(user("g2", "b@example.com", name=None), TOKEN)
+
+        written = await repository.flush()
+        return written, repository.stats(), await rows(repository.engine, User)
+
+    written, stats, users = run(scenario)
+    assert written == 1
+    assert stats["dropped_rows"] == 1 and stats["buffered"] == 0
+    assert [row.google_id for row in users] == ["g1"]
+
+
+def test_email_conflicts_are_skipped_and_legacy_users_linked(run, database_url):
+    async def scenario(engines):
+        engine = engine_for(engines, database_url)
+        repository = AuthRepository(engine)
+        await repository._ensure_tables()
+        async with engine.begin() as conn:
+            await conn.execute(User.__table__.insert(), [
+                {"email": "taken@example.com", "name": "Owner", "google_id": "owner"},
+                {"email": "legacy@example.com", "name": "Legacy", "google_id": None},
+            ])
+
+        repository.record_login(user("intruder", "taken@example.com"), TOKEN)
+        repository.record_login(user("legacy-google", "legacy@example.com"), TOKEN)
+        written = await repository.flush()
+        return written, repository.stats(), {row.email: row.google_id for row in await rows(engine, User)}
+
+    written, stats, users = run(scenario)
+    assert written == 1
+    assert stats["conflict_rows"] == 1
+    assert users == {"taken@example.com": "owner", "legacy@example.com": "legacy-google"}
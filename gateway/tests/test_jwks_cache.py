@@ -0,0 +1,147 @@
+# gateway/tests/test_jwks_cache.py
+
+import asyncio
+import json
+import os
+import time
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import JWTError, jwk, jwt
+
+from app.domain.service.jwks_cache import GoogleJWKSCache, parse_max_age
+
+CLIENT_ID = "test-client.apps.googleusercontent.com"
+
+
+def private_pem() -> bytes:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption())
+
+
+def public_jwk(pem: bytes, kid: str) -> dict:
+    public = jwk.construct(pem, "RS256").public_key().to_dict()
+    return {**public, "kid": kid, "use": "sig"}
+
+
+def write_fixture(path, *keys) -> str:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"keys": list(keys)}, f)
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def signing_keys():
+    return {kid: private_pem() for kid in ("k1", "k2")}
+
+
+def test_parse_max_age():
+    assert parse_max_age("public, max-age=21600, must-revalidate", 60) == 21600
+    assert parse_max_age("no-cache", 60) == 60
+    assert parse_max_age(None, 60) == 60
+
+
+def test_fixture_then_disk_then_memory(tmp_path, signing_keys):
+    fixture = write_fixture(tmp_path / "jwks.json", public_jwk(signing_keys["k1"], "k1"))
+    cache_path = str(tmp_path / "cache" / "jwks_cache.json")
+    os.makedirs(os.path.dirname(cache_path))
+
+    first = GoogleJWKSCache(cache_path=cache_path, fixture_path=fixture)
+    assert asyncio.run(first.get_key("k1"))["kid"] == "k1"
+    assert os.path.exists(cache_path)
+    # 임시 파일은 남지 않음
+    assert os.listdir(os.path.dirname(cache_path)) == ["jwks_cache.json"]
+
+    # 원본(픽스처)이 없어도 유효한 디스크 캐시에서 로드
+    os.remove(fixture)
+    second = GoogleJWKSCache(cache_path=cache_path, fixture_path=fixture)
+    assert asyncio.run(second.get_key("k1"))["kid"] == "k1"
+
+    # 메모리에 올라온 뒤에는 디스크 캐시도 다시 읽지 않음
+    os.remove(cache_path)
+    assert asyncio.run(second.get_key("k1"))["kid"] == "k1"
+
+
+def test_expired_disk_cache_falls_back_to_fixture(tmp_path, signing_keys):
+    cache_path = str(tmp_path / "jwks_cache.json")
+    with open(cache_path, "w", encoding="utf-8") as f:
+        json.dump({"jwks": {"keys": [public_jwk(signing_keys["k1"], "old")]}, "expires_at": time.time() - 1}, f)
+    fixture = write_fixture(tmp_path / "jwks.json", public_jwk(signing_keys["k1"], "k1"))
+
+    cache = GoogleJWKSCache(cache_path=cache_path, fixture_path=fixture)
+
+    assert asyncio.run(cache.get_key("k1")) is not None
+    assert asyncio.run(cache.get_key("old")) is None
+
+
+def test_unknown_kid_forces_one_refresh(tmp_path, signing_keys):
+    fixture_path = tmp_path / "jwks.json"
+    fixture = write_fixture(fixture_path, public_jwk(signing_keys["k1"], "k1"))
+    cache = GoogleJWKSCache(fixture_path=fixture, min_refresh_interval=0)
+    assert asyncio.run(cache.get_key("k1")) is not None
+
+    # 구글 키 교체: 캐시가 아직 유효해도 모르는 kid면 다시 조회
+    write_fixture(fixture_path, public_jwk(signing_keys["k1"], "k1"), public_jwk(signing_keys["k2"], "k2"))
+    assert asyncio.run(cache.get_key("k2"))["kid"] == "k2"
+
+
+def test_unknown_kid_refresh_is_rate_limited(tmp_path, signing_keys):
+    fixture_path = tmp_path / "jwks.json"
+    fixture = write_fixture(fixture_path, public_jwk(signing_keys["k1"], "k1"))
+    cache = GoogleJWKSCache(fixture_path=fixture, min_refresh_interval=3600)
+    asyncio.run(cache.get_key("k1"))
+
+    write_fixture(fixture_path, public_jwk(signing_keys["k2"], "k2"))
+    assert asyncio.run(cache.get_key("k2")) is None
+
+
+@pytest.fixture
+def auth_service(tmp_path, monkeypatch, signing_keys):
+    monkeypatch.setenv("GOOGLE_CLIENT_ID", CLIENT_ID)
+    monkeypatch.setenv("GOOGLE_CLIENT_SECRET", "secret")
+    monkeypatch.setenv("REVOCATION_SNAPSHOT_PATH", str(tmp_path / "revocations.bin"))
+    from app.domain.service.auth_service import AuthService
+
+    service = AuthService()
+    fixture = write_fixture(tmp_path / "jwks.json", public_jwk(signing_keys["k1"], "k1"))
+    service.jwks_cache = GoogleJWKSCache(fixture_path=fixture)
+    return service
+
+
+def id_token(signing_keys, kid="k1", **overrides) -> str:
+    now = int(time.time())
+    claims = {
+        "iss": "https://accounts.google.com",
+        "aud": CLIENT_ID,
+        "sub": "google-user-1",
+        "email": "user@example.com",
+        "email_verified": True,
+        "name": "User",
+        "iat": now,
+        "exp": now + 3600,
+        **overrides,
+    }
+    return jwt.encode(claims, signing_keys[kid].decode(), algorithm="RS256", headers={"kid": kid})
+
+
+def test_valid_id_token_is_accepted(auth_service, signing_keys):
+    user = asyncio.run(auth_service.verify_google_id_token(id_token(signing_keys)))
+
+    assert user.id == "google-user-1" and user.email == "user@example.com" and user.verified_email
+
+
+@pytest.mark.parametrize("overrides", [
+    {"aud": "another-client"},
+    {"iss": "https://evil.example.com"},
+    {"exp": int(time.time()) - 60},
+])
+def test_id_token_claim_rejections(auth_service, signing_keys, overrides):
+    with pytest.raises(JWTError):
+        asyncio.run(auth_service.verify_google_id_token(id_token(signing_keys, **overrides)))
+
+
+def test_id_token_signed_with_unknown_key_is_rejected(auth_service, signing_keys):
+    auth_service.jwks_cache.min_refresh_interval = 3600
+    with pytest.raises(JWTError):
+        asyncio.run(auth_service.verify_google_id_token(id_token(signing_keys, kid="k2")))
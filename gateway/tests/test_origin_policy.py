@@ -0,0 +1,72 @@
+# gateway/tests/test_origin_policy.py
+
+import pytest
+
+from app.domain.service.origin_policy import DEFAULT_FRONTEND_URL, OriginPolicy, wildcard_pattern
+
+
+def test_exact_origins_are_normalized():
+    policy = OriginPolicy(["https://App.Example.com/ ", "http://localhost:3000"])
+
+    assert policy.is_allowed("https://app.example.com")
+    assert policy.is_allowed("https://APP.example.com/")
+    assert not policy.is_allowed("https://evil.example.com")
+    assert not policy.is_allowed(None)
+    assert policy.default_url == "https://app.example.com"
+
+
+def test_wildcard_matches_subdomains_only():
+    policy = OriginPolicy(["https://*.example.com"])
+
+    assert policy.is_allowed("https://a.example.com")
+    assert policy.is_allowed("https://a.b.example.com")
+    assert not policy.is_allowed("https://example.com")
+    assert not policy.is_allowed("http://a.example.com")
+    assert not policy.is_allowed("https://a.example.com.evil.net")
+    assert not policy.is_allowed("https://aexample.com")
+
+
+def test_scheme_less_wildcard_allows_http_and_https():
+    policy = OriginPolicy(["*.example.com"])
+
+    assert policy.is_allowed("http://a.example.com")
+    assert policy.is_allowed("https://a.example.com")
+
+
+def test_star_is_ignored():
+    policy = OriginPolicy(["*"])
+
+    assert not policy.is_allowed("https://anything.example")
+    assert policy.default_url == DEFAULT_FRONTEND_URL
+
+
+def test_unsupported_wildcard_position_is_rejected():
+    with pytest.raises(ValueError):
+        wildcard_pattern("https://app.*.example.com")
+
+
+def test_memo_is_bounded_and_counts_rejections():
+    policy = OriginPolicy(["https://*.example.com"], memo_size=2)
+
+    for index in range(5):
+        policy.is_allowed(f"https://evil{index}.net")
+
+    assert policy.stats()["memo_size"] <= 2
+    assert policy.rejected == 5
+
+
+def test_frontend_url_falls_back_to_default():
+    policy = OriginPolicy(["https://app.example.com", "https://*.example.com"])
+
+    assert policy.frontend_url("https://preview.example.com") == "https://preview.example.com"
+    assert policy.frontend_url("https://evil.net") == "https://app.example.com"
+    assert policy.frontend_url(None) == "https://app.example.com"
+
+
+def test_from_env(monkeypatch):
+    monkeypatch.setenv("FRONTEND_URLS", "https://app.example.com,https://*.preview.example.com")
+
+    policy = OriginPolicy.from_env()
+
+    assert policy.default_url == "https://app.example.com"
+    assert policy.is_allowed("https://pr-1.preview.example.com")
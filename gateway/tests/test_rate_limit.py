@@ -0,0 +1,97 @@
+# gateway/tests/test_rate_limit.py
+
+import time
+
+import pytest
+
+from app.middleware.rate_limit import (
+    DEFAULT_POLICIES, DEFAULT_TRUSTED_PROXIES, MemoryBucketStore, RateLimitMiddleware, SharedMemoryBucketStore,
+    _take, parse_networks, parse_policies,
+)
+
+
+def test_parse_policies_rates_and_bursts():
+    policies = {policy.prefix: policy for policy in parse_policies("/api=20/1s:50,/auth=120/1m,/slow=10/2h")}
+
+    assert policies["/api"].rate == 20 and policies["/api"].burst == 50
+    assert policies["/auth"].rate == 2 and policies["/auth"].burst == 120
+    assert policies["/slow"].rate == pytest.approx(10 / 7200)
+    assert policies["/slow"].burst == 10
+
+
+def test_parse_policies_sorts_longest_prefix_first():
+    policies = parse_policies(DEFAULT_POLICIES)
+
+    assert [policy.prefix for policy in policies][0] == "/auth/google"
+    matched = next(policy for policy in policies if policy.matches("/auth/google/callback"))
+    assert matched.prefix == "/auth/google"
+    assert not policies[0].matches("/auth/googlex")
+
+
+def test_parse_policies_skips_malformed_entries():
+    policies = parse_policies("/ok=5/1s, broken, /zero=0/1s, /bad=x/1s,")
+
+    assert [policy.prefix for policy in policies] == ["/ok"]
+
+
+def test_take_refills_by_elapsed_time():
+    tokens, retry = _take(tokens=0.0, updated=0.0, rate=2.0, burst=5.0, now=1.0)
+    assert retry == 0.0 and tokens == pytest.approx(1.0)
+
+    tokens, retry = _take(tokens=0.0, updated=0.0, rate=2.0, burst=5.0, now=100.0)
+    assert tokens == pytest.approx(4.0)
+
+    tokens, retry = _take(tokens=0.5, updated=10.0, rate=2.0, burst=5.0, now=10.0)
+    assert tokens == pytest.approx(0.5) and retry == pytest.approx(0.25)
+
+
+def test_memory_store_allows_burst_then_rejects(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    store = MemoryBucketStore()
+
+    results = [store.take("key", rate=1.0, burst=3.0)[0] for _ in range(4)]
+    assert results == [True, True, True, False]
+
+    now[0] += 1.0
+    assert store.take("key", rate=1.0, burst=3.0)[0]
+    assert store.take("other", rate=1.0, burst=3.0)[0]
+
+
+def test_memory_store_sweeps_idle_buckets(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    store = MemoryBucketStore(max_keys=2)
+    store.take("a", rate=1.0, burst=1.0)
+    store.take("b", rate=1.0, burst=1.0)
+
+    now[0] += 10.0
+    store.take("c", rate=1.0, burst=1.0)
+
+    assert store.stats()["keys"] == 1
+
+
+def test_shared_memory_store_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "ratelimit")
+    first = SharedMemoryBucketStore(path, slots=128)
+    second = SharedMemoryBucketStore(path, slots=128)
+
+    assert first.take("key", rate=0.001, burst=1.0)[0]
+    allowed, retry_after = second.take("key", rate=0.001, burst=1.0)
+    assert not allowed and retry_after > 0
+
+
+def test_client_ip_uses_forwarded_for_only_from_trusted_proxies():
+    middleware = RateLimitMiddleware(None, [], MemoryBucketStore(), trusted_proxies=parse_networks(DEFAULT_TRUSTED_PROXIES))
+
+    assert middleware.client_ip("10.0.0.2", "203.0.113.9") == "203.0.113.9"
+    # 클라이언트가 앞쪽에 넣은 주소는 무시하고 신뢰 프록시 바로 앞의 주소 사용
+    assert middleware.client_ip("10.0.0.2", "198.51.100.1, 203.0.113.9, 100.64.0.3") == "203.0.113.9"
+    assert middleware.client_ip("203.0.113.50", "198.51.100.1") == "203.0.113.50"
+    assert middleware.client_ip("10.0.0.2", None) == "10.0.0.2"
+
+
+def test_client_ip_without_trusted_proxies_uses_peer():
+    middleware = RateLimitMiddleware(None, [], MemoryBucketStore())
+
+    assert middleware.client_ip("10.0.0.2", "203.0.113.9") == "10.0.0.2"
@@ -0,0 +1,116 @@
+# gateway/tests/test_revocation.py
+
+import os
+import time
+
+from app.domain.service.revocation import CountingBloomFilter, TokenRevocationList
+
+
+def test_counting_bloom_filter_add_remove():
+    bloom = CountingBloomFilter(size=1024, hashes=4)
+    bloom.add("a")
+    bloom.add("b")
+
+    assert bloom.might_contain("a") and bloom.might_contain("b")
+    bloom.remove("a")
+    assert not bloom.might_contain("a")
+    assert bloom.might_contain("b")
+
+
+def test_counting_bloom_filter_saturated_counters_are_not_decremented():
+    bloom = CountingBloomFilter(size=64, hashes=1)
+    for _ in range(300):
+        bloom.add("hot")
+    bloom.remove("hot")
+
+    assert bloom.might_contain("hot")
+
+
+def test_revoke_and_expire(monkeypatch):
+    revocations = TokenRevocationList(size=4096)
+    now = time.time()
+    revocations.revoke("jti-1", now + 5)
+    revocations.revoke("already-expired", now - 1)
+
+    assert revocations.is_revoked("jti-1")
+    assert not revocations.is_revoked("already-expired")
+    assert not revocations.is_revoked("other")
+
+    monkeypatch.setattr(time, "time", lambda: now + 10)
+    assert not revocations.is_revoked("jti-1")
+    assert revocations.stats()["revoked"] == 0
+
+
+def test_re_revoke_keeps_latest_expiry(monkeypatch):
+    revocations = TokenRevocationList(size=4096)
+    now = time.time()
+    revocations.revoke("jti", now + 5)
+    revocations.revoke("jti", now + 50)
+
+    monkeypatch.setattr(time, "time", lambda: now + 10)
+    assert revocations.is_revoked("jti")
+
+
+def test_false_positive_is_resolved_by_exact_set():
+    revocations = TokenRevocationList(size=64, hashes=1)
+    for index in range(64):
+        revocations.revoke(f"jti-{index}", time.time() + 60)
+
+    # 필터가 거의 포화된 상태에서도 폐기하지 않은 ID는 정확한 맵에서 걸러짐
+    assert not any(revocations.is_revoked(f"other-{index}") for index in range(200))
+
+
+def test_workers_share_revocations_through_log(tmp_path):
+    path = str(tmp_path / "revocations.bin")
+    first = TokenRevocationList(size=4096, snapshot_path=path)
+    second = TokenRevocationList(size=4096, snapshot_path=path)
+    first.sync()
+    second.sync()
+
+    first.revoke("jti-1", time.time() + 60)
+    second.sync()
+    assert second.is_revoked("jti-1")
+
+    second.revoke("jti-2", time.time() + 60)
+    first.sync()
+    assert first.is_revoked("jti-2")
+
+
+def test_compaction_moves_log_into_snapshot(tmp_path):
+    path = str(tmp_path / "revocations.bin")
+    first = TokenRevocationList(size=4096, snapshot_path=path)
+    second = TokenRevocationList(size=4096, snapshot_path=path)
+    first.revoke("jti-1", time.time() + 60)
+    first.revoke("short", time.time() + 0.01)
+    time.sleep(0.02)
+
+    assert first.compact()
+    assert os.path.getsize(path + ".log") == 0
+    assert not first.compact()
+
+    second.revoke("jti-2", time.time() + 60)
+    second.sync()
+    first.sync()
+    assert second.is_revoked("jti-1")
+    assert first.is_revoked("jti-2")
+
+    fresh = TokenRevocationList(size=4096, snapshot_path=path)
+    fresh.sync()
+    assert fresh.is_revoked("jti-1") and fresh.is_revoked("jti-2")
+    assert not fresh.is_revoked("short")
+
+
+def test_partial_log_line_is_read_on_next_sync(tmp_path):
+    path = str(tmp_path / "revocations.bin")
+    revocations = TokenRevocationList(size=4096, snapshot_path=path)
+    exp = time.time() + 60
+    with open(path + ".log", "ab") as f:
+        f.write(f'["jti-1",{exp}'.encode())
+
+    revocations.sync()
+    assert not revocations.is_revoked("jti-1")
+
+    with open(path + ".log", "ab") as f:
+        f.write(b"]\n")
+    revocations.sync()
+    assert revocations.is_revoked("jti-1")
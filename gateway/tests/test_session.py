@@ -0,0 +1,109 @@
+# gateway/tests/test_session.py
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.domain.service.session_store import MemorySessionStore, SQLiteSessionStore
+from app.middleware.session import ServerSessionMiddleware
+
+
+class RecordingSQLiteSessionStore(SQLiteSessionStore):
+    """저장소 메서드가 호출된 스레드를 기록"""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.calls = []
+
+    def load(self, session_id):
+        self.calls.append(("load", threading.get_ident()))
+        return super().load(session_id)
+
+    def save(self, session_id, data, ttl):
+        self.calls.append(("save", threading.get_ident()))
+        super().save(session_id, data, ttl)
+
+    def delete(self, session_id):
+        self.calls.append(("delete", threading.get_ident()))
+        super().delete(session_id)
+
+
+async def increment(request):
+    request.session["n"] = request.session.get("n", 0) + 1
+    return PlainTextResponse(str(request.session["n"]))
+
+
+async def read(request):
+    return PlainTextResponse(str(request.session.get("n")))
+
+
+async def logout(request):
+    request.session.clear()
+    return PlainTextResponse("bye")
+
+
+def make_app(store):
+    app = Starlette(routes=[Route("/inc", increment), Route("/read", read), Route("/logout", logout)])
+    app.add_middleware(ServerSessionMiddleware, store=store, max_age=100)
+    return app
+
+
+def run_flow(store):
+    async def scenario():
+        async with httpx.AsyncClient(app=make_app(store), base_url="http://t") as client:
+            first = await client.get("/inc")
+            second = await client.get("/inc")
+            read_only = await client.get("/read")
+            logged_out = await client.get("/logout")
+            after = await client.get("/read")
+            return first, second, read_only, logged_out, after, threading.get_ident()
+
+    return asyncio.run(scenario())
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        store = MemorySessionStore()
+    else:
+        store = RecordingSQLiteSessionStore(str(tmp_path / "sessions.db"))
+    yield store
+    store.close()
+
+
+def test_session_cookie_lifecycle(store):
+    first, second, read_only, logged_out, after, _ = run_flow(store)
+
+    assert first.text == "1" and "Max-Age=100" in first.headers["set-cookie"]
+    # 기존 세션 변경 시 같은 ID로 쿠키를 다시 내려 TTL을 연장
+    assert second.text == "2"
+    assert second.headers["set-cookie"].split(";")[0] == first.headers["set-cookie"].split(";")[0]
+    # 세션을 바꾸지 않은 응답은 쿠키를 내려보내지 않음
+    assert read_only.text == "2" and "set-cookie" not in read_only.headers
+    assert "expires=Thu, 01 Jan 1970" in logged_out.headers["set-cookie"]
+    assert after.text == "None"
+
+
+def test_unknown_session_id_is_not_reused(store):
+    async def scenario():
+        async with httpx.AsyncClient(app=make_app(store), base_url="http://t") as client:
+            forged = "a" * 43
+            return forged, await client.get("/inc", cookies={"session": forged})
+
+    forged, response = asyncio.run(scenario())
+    assert response.text == "1"
+    assert not response.headers["set-cookie"].startswith(f"session={forged};")
+
+
+def test_blocking_store_runs_off_event_loop(tmp_path):
+    store = RecordingSQLiteSessionStore(str(tmp_path / "sessions.db"))
+    *_, loop_thread = run_flow(store)
+    store.close()
+
+    assert {name for name, _ in store.calls} == {"load", "save", "delete"}
+    assert all(thread != loop_thread for _, thread in store.calls)
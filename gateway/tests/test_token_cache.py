@@ -0,0 +1,111 @@
+# gateway/tests/test_token_cache.py
+
+import time
+
+import pytest
+
+from app.domain.service.token_cache import SharedMemoryTokenCache, VerifiedTokenCache
+
+
+def payload(sub: str = "user-1", ttl: float = 60.0):
+    return {"sub": sub, "exp": time.time() + ttl}
+
+
+def test_get_returns_copy_of_cached_payload():
+    cache = VerifiedTokenCache(max_size=10)
+    cache.put("token", payload())
+
+    cached = cache.get("token")
+    cached["sub"] = "tampered"
+
+    assert cache.get("token")["sub"] == "user-1"
+    assert cache.stats()["hits"] == 2
+
+
+def test_expired_and_exp_less_payloads_are_not_cached():
+    cache = VerifiedTokenCache(max_size=10)
+    cache.put("expired", payload(ttl=-1))
+    cache.put("no-exp", {"sub": "user-1"})
+
+    assert cache.get("expired") is None
+    assert cache.get("no-exp") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_entry_expires_at_token_exp(monkeypatch):
+    cache = VerifiedTokenCache(max_size=10)
+    now = time.time()
+    cache.put("token", {"sub": "user-1", "exp": now + 5})
+
+    monkeypatch.setattr(time, "time", lambda: now + 10)
+
+    assert cache.get("token") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_lru_eviction_keeps_recently_used():
+    cache = VerifiedTokenCache(max_size=2)
+    cache.put("a", payload("a"))
+    cache.put("b", payload("b"))
+    cache.get("a")
+    cache.put("c", payload("c"))
+
+    assert cache.get("b") is None
+    assert cache.get("a")["sub"] == "a"
+    assert cache.get("c")["sub"] == "c"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_peek_does_not_touch_counters():
+    cache = VerifiedTokenCache(max_size=10)
+    cache.put("token", payload())
+
+    assert cache.peek("token")["sub"] == "user-1"
+    assert cache.peek("missing") is None
+    assert cache.stats()["hits"] == 0
+    assert cache.stats()["misses"] == 0
+
+
+def test_invalidate_and_disabled_cache():
+    cache = VerifiedTokenCache(max_size=10)
+    cache.put("token", payload())
+    cache.invalidate("token")
+    assert cache.get("token") is None
+
+    disabled = VerifiedTokenCache(max_size=0)
+    disabled.put("token", payload())
+    assert disabled.get("token") is None
+
+
+@pytest.fixture
+def shm_path(tmp_path):
+    return str(tmp_path / "token_cache")
+
+
+def test_shared_memory_cache_is_visible_across_instances(shm_path):
+    writer = SharedMemoryTokenCache(shm_path, slots=64, namespace="secret")
+    reader = SharedMemoryTokenCache(shm_path, slots=64, namespace="secret")
+
+    writer.put("token", payload())
+
+    assert reader.get("token")["sub"] == "user-1"
+    writer.invalidate("token")
+    assert reader.get("token") is None
+
+
+def test_shared_memory_cache_is_keyed_by_namespace(shm_path):
+    old_key = SharedMemoryTokenCache(shm_path, slots=64, namespace="old-secret")
+    new_key = SharedMemoryTokenCache(shm_path, slots=64, namespace="new-secret")
+
+    old_key.put("token", payload())
+
+    assert new_key.get("token") is None
+
+
+def test_shared_memory_cache_skips_oversized_payloads(shm_path):
+    cache = SharedMemoryTokenCache(shm_path, slots=8, slot_bytes=128)
+
+    cache.put("token", {"sub": "x" * 512, "exp": time.time() + 60})
+
+    assert cache.get("token") is None
+    assert cache.stats()["oversized"] == 1
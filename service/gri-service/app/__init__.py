@@ -2,17 +2,11 @@
 ESG Analysis Service Package
 
 이 패키지는 ESG 관련 뉴스 분석 및 시각화 기능을 제공합니다.
-"""
 
-from .analysis import preprocess, count_gri_frequency
-from .visualization import create_wordcloud, create_materiality_matrix
+서비스 모듈은 app 디렉터리를 최상위 경로로 두고 실행되며(uvicorn main:app) 서로를 절대 경로로 import 합니다.
+(from tokenizer import ...) 패키지 상대 경로 재노출과 섞이면 같은 모듈이 두 번 로드되거나
+`import app`이 실패하므로 여기서는 하위 모듈을 재노출하지 않습니다.
+"""
 
 __version__ = "1.0.0"
 __author__ = "ESG Analysis Team"
-
-__all__ = [
-    "preprocess",
-    "count_gri_frequency", 
-    "create_wordcloud",
-    "create_materiality_matrix"
-]
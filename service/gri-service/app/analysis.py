@@ -1,33 +1,52 @@
+import os
 import pandas as pd
 import json
-from konlpy.tag import Okt
 from collections import Counter
+from tokenizer import get_tokenizer, filter_nouns
+from matcher import GRIMatcher
+
+GRI_DICT_PATH = os.getenv("GRI_DICT_PATH", "data/gri_keyword_dict.json")
+
+# 비즈니스 영향도 (이 부분은 프로젝트의 가상 시나리오에 따라 수동으로 점수 부여)
+BUSINESS_IMPACT = {
+    "GRI 305: Emissions": 5,
+    "GRI 403: Safety": 5,
+    "GRI 414: Supplier": 4,
+    "GRI 205: Corruption": 3,
+}
+
+# GRI 키워드 사전 로드
+def load_gri_dict(path=None):
+    with open(path or GRI_DICT_PATH, 'r', encoding='utf-8') as f:
+        return json.load(f)
 
 # 텍스트 전처리 함수
 def preprocess(text):
-    okt = Okt()
-    stopwords = ['의', '가', '이', '은', '들', '는', '좀', '잘', '걍', '과', '도', '를', '으로', '자', '에', '와', '한', '하다']
-    # 명사만 추출
-    nouns = okt.nouns(str(text))
+    # 명사만 추출 (프로세스 공용 Okt 사용)
+    nouns = get_tokenizer().nouns(text)
     # 한 글자 단어 및 불용어 제거
-    words = [n for n in nouns if len(n) > 1 and n not in stopwords]
+    words = filter_nouns(nouns)
     return words
 
+# 여러 문서를 한 번에 전처리
+def preprocess_many(texts):
+    return [filter_nouns(nouns) for nouns in get_tokenizer().nouns_many(texts)]
+
 # GRI 주제 매칭 및 빈도수 계산 함수
-def count_gri_frequency(df, gri_dict):
-    gri_counts = {topic: 0 for topic in gri_dict.keys()}
-    
-    for text in df['article_text']: # 'article_text'는 뉴스 본문이 있는 컬럼명
-        processed_words = preprocess(text)
-        # 각 기사마다 어떤 주제가 등장했는지 중복 없이 체크
-        found_topics_in_article = set()
-        for word in processed_words:
-            for topic, keywords in gri_dict.items():
-                if word in keywords:
-                    found_topics_in_article.add(topic)
-        
-        # 기사에서 한 번이라도 등장한 주제의 카운트를 1씩 올림
-        for topic in found_topics_in_article:
-            gri_counts[topic] += 1
-            
-    return gri_counts
\ No newline at end of file
+# backend: "index"(키워드 역색인, 기본값) 또는 "sparse"(scikit-learn 희소 행렬 연산)
+def count_gri_frequency(df, gri_dict, article_nouns=None, backend="index"):
+    # 이미 토큰화된 기사별 명사 집합이 있으면 재사용하여 중복 토큰화를 피함
+    if article_nouns is None:
+        article_nouns = [set(preprocess(text)) for text in df['article_text']] # 'article_text'는 뉴스 본문이 있는 컬럼명
+    if backend == "sparse":
+        from vectorized import analyze_topics
+        matcher = gri_dict if isinstance(gri_dict, GRIMatcher) else GRIMatcher(gri_dict)
+        return analyze_topics(article_nouns, matcher).topic_counts
+    return count_gri_frequency_from_nouns(article_nouns, gri_dict)
+
+# 기사별 명사 집합으로부터 GRI 주제 빈도수 계산
+def count_gri_frequency_from_nouns(article_nouns, gri_dict):
+    # 키워드 → 주제 역색인으로 한 번 컴파일한 매처를 사용 (컴파일된 GRIMatcher도 그대로 받음)
+    matcher = gri_dict if isinstance(gri_dict, GRIMatcher) else GRIMatcher(gri_dict)
+    # 기사마다 한 번이라도 등장한 주제의 카운트를 1씩 올림
+    return matcher.count_articles(article_nouns)
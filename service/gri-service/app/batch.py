@@ -0,0 +1,85 @@
+import os
+from analysis import BUSINESS_IMPACT, count_gri_frequency, load_gri_dict
+from ingest import ARROW_FORMATS, DEFAULT_INPUT_PATH, DEFAULT_TEXT_COLUMN, iter_article_texts
+from matcher import GRIMatcher
+from parallel import count_corpus_incremental, count_corpus_streaming, tokenize_corpus
+from token_cache import TokenCache
+from vectorized import analyze_topics
+from visualization import create_wordcloud, create_materiality_matrix
+import pandas as pd
+
+# true이면 입력 전체를 메모리에 올리지 않고 청크 단위로 읽으며 누적 집계
+STREAMING = os.getenv("GRI_STREAMING", "false").lower() == "true"
+# true이면 토큰화 캐시를 사용하여 새 기사만 토큰화 (GRI_FORCE_REBUILD=true로 전체 재구축)
+INCREMENTAL = os.getenv("GRI_INCREMENTAL", "false").lower() == "true"
+FORCE_REBUILD = os.getenv("GRI_FORCE_REBUILD", "false").lower() == "true"
+# 주제 빈도 계산 방식: index(키워드 역색인) | sparse(희소 행렬 연산, 동시 등장/TF-IDF 중요도 포함)
+FREQUENCY_BACKEND = os.getenv("GRI_FREQUENCY_BACKEND", "index")
+# 중대성 평가 매트릭스 Y축: count(등장 기사 수) | salience(TF-IDF 가중 중요도, 전체 토큰화 모드에서 사용)
+MATERIALITY_METRIC = os.getenv("GRI_MATERIALITY_METRIC", "count")
+
+def run_analysis(input_path=None, streaming=None, incremental=None, force_rebuild=None):
+    input_path = input_path or DEFAULT_INPUT_PATH
+    media_scores = None
+    incremental = INCREMENTAL if incremental is None else incremental
+    force_rebuild = FORCE_REBUILD if force_rebuild is None else force_rebuild
+    if streaming is None:
+        # Parquet/Arrow 입력은 항상 스트리밍으로 처리
+        streaming = STREAMING or os.path.splitext(input_path)[1].lower() in ARROW_FORMATS
+
+    # --- 1. 데이터 로드 ---
+    print("Loading data...")
+    gri_dict = load_gri_dict()
+    # 키워드 → 주제 역색인을 한 번만 컴파일
+    matcher = GRIMatcher(gri_dict)
+
+    if incremental:
+        # --- 2~3. 캐시에 없는 기사만 토큰화하여 누적 빈도 갱신 ---
+        print(f"Updating token cache from {input_path}...")
+        cache = TokenCache()
+        try:
+            corpus = count_corpus_incremental(iter_article_texts(input_path), matcher, cache, force_rebuild=force_rebuild)
+        finally:
+            cache.close()
+        print(f"Tokenized {corpus.new_articles} new articles ({corpus.articles} cached)")
+        word_counts, gri_freq = corpus.word_counts, corpus.topic_counts
+    elif streaming:
+        # --- 2~3. 청크 단위 토큰화 + 명사/주제 빈도 누적 (기사당 1회) ---
+        print(f"Streaming articles from {input_path}...")
+        corpus = count_corpus_streaming(iter_article_texts(input_path), matcher)
+        print(f"Processed {corpus.articles} articles")
+        word_counts, gri_freq = corpus.word_counts, corpus.topic_counts
+    else:
+        df = pd.read_csv(input_path)
+
+        # --- 2. 전체 기사 토큰화 (멀티 프로세스, 기사당 1회) ---
+        print("Tokenizing articles...")
+        corpus = tokenize_corpus(df[DEFAULT_TEXT_COLUMN])
+        word_counts = corpus.word_counts
+
+        # --- 3. GRI 주제별 빈도수 계산 ---
+        print("Counting GRI topic frequencies...")
+        if FREQUENCY_BACKEND == "sparse" or MATERIALITY_METRIC == "salience":
+            # 한 번의 희소 행렬 구성으로 빈도, 동시 등장, 중요도를 함께 계산
+            topic_stats = analyze_topics(corpus.article_nouns, matcher)
+            gri_freq = topic_stats.topic_counts
+            print("GRI Co-occurrence:\n" + topic_stats.cooccurrence.to_string())
+            if MATERIALITY_METRIC == "salience":
+                media_scores = topic_stats.salience
+        else:
+            gri_freq = count_gri_frequency(df, matcher, article_nouns=corpus.article_nouns)
+
+    # --- 4. 워드 클라우드 생성 ---
+    print("Generating word cloud...")
+    create_wordcloud(word_counts, 'output/esg_wordcloud.png')
+    print("GRI Frequencies:", gri_freq)
+
+    # --- 5. 중대성 평가 매트릭스 생성 ---
+    print("Generating materiality matrix...")
+    create_materiality_matrix(media_scores or gri_freq, BUSINESS_IMPACT, 'output/materiality_matrix.png')
+    
+    print("Analysis complete!")
+
+
+if __name__ == '__main__':
+    run_analysis()
\ No newline at end of file
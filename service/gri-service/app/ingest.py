@@ -0,0 +1,60 @@
+import os
+from typing import Iterator, Optional
+
+import pandas as pd
+
+DEFAULT_INPUT_PATH = os.getenv("GRI_INPUT_PATH", "data/crawled_news.csv")
+DEFAULT_TEXT_COLUMN = os.getenv("GRI_TEXT_COLUMN", "article_text")
+DEFAULT_READ_CHUNK_SIZE = int(os.getenv("GRI_READ_CHUNK_SIZE", "10000"))
+
+# Arrow 계열 입력 형식 (pyarrow.dataset 포맷 이름)
+ARROW_FORMATS = {
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".arrow": "ipc",
+    ".feather": "ipc",
+    ".ipc": "ipc",
+}
+
+
+def iter_csv_texts(source, column: Optional[str] = None, chunk_size: Optional[int] = None) -> Iterator[str]:
+    """CSV 파일 경로 또는 파일 객체(업로드 파일 등)에서 기사 본문을 스트리밍으로 생성"""
+    column = column or DEFAULT_TEXT_COLUMN
+    # 필요한 컬럼만 청크 단위로 읽어 메모리 사용량을 청크 크기로 제한
+    reader = pd.read_csv(source, usecols=[column], dtype={column: str}, chunksize=chunk_size or DEFAULT_READ_CHUNK_SIZE)
+    with reader:
+        for chunk in reader:
+            for text in chunk[column]:
+                if isinstance(text, str) and text:
+                    yield text
+
+
+def _iter_arrow(path: str, file_format: str, column: str, chunk_size: int) -> Iterator[str]:
+    try:
+        import pyarrow.dataset as ds
+    except ImportError:
+        raise RuntimeError("Parquet/Arrow 입력을 읽으려면 pyarrow를 설치해야 합니다 (pip install pyarrow)")
+
+    # 컬럼 프로젝션: article_text 외의 컬럼은 디스크에서 읽지 않음
+    dataset = ds.dataset(path, format=file_format)
+    for batch in dataset.to_batches(columns=[column], batch_size=chunk_size):
+        for text in batch.column(0).to_pylist():
+            if text:
+                yield str(text)
+
+
+def iter_article_texts(path: Optional[str] = None, column: Optional[str] = None, chunk_size: Optional[int] = None) -> Iterator[str]:
+    """
+    기사 본문을 스트리밍으로 하나씩 생성
+
+    CSV는 pandas 청크 읽기, Parquet/Arrow(.parquet, .arrow, .feather)는 pyarrow 배치 읽기를 사용하며
+    어느 경우든 본문 컬럼만 읽습니다. 빈 본문은 건너뜁니다.
+    """
+    path = path or DEFAULT_INPUT_PATH
+    column = column or DEFAULT_TEXT_COLUMN
+    chunk_size = chunk_size or DEFAULT_READ_CHUNK_SIZE
+
+    extension = os.path.splitext(path)[1].lower()
+    if extension in ARROW_FORMATS:
+        return _iter_arrow(path, ARROW_FORMATS[extension], column, chunk_size)
+    return iter_csv_texts(path, column, chunk_size)
@@ -1,44 +1,300 @@
-from analysis import preprocess, count_gri_frequency
-from visualization import create_wordcloud, create_materiality_matrix
-import pandas as pd
-import json
-from collections import Counter
-
-def run_analysis():
-    # --- 1. 데이터 로드 ---
-    print("Loading data...")
-    df = pd.read_csv('data/crawled_news.csv')
-    with open('data/gri_keyword_dict.json', 'r', encoding='utf-8') as f:
-        gri_dict = json.load(f)
-
-    # --- 2. 전체 키워드 추출 및 워드 클라우드 생성 ---
-    print("Generating word cloud...")
-    all_words = []
-    for text in df['article_text']:
-        all_words.extend(preprocess(text))
-    
-    word_counts = Counter(all_words)
-    create_wordcloud(word_counts, 'output/esg_wordcloud.png')
-
-    # --- 3. GRI 주제별 빈도수 계산 ---
-    print("Counting GRI topic frequencies...")
-    gri_freq = count_gri_frequency(df, gri_dict)
-    print("GRI Frequencies:", gri_freq)
-
-    # --- 4. 중대성 평가 매트릭스 생성 ---
-    # 비즈니스 영향도 (이 부분은 프로젝트의 가상 시나리오에 따라 수동으로 점수 부여)
-    business_impact = {
-        "GRI 305: Emissions": 5,
-        "GRI 403: Safety": 5,
-        "GRI 414: Supplier": 4,
-        "GRI 205: Corruption": 3,
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
+from contextlib import asynccontextmanager
+from pydantic import ValidationError
+import httpx
+import os
+import sys
+import socket
+import argparse
+import logging
+from datetime import datetime
+import asyncio
+
+from ingest import iter_csv_texts
+from metrics import MetricsMiddleware, metrics_endpoint
+from model.analysis_schema import AnalyzeRequest, AnalysisResult
+from rendering import RenderService
+from service.gri_service import GRIAnalysisService
+from visualization import IMAGE_FORMATS
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 환경 변수 설정
+GRI_SERVICE_PORT = int(os.getenv("GRI_SERVICE_PORT", "8003"))
+GATEWAY_URL = os.getenv("GATEWAY_URL", "http://localhost:8000")
+ALLOWED_ORIGINS = [
+    "http://localhost:3000",  # Frontend
+    "http://localhost:8000",  # Gateway
+    "http://localhost:8080",  # Gateway (Docker)
+]
+
+# Gateway 서비스 레지스트리 설정
+SERVICE_NAME = "gri"
+GRI_PUBLIC_URL = os.getenv("GRI_PUBLIC_URL", f"http://localhost:{GRI_SERVICE_PORT}")
+GRI_INSTANCE_ID = os.getenv("GRI_INSTANCE_ID", f"gri-{socket.gethostname()}-{GRI_SERVICE_PORT}")
+# Gateway는 REGISTRY_TOKEN이 설정된 경우에만 레지스트리를 열기 때문에 토큰이 없으면 자가 등록하지 않음 (GATEWAY_ROUTES 정적 라우팅 사용)
+REGISTRY_TOKEN = os.getenv("REGISTRY_TOKEN", "")
+HEARTBEAT_INTERVAL = float(os.getenv("REGISTRY_HEARTBEAT_INTERVAL", "10"))
+
+# 분석 설정
+GRI_FREQUENCY_BACKEND = os.getenv("GRI_FREQUENCY_BACKEND", "index")
+GRI_RESULT_CACHE_SIZE = int(os.getenv("GRI_RESULT_CACHE_SIZE", "64"))
+# 동시에 실행되는 분석 수 (Okt 토큰화는 CPU 작업이므로 코어 수 정도로 제한)
+GRI_MAX_CONCURRENT_ANALYSES = int(os.getenv("GRI_MAX_CONCURRENT_ANALYSES", str(os.cpu_count() or 2)))
+
+# 이미지 렌더링 설정 (워커 0이면 프로세스 풀 없이 스레드에서 렌더링)
+GRI_RENDER_WORKERS = int(os.getenv("GRI_RENDER_WORKERS", "2"))
+GRI_RENDER_CACHE_BYTES = int(os.getenv("GRI_RENDER_CACHE_BYTES", str(64 * 1024 * 1024)))
+
+gri_service = GRIAnalysisService(backend=GRI_FREQUENCY_BACKEND, result_cache_size=GRI_RESULT_CACHE_SIZE)
+analysis_slots = asyncio.Semaphore(GRI_MAX_CONCURRENT_ANALYSES)
+render_service = RenderService(workers=GRI_RENDER_WORKERS, cache_max_bytes=GRI_RENDER_CACHE_BYTES)
+
+async def register_with_gateway(client: httpx.AsyncClient) -> bool:
+    """Gateway 레지스트리에 현재 인스턴스 등록"""
+    try:
+        response = await client.post(
+            f"{GATEWAY_URL}/registry/register",
+            json={
+                "service": SERVICE_NAME,
+                "url": GRI_PUBLIC_URL,
+                "instance_id": GRI_INSTANCE_ID,
+                "metadata": {"version": "1.0.0"}
+            },
+            headers={"X-Registry-Token": REGISTRY_TOKEN}
+        )
+        response.raise_for_status()
+        logger.info(f"Gateway 등록 완료: {GRI_INSTANCE_ID} -> {GRI_PUBLIC_URL}")
+        return True
+    except Exception as e:
+        logger.warning(f"Gateway 등록 실패: {e}")
+        return False
+
+async def heartbeat_loop(client: httpx.AsyncClient):
+    """주기적으로 하트비트 전송 (Gateway 재시작 등으로 등록이 사라지면 재등록)"""
+    while True:
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        try:
+            response = await client.post(
+                f"{GATEWAY_URL}/registry/heartbeat",
+                json={"service": SERVICE_NAME, "instance_id": GRI_INSTANCE_ID},
+                headers={"X-Registry-Token": REGISTRY_TOKEN}
+            )
+            if response.status_code == 404:
+                await register_with_gateway(client)
+        except Exception as e:
+            logger.warning(f"Gateway 하트비트 실패: {e}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 생명주기 관리"""
+    # 시작 시 실행: JVM 기동, Okt 사전 로딩, GRI 사전 컴파일을 요청 전에 끝냄
+    logger.info(f"GRI 서비스가 포트 {GRI_SERVICE_PORT}에서 시작됨")
+    await run_in_threadpool(gri_service.start)
+    render_service.start()
+    client = httpx.AsyncClient(timeout=5.0)
+    heartbeat_task = None
+    if REGISTRY_TOKEN:
+        await register_with_gateway(client)
+        heartbeat_task = asyncio.create_task(heartbeat_loop(client))
+    else:
+        logger.info("REGISTRY_TOKEN 미설정: Gateway 자가 등록 생략")
+
+    yield  # 애플리케이션 실행
+
+    # 종료 시 실행
+    if heartbeat_task is not None:
+        heartbeat_task.cancel()
+        try:
+            await client.delete(
+                f"{GATEWAY_URL}/registry/{SERVICE_NAME}/{GRI_INSTANCE_ID}",
+                headers={"X-Registry-Token": REGISTRY_TOKEN}
+            )
+        except Exception as e:
+            logger.warning(f"Gateway 등록 해제 실패: {e}")
+    await client.aclose()
+    await render_service.stop()
+    logger.info("GRI 서비스 종료")
+
+app = FastAPI(
+    title="GRI Analysis Service",
+    description="GRI (Global Reporting Initiative) 뉴스 분석 서비스",
+    version="1.0.0",
+    docs_url="/docs",
+    redoc_url="/redoc",
+    lifespan=lifespan
+)
+
+# CORS 설정
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=ALLOWED_ORIGINS,
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+app.add_middleware(MetricsMiddleware)
+app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+
+service_start_time = datetime.now().isoformat()
+
+@app.get("/")
+async def root():
+    """GRI 서비스 루트 엔드포인트"""
+    return {
+        "message": "GRI Analysis Service is running",
+        "version": "1.0.0",
+        "service": "gri-service",
+        "port": GRI_SERVICE_PORT,
+        "docs": "/docs"
+    }
+
+@app.get("/health")
+async def health_check():
+    """헬스체크 엔드포인트"""
+    return {
+        "status": "healthy" if gri_service.ready else "starting",
+        "service": "gri-service",
+        "port": GRI_SERVICE_PORT,
+        "timestamp": datetime.now().isoformat(),
+        "uptime": service_start_time
+    }
+
+@app.get("/status")
+async def get_service_status():
+    """서비스 상태 정보"""
+    return {
+        "status": "healthy",
+        "service_start_time": service_start_time,
+        "max_concurrent_analyses": GRI_MAX_CONCURRENT_ANALYSES,
+        **gri_service.stats(),
+        "render_cache": render_service.stats()
+    }
+
+async def _read_analyze_request(request: Request):
+    """JSON 텍스트 묶음 또는 multipart CSV 업로드(file 필드)를 (texts, business_impact)로 변환"""
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("multipart/form-data"):
+        form = await request.form()
+        upload = form.get("file")
+        if upload is None or not hasattr(upload, "file"):
+            raise HTTPException(status_code=400, detail="CSV 파일(file 필드)이 필요합니다")
+        # 업로드 파일은 청크 단위로 읽으며 article_text 컬럼만 사용
+        texts = await run_in_threadpool(lambda: list(iter_csv_texts(upload.file)))
+        return texts, None
+
+    try:
+        body = AnalyzeRequest.model_validate(await request.json())
+    except (ValidationError, ValueError) as e:
+        raise HTTPException(status_code=422, detail=f"잘못된 요청 형식: {e}")
+    return body.texts, body.business_impact
+
+@app.post("/analyze", response_model=AnalysisResult)
+async def analyze_gri(request: Request):
+    """
+    GRI 분석 실행
+
+    - JSON: {"texts": ["기사 본문", ...], "business_impact": {...}}
+    - multipart: file=<article_text 컬럼이 있는 CSV>
+    워밍업된 형태소 분석기로 즉시 분석하여 주제 빈도를 반환합니다.
+    """
+    try:
+        texts, business_impact = await _read_analyze_request(request)
+        if not texts:
+            raise HTTPException(status_code=400, detail="분석할 기사 본문이 필요합니다")
+        logger.info(f"GRI 분석 요청 받음: 기사 {len(texts)}건")
+
+        async with analysis_slots:
+            result = await run_in_threadpool(gri_service.analyze, texts, business_impact)
+        return result
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"GRI 분석 오류: {e}")
+        raise HTTPException(status_code=500, detail=f"분석 중 오류 발생: {str(e)}")
+
+def _get_result_or_404(analysis_id: str = None):
+    entry = gri_service.get(analysis_id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="분석 결과를 찾을 수 없습니다")
+    return entry
+
+@app.get("/frequencies", response_model=AnalysisResult)
+async def get_frequencies(analysis_id: str = None):
+    """GRI 주제별 빈도 조회 (analysis_id 미지정 시 가장 최근 분석)"""
+    return _get_result_or_404(analysis_id)[0]
+
+@app.get("/analysis/{analysis_id}", response_model=AnalysisResult)
+async def get_analysis_result(analysis_id: str):
+    """분석 결과 조회 ("latest"는 가장 최근 분석)"""
+    return _get_result_or_404(analysis_id)[0]
+
+async def _image_response(request: Request, fmt: str, kind: str, *args) -> Response:
+    """렌더링 서비스로 이미지를 만들고 ETag(입력 해시)로 조건부 응답"""
+    if fmt not in IMAGE_FORMATS:
+        raise HTTPException(status_code=404, detail="지원하지 않는 이미지 형식입니다 (png, svg)")
+    try:
+        key, image = await render_service.render(kind, fmt, *args)
+    except Exception as e:
+        logger.error(f"이미지 생성 오류 ({kind}): {e}")
+        raise HTTPException(status_code=500, detail=f"이미지 생성 중 오류 발생: {str(e)}")
+    headers = {"ETag": f'"{key[:32]}"', "Cache-Control": "private, max-age=0, must-revalidate"}
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=image, media_type=IMAGE_FORMATS[fmt], headers=headers)
+
+@app.get("/analysis/{analysis_id}/wordcloud.{fmt}")
+async def get_wordcloud(analysis_id: str, fmt: str, request: Request):
+    """분석 결과의 워드 클라우드 이미지 (png | svg)"""
+    result, word_counts = _get_result_or_404(analysis_id)
+    if not word_counts:
+        raise HTTPException(status_code=404, detail="워드 클라우드를 만들 명사가 없습니다")
+    return await _image_response(request, fmt, "wordcloud", dict(word_counts))
+
+@app.get("/analysis/{analysis_id}/materiality.{fmt}")
+async def get_materiality_matrix(analysis_id: str, fmt: str, request: Request):
+    """분석 결과의 중대성 평가 매트릭스 이미지 (png | svg)"""
+    result, _ = _get_result_or_404(analysis_id)
+    return await _image_response(request, fmt, "materiality", result.salience or result.gri_frequencies, result.business_impact)
+
+@app.get("/gri-topics")
+async def get_gri_topics():
+    """GRI 주제 목록 조회"""
+    matcher = gri_service.matcher
+    topics = []
+    if matcher is not None:
+        keyword_counts = [0] * len(matcher.topics)
+        for topic_ids in matcher.keyword_topics.values():
+            for topic_id in topic_ids:
+                keyword_counts[topic_id] += 1
+        topics = [
+            {"name": topic, "keyword_count": count}
+            for topic, count in zip(matcher.topics, keyword_counts)
+        ]
+    return {
+        "gri_topics": topics,
+        "total_count": len(topics)
     }
 
-    print("Generating materiality matrix...")
-    create_materiality_matrix(gri_freq, business_impact, 'output/materiality_matrix.png')
-    
-    print("Analysis complete!")
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="GRI 분석 서비스")
+    parser.add_argument("--batch", action="store_true", help="HTTP 서버 대신 기존 배치 분석(run_analysis)을 한 번 실행")
+    args = parser.parse_args()
 
+    if args.batch:
+        from batch import run_analysis
+        run_analysis()
+        sys.exit(0)
 
-if __name__ == '__main__':
-    run_analysis()
\ No newline at end of file
+    import uvicorn
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=GRI_SERVICE_PORT,
+        log_level="info"
+    )
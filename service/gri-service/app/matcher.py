@@ -0,0 +1,127 @@
+import json
+import hashlib
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Set
+
+try:
+    # pyahocorasick이 설치되어 있으면 C 구현 오토마톤 사용 (선택 의존성)
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+class AhoCorasick:
+    """
+    순수 파이썬 Aho-Corasick 오토마톤
+
+    원문 텍스트 한 번의 순회로 등록된 모든 키워드(여러 단어 구문 포함)의 출현을 찾습니다.
+    """
+
+    def __init__(self, patterns: Dict[str, FrozenSet[int]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[FrozenSet[int]] = [frozenset()]
+
+        for pattern, payload in patterns.items():
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(frozenset())
+                state = next_state
+            self._output[state] = self._output[state] | payload
+
+        # BFS로 실패 링크 구성 및 출력 병합
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] | self._output[self._fail[next_state]]
+
+    def search(self, text: str) -> Set[int]:
+        found: Set[int] = set()
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found |= output[state]
+        return found
+
+
+class GRIMatcher:
+    """
+    gri_dict로부터 한 번 컴파일되는 GRI 주제 매처
+
+    - 키워드 → 주제 ID 역색인으로 토큰 목록을 O(토큰 수)에 매칭합니다.
+    - match_text는 Aho-Corasick으로 원문에서 여러 단어 구문까지 직접 찾습니다.
+    주제는 gri_dict 키 순서대로 0부터 시작하는 정수 ID로 표현됩니다.
+    """
+
+    def __init__(self, gri_dict: Dict[str, Iterable[str]]):
+        self.topics: List[str] = list(gri_dict.keys())
+        # 사전 내용의 해시 - 바뀌면 캐시된 기사별 주제 매칭 결과를 다시 계산
+        self.fingerprint = hashlib.sha256(
+            json.dumps(gri_dict, ensure_ascii=False, sort_keys=True, default=list).encode("utf-8")
+        ).hexdigest()
+
+        index: Dict[str, Set[int]] = {}
+        for topic_id, keywords in enumerate(gri_dict.values()):
+            for keyword in keywords:
+                keyword = str(keyword).strip()
+                if keyword:
+                    index.setdefault(keyword, set()).add(topic_id)
+        self.keyword_topics: Dict[str, FrozenSet[int]] = {k: frozenset(v) for k, v in index.items()}
+        self._automaton = None
+
+    def match_tokens(self, tokens: Iterable[str]) -> Set[int]:
+        """토큰(명사) 목록에서 등장한 주제 ID 집합"""
+        found: Set[int] = set()
+        lookup = self.keyword_topics.get
+        for token in set(tokens):
+            topic_ids = lookup(token)
+            if topic_ids:
+                found |= topic_ids
+        return found
+
+    def _build_automaton(self):
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for keyword, topic_ids in self.keyword_topics.items():
+                automaton.add_word(keyword, topic_ids)
+            automaton.make_automaton()
+            return automaton
+        return AhoCorasick(self.keyword_topics)
+
+    def match_text(self, text: str) -> Set[int]:
+        """원문 텍스트에서 부분 문자열로 등장한 주제 ID 집합 (구문 키워드 지원)"""
+        if self._automaton is None:
+            self._automaton = self._build_automaton()
+        if ahocorasick is not None and isinstance(self._automaton, ahocorasick.Automaton):
+            found: Set[int] = set()
+            for _, topic_ids in self._automaton.iter(str(text)):
+                found |= topic_ids
+            return found
+        return self._automaton.search(str(text))
+
+    def count_articles(self, article_nouns: Iterable[Iterable[str]]) -> Dict[str, int]:
+        """주제별로 해당 주제가 한 번이라도 등장한 기사 수"""
+        counts = [0] * len(self.topics)
+        for tokens in article_nouns:
+            for topic_id in self.match_tokens(tokens):
+                counts[topic_id] += 1
+        return dict(zip(self.topics, counts))
+
+    def topic_names(self, topic_ids: Iterable[int]) -> List[str]:
+        return [self.topics[topic_id] for topic_id in sorted(topic_ids)]
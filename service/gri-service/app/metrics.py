@@ -0,0 +1,30 @@
+# gri-service/app/metrics.py
+
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from prometheus_client import Histogram
+
+# 공통 HTTP 메트릭과 미들웨어는 common/metrics_base.py의 복사본 (make sync-common)
+from metrics_base import (  # noqa: F401
+    LATENCY_BUCKETS, REQUEST_LATENCY, REQUESTS_IN_FLIGHT, MetricsMiddleware, metrics_endpoint, route_template,
+)
+
+STAGE_DURATION = Histogram(
+    "gri_stage_duration_seconds",
+    "GRI 분석 단계별 처리 시간 (tokenize / match / render)",
+    ["stage"],
+    buckets=LATENCY_BUCKETS,
+)
+
+
+@contextmanager
+def observe_stage(stage: str) -> Iterator[None]:
+    """분석 단계 처리 시간 기록"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_DURATION.labels(stage).observe(time.perf_counter() - started)
+
@@ -0,0 +1,20 @@
+# gri-service/app/model/analysis_schema.py
+
+from typing import Optional, Dict, List
+from pydantic import BaseModel, Field
+
+
+class AnalyzeRequest(BaseModel):
+    texts: List[str] = Field(..., min_length=1, description="분석할 기사 본문 목록")
+    business_impact: Optional[Dict[str, float]] = Field(None, description="주제별 비즈니스 영향도 (미지정 시 기본값)")
+
+
+class AnalysisResult(BaseModel):
+    analysis_id: str
+    articles: int = Field(..., description="분석한 기사 수")
+    gri_frequencies: Dict[str, int] = Field(..., description="GRI 주제별 등장 기사 수")
+    salience: Optional[Dict[str, float]] = Field(None, description="주제별 TF-IDF 가중 중요도 (sparse 백엔드)")
+    top_words: List[List] = Field(default_factory=list, description="상위 명사와 빈도 [[명사, 빈도], ...]")
+    business_impact: Dict[str, float] = Field(default_factory=dict)
+    elapsed_ms: float
+    created_at: str
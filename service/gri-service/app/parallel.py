@@ -0,0 +1,163 @@
+import os
+import logging
+import multiprocessing
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from analysis import preprocess_many
+from matcher import GRIMatcher
+from token_cache import TokenCache, article_hash
+from tokenizer import get_tokenizer, tokenizer_fingerprint
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = int(os.getenv("GRI_WORKERS", str(os.cpu_count() or 1)))
+DEFAULT_CHUNK_SIZE = int(os.getenv("GRI_CHUNK_SIZE", "256"))
+
+
+class CorpusTokens(NamedTuple):
+    """한 번의 토큰화로 얻는 결과 묶음"""
+    word_counts: Counter            # 워드 클라우드용 전체 명사 빈도
+    article_nouns: List[Set[str]]   # GRI 주제 매칭용 기사별 명사 집합
+
+
+class CorpusCounts(NamedTuple):
+    """스트리밍 처리로 누적한 결과 (기사별 명사는 보관하지 않음)"""
+    word_counts: Counter            # 워드 클라우드용 전체 명사 빈도
+    topic_counts: Dict[str, int]    # GRI 주제별 등장 기사 수
+    articles: int                   # 처리한 기사 수
+    new_articles: int = 0           # 증분 처리 시 이번에 새로 토큰화한 기사 수
+
+
+def _init_worker() -> None:
+    # 각 워커 프로세스에서 JVM과 사전을 한 번만 로딩
+    get_tokenizer().warmup()
+
+
+def _tokenize_chunk(texts: List[str]) -> Tuple[Counter, List[Set[str]]]:
+    word_counts: Counter = Counter()
+    article_nouns = []
+    for words in preprocess_many(texts):
+        word_counts.update(words)
+        article_nouns.append(set(words))
+    return word_counts, article_nouns
+
+
+def _tokenize_articles(texts: List[str]) -> List[List[str]]:
+    # 캐시 저장용: 기사별 명사 목록을 중복 포함 그대로 반환
+    return preprocess_many(texts)
+
+
+def _chunked(texts: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    chunk = []
+    for text in texts:
+        chunk.append(str(text))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _run_chunks(texts: Iterable[str], workers: int, chunk_size: int, merge: Callable, task: Callable = _tokenize_chunk) -> None:
+    """청크 단위 토큰화(task) 결과를 입력 순서대로 merge에 전달"""
+    chunks = _chunked(texts, chunk_size)
+
+    if workers <= 1:
+        get_tokenizer().warmup()
+        for chunk in chunks:
+            merge(task(chunk))
+        return
+
+    # JVM은 fork 이후 안전하지 않으므로 spawn으로 워커를 새로 띄움
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker) as executor:
+        # 동시에 제출하는 청크 수를 제한하여 입력 전체가 메모리에 올라가지 않도록 함
+        pending: deque = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(task, chunk))
+            if len(pending) >= workers * 2:
+                merge(pending.popleft().result())
+        while pending:
+            # 제출 순서대로 결과를 꺼내므로 기사 순서가 보존됨
+            merge(pending.popleft().result())
+
+
+def tokenize_corpus(texts: Iterable[str], workers: Optional[int] = None, chunk_size: Optional[int] = None) -> CorpusTokens:
+    """
+    기사 전체를 프로세스 풀로 나누어 한 번씩만 토큰화
+
+    워커 수는 GRI_WORKERS, 청크 크기는 GRI_CHUNK_SIZE 환경 변수로 조절할 수 있으며,
+    워커가 1이면 현재 프로세스에서 바로 처리합니다.
+    """
+    word_counts: Counter = Counter()
+    article_nouns: List[Set[str]] = []
+
+    def merge(result: Tuple[Counter, List[Set[str]]]) -> None:
+        chunk_counts, chunk_nouns = result
+        word_counts.update(chunk_counts)
+        article_nouns.extend(chunk_nouns)
+
+    _run_chunks(texts, workers or DEFAULT_WORKERS, chunk_size or DEFAULT_CHUNK_SIZE, merge)
+    return CorpusTokens(word_counts, article_nouns)
+
+
+def count_corpus_streaming(texts: Iterable[str], matcher: GRIMatcher, workers: Optional[int] = None, chunk_size: Optional[int] = None) -> CorpusCounts:
+    """
+    기사 스트림을 청크 단위로 토큰화하면서 명사 빈도와 GRI 주제 빈도를 누적
+
+    기사별 명사 집합은 청크마다 주제 매칭 후 버려지므로, 메모리 사용량은 코퍼스 크기가 아니라
+    청크 크기 × 동시 처리 청크 수와 어휘 크기에만 비례합니다.
+    """
+    word_counts: Counter = Counter()
+    topic_counts: Counter = Counter(dict.fromkeys(matcher.topics, 0))
+    articles = 0
+
+    def merge(result: Tuple[Counter, List[Set[str]]]) -> None:
+        nonlocal articles
+        chunk_counts, chunk_nouns = result
+        word_counts.update(chunk_counts)
+        topic_counts.update(matcher.count_articles(chunk_nouns))
+        articles += len(chunk_nouns)
+
+    _run_chunks(texts, workers or DEFAULT_WORKERS, chunk_size or DEFAULT_CHUNK_SIZE, merge)
+    return CorpusCounts(word_counts, {topic: topic_counts[topic] for topic in matcher.topics}, articles)
+
+
+def count_corpus_incremental(texts: Iterable[str], matcher: GRIMatcher, cache: TokenCache, force_rebuild: bool = False,
+                             workers: Optional[int] = None, chunk_size: Optional[int] = None) -> CorpusCounts:
+    """
+    토큰화 캐시에 없는 기사만 토큰화하여 누적 명사/주제 빈도를 갱신
+
+    기사는 본문 해시로 식별되므로 이전 실행에서 처리한 기사와 같은 본문의 중복 기사는 다시 집계되지 않습니다.
+    force_rebuild가 참이면 캐시를 비우고 전체를 다시 토큰화합니다.
+    """
+    chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+    state = cache.prepare(tokenizer_fingerprint(), matcher, force_rebuild=force_rebuild)
+    logger.info(f"Token cache: {state}")
+
+    pending_hashes: deque = deque()
+    queued: Set[str] = set()
+    new_articles = 0
+
+    def new_texts() -> Iterator[str]:
+        for batch in _chunked(texts, chunk_size):
+            hashes = [article_hash(text) for text in batch]
+            known = cache.known(hashes)
+            for text, hash_ in zip(batch, hashes):
+                if hash_ in known or hash_ in queued:
+                    continue
+                queued.add(hash_)
+                pending_hashes.append(hash_)
+                yield text
+
+    def merge(chunk_nouns: List[List[str]]) -> None:
+        nonlocal new_articles
+        rows = []
+        for nouns in chunk_nouns:
+            rows.append((pending_hashes.popleft(), nouns, matcher.topic_names(matcher.match_tokens(nouns))))
+        new_articles += cache.add_articles(rows)
+
+    _run_chunks(new_texts(), workers or DEFAULT_WORKERS, chunk_size, merge, task=_tokenize_articles)
+    return CorpusCounts(cache.word_counts(), cache.topic_counts(matcher.topics), cache.article_count(), new_articles)
@@ -0,0 +1,157 @@
+import json
+import asyncio
+import hashlib
+import logging
+import threading
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional, Tuple
+
+from metrics import observe_stage
+from visualization import render_wordcloud, render_materiality_matrix
+
+logger = logging.getLogger(__name__)
+
+RENDERERS = {
+    "wordcloud": render_wordcloud,
+    "materiality": render_materiality_matrix,
+}
+
+
+def render_key(kind: str, fmt: str, *args: Any) -> str:
+    """렌더링 입력(종류, 형식, 빈도 등)의 해시 - 같은 입력이면 같은 이미지"""
+    source = json.dumps([kind, fmt, args], ensure_ascii=False, sort_keys=True, default=dict)
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def _render(kind: str, fmt: str, args: Tuple[Any, ...]) -> bytes:
+    # 렌더링 워커 프로세스에서 실행
+    return RENDERERS[kind](*args, fmt=fmt)
+
+
+class RenderService:
+    """
+    이미지 렌더링 전용 프로세스 풀 + 크기 제한 결과 캐시
+
+    - matplotlib/wordcloud 렌더링을 별도 프로세스에서 실행하여 이벤트 루프와 분석 스레드를 막지 않습니다.
+    - 결과는 입력 해시를 키로 전체 바이트 수 상한까지 LRU로 보관하며,
+      같은 입력의 동시 요청은 진행 중인 렌더링 하나를 공유합니다.
+    - 렌더링 워커가 비정상 종료되어 풀이 깨지면 풀을 새로 만들고 한 번 더 렌더링합니다.
+    """
+
+    def __init__(self, workers: int = 2, cache_max_bytes: int = 64 * 1024 * 1024):
+        self.workers = workers
+        self.cache_max_bytes = cache_max_bytes
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._cache_bytes = 0
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.pool_restarts = 0
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        # 서버 프로세스는 JVM을 띄운 상태이므로 fork 대신 spawn으로 워커 생성
+        context = multiprocessing.get_context("spawn")
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+
+    def start(self) -> None:
+        if self.workers > 0 and self._executor is None:
+            self._executor = self._new_executor()
+            logger.info(f"렌더링 프로세스 풀 시작: {self.workers}개")
+
+    def _replace_executor(self, broken: ProcessPoolExecutor) -> None:
+        """
+        깨진 프로세스 풀 교체
+
+        같은 풀에서 실패한 렌더링이 여럿이어도 한 번만 교체되도록 현재 풀이 깨진 풀일 때만 새로 만듭니다.
+        """
+        if self._executor is not broken:
+            return
+        broken.shutdown(wait=False, cancel_futures=True)
+        self._executor = self._new_executor()
+        self.pool_restarts += 1
+        logger.warning(f"렌더링 프로세스 풀이 깨져 새로 생성했습니다 (누적 {self.pool_restarts}회)")
+
+    async def stop(self) -> None:
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
+
+    def _cache_get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            image = self._cache.get(key)
+            if image is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+            return image
+
+    def _cache_put(self, key: str, image: bytes) -> None:
+        if len(image) > self.cache_max_bytes:
+            return
+        with self._lock:
+            if key in self._cache:
+                return
+            self._cache[key] = image
+            self._cache_bytes += len(image)
+            while self._cache_bytes > self.cache_max_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_bytes -= len(evicted)
+                self.evictions += 1
+
+    async def render(self, kind: str, fmt: str, *args: Any) -> Tuple[str, bytes]:
+        """(캐시 키, 이미지 바이트) 반환 - 캐시 키는 ETag로 사용할 수 있음"""
+        key = render_key(kind, fmt, *args)
+        image = self._cache_get(key)
+        if image is not None:
+            return key, image
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return key, await asyncio.shield(pending)
+
+        future = asyncio.ensure_future(self._render_in_pool(kind, fmt, args))
+        self._inflight[key] = future
+        try:
+            # 캐시 미스만 렌더링 단계 시간으로 기록
+            with observe_stage("render"):
+                image = await asyncio.shield(future)
+        finally:
+            self._inflight.pop(key, None)
+        self._cache_put(key, image)
+        return key, image
+
+    async def _render_in_pool(self, kind: str, fmt: str, args: Tuple[Any, ...]) -> bytes:
+        loop = asyncio.get_running_loop()
+        executor = self._executor
+        try:
+            # 프로세스 풀이 없으면(workers=0) 기본 스레드 풀에서 렌더링
+            return await loop.run_in_executor(executor, _render, kind, fmt, args)
+        except BrokenProcessPool:
+            # 워커 하나가 죽으면 풀 전체가 깨져 이후 렌더링도 모두 실패하므로 풀을 교체하고 한 번만 재시도
+            self._replace_executor(executor)
+            if self._executor is None:
+                raise
+            return await loop.run_in_executor(self._executor, _render, kind, fmt, args)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "workers": self.workers,
+                "entries": len(self._cache),
+                "bytes": self._cache_bytes,
+                "max_bytes": self.cache_max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+                "inflight": len(self._inflight),
+                "pool_restarts": self.pool_restarts,
+            }
@@ -0,0 +1,109 @@
+# gri-service/app/service/gri_service.py
+
+import time
+import uuid
+import logging
+import threading
+from collections import Counter, OrderedDict
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+from analysis import BUSINESS_IMPACT, load_gri_dict
+from matcher import GRIMatcher
+from metrics import observe_stage
+from model.analysis_schema import AnalysisResult
+from parallel import tokenize_corpus
+from tokenizer import get_tokenizer
+from vectorized import analyze_topics
+
+logger = logging.getLogger(__name__)
+
+
+class GRIAnalysisService:
+    """
+    상주 프로세스용 GRI 분석 서비스
+
+    - 시작 시 JVM/Okt를 워밍업하고 GRI 사전을 GRIMatcher로 한 번만 컴파일하여 요청 간 재사용합니다.
+    - 분석 결과는 메모리 LRU에 보관하며, 이미지 엔드포인트는 보관된 결과를 렌더링 서비스에 넘깁니다.
+    """
+
+    def __init__(self, dict_path: Optional[str] = None, backend: str = "index",
+                 result_cache_size: int = 64, top_words: int = 200):
+        self.dict_path = dict_path
+        self.backend = backend
+        self.result_cache_size = max(1, result_cache_size)
+        self.top_words = top_words
+        self.matcher: Optional[GRIMatcher] = None
+        self.latest_id: Optional[str] = None
+        self.total_analyses = 0
+        self._results: "OrderedDict[str, Tuple[AnalysisResult, Counter]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """GRI 사전 컴파일 및 형태소 분석기 워밍업 (블로킹)"""
+        self.reload_dictionary()
+        started = time.perf_counter()
+        get_tokenizer().warmup()
+        logger.info(f"Okt 워밍업 완료: {(time.perf_counter() - started) * 1000:.0f}ms")
+
+    def reload_dictionary(self) -> None:
+        self.matcher = GRIMatcher(load_gri_dict(self.dict_path))
+        logger.info(f"GRI 사전 로드: 주제 {len(self.matcher.topics)}개, 키워드 {len(self.matcher.keyword_topics)}개")
+
+    @property
+    def ready(self) -> bool:
+        return self.matcher is not None and get_tokenizer().warmed_up
+
+    def analyze(self, texts: Iterable[str], business_impact: Optional[Dict[str, float]] = None) -> AnalysisResult:
+        """기사 본문 묶음 분석 (CPU 작업이므로 스레드 풀에서 호출)"""
+        started = time.perf_counter()
+        # 상주 프로세스의 워밍업된 Okt를 그대로 사용 (워커 프로세스를 새로 띄우지 않음)
+        with observe_stage("tokenize"):
+            corpus = tokenize_corpus((text for text in texts if text), workers=1)
+
+        salience = None
+        with observe_stage("match"):
+            if self.backend == "sparse":
+                topic_stats = analyze_topics(corpus.article_nouns, self.matcher)
+                gri_frequencies, salience = topic_stats.topic_counts, topic_stats.salience
+            else:
+                gri_frequencies = self.matcher.count_articles(corpus.article_nouns)
+
+        word_counts = Counter(dict(corpus.word_counts.most_common(self.top_words)))
+        result = AnalysisResult(
+            analysis_id=str(uuid.uuid4()),
+            articles=len(corpus.article_nouns),
+            gri_frequencies=gri_frequencies,
+            salience=salience,
+            top_words=[[word, count] for word, count in word_counts.most_common()],
+            business_impact=business_impact or BUSINESS_IMPACT,
+            elapsed_ms=round((time.perf_counter() - started) * 1000, 1),
+            created_at=datetime.now().isoformat(),
+        )
+
+        with self._lock:
+            self._results[result.analysis_id] = (result, word_counts)
+            while len(self._results) > self.result_cache_size:
+                self._results.popitem(last=False)
+            self.latest_id = result.analysis_id
+            self.total_analyses += 1
+        return result
+
+    def get(self, analysis_id: Optional[str] = None) -> Optional[Tuple[AnalysisResult, Counter]]:
+        """분석 결과 조회 (analysis_id가 없거나 "latest"이면 가장 최근 결과)"""
+        with self._lock:
+            if not analysis_id or analysis_id == "latest":
+                analysis_id = self.latest_id
+            return self._results.get(analysis_id) if analysis_id else None
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "ready": self.ready,
+                "backend": self.backend,
+                "topics": len(self.matcher.topics) if self.matcher else 0,
+                "keywords": len(self.matcher.keyword_topics) if self.matcher else 0,
+                "total_analyses": self.total_analyses,
+                "cached_results": len(self._results),
+                "latest_analysis_id": self.latest_id,
+            }
@@ -0,0 +1,161 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+from matcher import GRIMatcher
+
+DEFAULT_CACHE_PATH = os.getenv("GRI_TOKEN_CACHE_PATH", "data/gri_token_cache.db")
+
+# SQLite 바인딩 변수 개수 제한을 넘지 않도록 IN 조회를 나눔
+_LOOKUP_BATCH = 500
+
+
+def article_hash(text: str) -> str:
+    """기사 본문의 내용 주소 (동일 본문은 같은 키)"""
+    return hashlib.sha256(str(text).encode("utf-8")).hexdigest()
+
+
+class TokenCache:
+    """
+    기사 해시 → 추출 명사를 보관하는 내용 주소 기반 토큰화 캐시 (SQLite)
+
+    기사별 명사와 GRI 주제 매칭 결과, 그리고 누적 명사/주제 빈도를 함께 저장하여
+    다음 실행에서는 새 기사만 토큰화하고 집계에 더합니다.
+    - 토큰화 설정(버전, 불용어)이 바뀌면 캐시 전체를 비웁니다.
+    - GRI 사전만 바뀌면 캐시된 명사로 주제 매칭과 주제 빈도만 다시 계산합니다.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_CACHE_PATH):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS articles (
+                hash TEXT PRIMARY KEY,
+                nouns TEXT NOT NULL,
+                topics TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE TABLE IF NOT EXISTS word_counts (word TEXT PRIMARY KEY, count INTEGER NOT NULL)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS topic_counts (topic TEXT PRIMARY KEY, count INTEGER NOT NULL)")
+
+    def _get_meta(self, key: str):
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def prepare(self, tokenizer_fingerprint: str, matcher: GRIMatcher, force_rebuild: bool = False) -> str:
+        """
+        캐시 유효성 확인 및 무효화 수행
+
+        반환값: "rebuilt"(전체 초기화), "rematched"(주제만 재계산), "valid"(그대로 사용)
+        """
+        with self._lock:
+            if force_rebuild or self._get_meta("tokenizer") != tokenizer_fingerprint:
+                self._conn.execute("BEGIN")
+                for table in ("articles", "word_counts", "topic_counts", "meta"):
+                    self._conn.execute(f"DELETE FROM {table}")
+                self._set_meta("tokenizer", tokenizer_fingerprint)
+                self._set_meta("gri_dict", matcher.fingerprint)
+                self._conn.execute("COMMIT")
+                return "rebuilt"
+
+            if self._get_meta("gri_dict") != matcher.fingerprint:
+                self._rematch(matcher)
+                return "rematched"
+        return "valid"
+
+    def _rematch(self, matcher: GRIMatcher) -> None:
+        """캐시된 명사로 기사별 주제와 주제 빈도를 다시 계산 (재토큰화 없음)"""
+        topic_counts: Counter = Counter()
+        updates: List[Tuple[str, str]] = []
+        for hash_, nouns in self._conn.execute("SELECT hash, nouns FROM articles"):
+            topics = matcher.topic_names(matcher.match_tokens(json.loads(nouns)))
+            topic_counts.update(topics)
+            updates.append((json.dumps(topics, ensure_ascii=False), hash_))
+
+        self._conn.execute("BEGIN")
+        self._conn.executemany("UPDATE articles SET topics = ? WHERE hash = ?", updates)
+        self._conn.execute("DELETE FROM topic_counts")
+        self._conn.executemany("INSERT INTO topic_counts (topic, count) VALUES (?, ?)", topic_counts.items())
+        self._set_meta("gri_dict", matcher.fingerprint)
+        self._conn.execute("COMMIT")
+
+    def known(self, hashes: Sequence[str]) -> Set[str]:
+        """이미 캐시에 있는 기사 해시 집합"""
+        found: Set[str] = set()
+        with self._lock:
+            for start in range(0, len(hashes), _LOOKUP_BATCH):
+                batch = hashes[start:start + _LOOKUP_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(f"SELECT hash FROM articles WHERE hash IN ({placeholders})", batch)
+                found.update(row[0] for row in rows)
+        return found
+
+    def add_articles(self, rows: Iterable[Tuple[str, List[str], List[str]]]) -> int:
+        """
+        (해시, 명사 목록, 주제 목록)을 저장하고 누적 빈도에 반영
+
+        이미 있는 해시는 무시되므로 같은 기사가 두 번 집계되지 않습니다. 새로 추가된 기사 수를 반환합니다.
+        """
+        word_counts: Counter = Counter()
+        topic_counts: Counter = Counter()
+        added = 0
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN")
+            for hash_, nouns, topics in rows:
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO articles (hash, nouns, topics, created_at) VALUES (?, ?, ?, ?)",
+                    (hash_, json.dumps(nouns, ensure_ascii=False), json.dumps(topics, ensure_ascii=False), now),
+                )
+                if cursor.rowcount:
+                    added += 1
+                    word_counts.update(nouns)
+                    topic_counts.update(topics)
+            self._conn.executemany(
+                "INSERT INTO word_counts (word, count) VALUES (?, ?) "
+                "ON CONFLICT(word) DO UPDATE SET count = count + excluded.count",
+                word_counts.items(),
+            )
+            self._conn.executemany(
+                "INSERT INTO topic_counts (topic, count) VALUES (?, ?) "
+                "ON CONFLICT(topic) DO UPDATE SET count = count + excluded.count",
+                topic_counts.items(),
+            )
+            self._conn.execute("COMMIT")
+        return added
+
+    def word_counts(self) -> Counter:
+        with self._lock:
+            return Counter(dict(self._conn.execute("SELECT word, count FROM word_counts")))
+
+    def topic_counts(self, topics: Iterable[str]) -> Dict[str, int]:
+        with self._lock:
+            stored = dict(self._conn.execute("SELECT topic, count FROM topic_counts"))
+        return {topic: stored.get(topic, 0) for topic in topics}
+
+    def article_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
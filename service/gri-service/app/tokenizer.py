@@ -0,0 +1,80 @@
+import hashlib
+import threading
+from typing import Iterable, List
+
+# 토큰화 결과 캐시 무효화 판단에 사용되는 버전 (형태소 분석기/후처리 규칙 변경 시 올림)
+TOKENIZER_VERSION = "okt-1"
+
+# 불용어 목록
+STOPWORDS = frozenset(['의', '가', '이', '은', '들', '는', '좀', '잘', '걍', '과', '도', '를', '으로', '자', '에', '와', '한', '하다'])
+
+WARMUP_TEXT = "지속가능경영 보고서의 온실가스 배출량과 산업 안전 관리 현황을 분석합니다."
+
+
+def filter_nouns(nouns: Iterable[str]) -> List[str]:
+    """한 글자 단어 및 불용어 제거"""
+    return [n for n in nouns if len(n) > 1 and n not in STOPWORDS]
+
+
+def tokenizer_fingerprint() -> str:
+    """토큰화 결과에 영향을 주는 설정(버전, 불용어)의 해시 - 바뀌면 토큰 캐시를 무효화"""
+    source = TOKENIZER_VERSION + "\n" + "\n".join(sorted(STOPWORDS))
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+class OktManager:
+    """
+    프로세스당 한 번만 초기화되는 Okt 형태소 분석기 관리자
+
+    JVM 기동과 사전 로딩은 프로세스 최초 1회만 수행되며,
+    스레드마다 JVM에 attach된 전용 Okt 인스턴스를 사용하므로 멀티스레드에서도 안전합니다.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._local = threading.local()
+        self.warmed_up = False
+
+    @classmethod
+    def instance(cls) -> "OktManager":
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @staticmethod
+    def _attach_thread() -> None:
+        """현재 스레드를 JVM에 연결 (메인 스레드 외에서 Java 호출 시 필요)"""
+        import jpype
+        if jpype.isJVMStarted() and not jpype.java.lang.Thread.isAttached():
+            jpype.java.lang.Thread.attach()
+
+    def _okt(self):
+        okt = getattr(self._local, "okt", None)
+        if okt is None:
+            from konlpy.tag import Okt
+            self._attach_thread()
+            okt = Okt()
+            self._local.okt = okt
+        return okt
+
+    def warmup(self) -> None:
+        """JVM 기동 및 사전 로딩을 미리 수행"""
+        if not self.warmed_up:
+            self._okt().nouns(WARMUP_TEXT)
+            self.warmed_up = True
+
+    def nouns(self, text) -> List[str]:
+        return self._okt().nouns(str(text))
+
+    def nouns_many(self, texts: Iterable) -> List[List[str]]:
+        """여러 문서의 명사를 한 번에 추출"""
+        okt = self._okt()
+        return [okt.nouns(str(text)) for text in texts]
+
+
+def get_tokenizer() -> OktManager:
+    return OktManager.instance()
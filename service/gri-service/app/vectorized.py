@@ -0,0 +1,80 @@
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer, TfidfTransformer
+
+from matcher import GRIMatcher
+
+
+class TopicStats(NamedTuple):
+    """희소 행렬 연산으로 한 번에 계산한 주제 통계"""
+    topic_counts: Dict[str, int]     # 주제별 등장 기사 수 (count_gri_frequency와 동일)
+    cooccurrence: pd.DataFrame       # 주제 × 주제 동시 등장 기사 수 (대각선 = topic_counts)
+    salience: Dict[str, float]       # 주제 키워드의 TF-IDF 가중치 합
+
+
+def _identity(tokens):
+    # 이미 토큰화된 명사 목록을 그대로 사용
+    return tokens
+
+
+def build_document_term_matrix(article_nouns: Iterable[Iterable[str]]) -> Tuple[sparse.csr_matrix, Dict[str, int]]:
+    """
+    기사 × 어휘 희소 행렬 생성
+
+    명사 목록(중복 포함)이면 출현 횟수, 명사 집합이면 0/1이 값이 됩니다.
+    """
+    vectorizer = CountVectorizer(analyzer=_identity, lowercase=False)
+    documents = [list(nouns) for nouns in article_nouns]
+    try:
+        matrix = vectorizer.fit_transform(documents)
+    except ValueError:
+        # 모든 기사가 비어 있으면 어휘가 없음
+        return sparse.csr_matrix((len(documents), 0), dtype=np.int64), {}
+    return matrix.tocsr(), vectorizer.vocabulary_
+
+
+def build_topic_indicator(vocabulary: Dict[str, int], matcher: GRIMatcher) -> sparse.csr_matrix:
+    """어휘 × 주제 지시 행렬 (키워드가 주제에 속하면 1)"""
+    rows: List[int] = []
+    cols: List[int] = []
+    for keyword, topic_ids in matcher.keyword_topics.items():
+        column = vocabulary.get(keyword)
+        if column is None:
+            continue
+        for topic_id in topic_ids:
+            rows.append(column)
+            cols.append(topic_id)
+    data = np.ones(len(rows), dtype=np.int64)
+    return sparse.csr_matrix((data, (rows, cols)), shape=(len(vocabulary), len(matcher.topics)))
+
+
+def analyze_topics(article_nouns: Iterable[Iterable[str]], matcher: GRIMatcher) -> TopicStats:
+    """
+    문서-어휘 행렬을 주제 지시 행렬에 투영하여 주제 빈도, 동시 등장, TF-IDF 가중 중요도를 계산
+
+    파이썬 중첩 루프 대신 희소 행렬 곱 몇 번으로 처리됩니다.
+    """
+    counts, vocabulary = build_document_term_matrix(article_nouns)
+    indicator = build_topic_indicator(vocabulary, matcher)
+
+    # 기사별 주제 등장 여부 (기사 × 주제, 0/1)
+    presence = (counts > 0).astype(np.int64) @ indicator
+    presence = (presence > 0).astype(np.int64)
+
+    topic_counts = np.asarray(presence.sum(axis=0)).ravel()
+    cooccurrence = (presence.T @ presence).toarray()
+
+    if counts.shape[0] and counts.shape[1]:
+        weights = TfidfTransformer().fit_transform(counts)
+        salience = np.asarray((weights @ indicator).sum(axis=0)).ravel()
+    else:
+        salience = np.zeros(len(matcher.topics))
+
+    return TopicStats(
+        topic_counts={topic: int(count) for topic, count in zip(matcher.topics, topic_counts)},
+        cooccurrence=pd.DataFrame(cooccurrence, index=matcher.topics, columns=matcher.topics),
+        salience={topic: round(float(score), 4) for topic, score in zip(matcher.topics, salience)},
+    )
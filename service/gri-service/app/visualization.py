@@ -1,31 +1,69 @@
-import matplotlib.pyplot as plt
+import io
+import os
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from wordcloud import WordCloud
 
+# 워드 클라우드 한글 폰트 (기본값은 Docker 이미지에 맞는 폰트 경로)
+FONT_PATH = os.getenv("GRI_FONT_PATH", "/usr/share/fonts/truetype/nanum/NanumGothic.ttf")
+
+# 지원하는 이미지 형식
+IMAGE_FORMATS = {"png": "image/png", "svg": "image/svg+xml"}
+
+def _build_wordcloud(word_counts):
+    wc = WordCloud(font_path=FONT_PATH,
+                   background_color='white', width=800, height=600)
+    return wc.generate_from_frequencies(word_counts)
+
+# 워드 클라우드 이미지 바이트 생성 (png | svg)
+def render_wordcloud(word_counts, fmt='png'):
+    cloud = _build_wordcloud(word_counts)
+    if fmt == 'svg':
+        return cloud.to_svg(embed_font=False).encode('utf-8')
+    buffer = io.BytesIO()
+    cloud.to_image().save(buffer, format='PNG', optimize=True)
+    return buffer.getvalue()
+
+# 중대성 평가 매트릭스 이미지 바이트 생성 (png | svg)
+def render_materiality_matrix(gri_freq, business_impact, fmt='png'):
+    topics = list(gri_freq.keys())
+    media_scores = list(gri_freq.values()) # Y축: 미디어 관심도 (뉴스 빈도)
+    business_scores = [business_impact.get(topic, 0) for topic in topics] # X축: 비즈니스 영향도
+
+    # pyplot 전역 상태를 쓰지 않는 객체 지향 Agg API - Figure는 이 함수 안에서만 존재
+    fig = Figure(figsize=(12, 8))
+    FigureCanvasAgg(fig)
+    try:
+        ax = fig.add_subplot()
+        ax.scatter(business_scores, media_scores)
+
+        ax.set_title('Materiality Assessment Matrix')
+        ax.set_xlabel('Business Impact')
+        ax.set_ylabel('Media & Stakeholder Interest')
+
+        # 각 점에 라벨 추가
+        for i, topic in enumerate(topics):
+            ax.text(business_scores[i], media_scores[i], topic.split(':')[0], fontsize=9)
+
+        ax.grid(True)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=fmt)
+        return buffer.getvalue()
+    finally:
+        fig.clear()
+
 # 워드 클라우드 생성 함수
 def create_wordcloud(word_counts, output_path):
-    wc = WordCloud(font_path='/usr/share/fonts/truetype/nanum/NanumGothic.ttf', # Docker 이미지에 맞는 폰트 경로
-                   background_color='white', width=800, height=600)
-    cloud = wc.generate_from_frequencies(word_counts)
-    cloud.to_file(output_path)
+    with open(output_path, 'wb') as f:
+        f.write(render_wordcloud(word_counts, _format_of(output_path)))
     print(f"Word cloud saved to {output_path}")
 
 # 중대성 평가 매트릭스 생성 함수
 def create_materiality_matrix(gri_freq, business_impact, output_path):
-    topics = list(gri_freq.keys())
-    media_scores = list(gri_freq.values()) # Y축: 미디어 관심도 (뉴스 빈도)
-    business_scores = [business_impact.get(topic, 0) for topic in topics] # X축: 비즈니스 영향도
+    with open(output_path, 'wb') as f:
+        f.write(render_materiality_matrix(gri_freq, business_impact, _format_of(output_path)))
+    print(f"Materiality matrix saved to {output_path}")
 
-    plt.figure(figsize=(12, 8))
-    plt.scatter(business_scores, media_scores)
-    
-    plt.title('Materiality Assessment Matrix')
-    plt.xlabel('Business Impact')
-    plt.ylabel('Media & Stakeholder Interest')
-    
-    # 각 점에 라벨 추가
-    for i, topic in enumerate(topics):
-        plt.text(business_scores[i], media_scores[i], topic.split(':')[0], fontsize=9)
-        
-    plt.grid(True)
-    plt.savefig(output_path)
-    print(f"Materiality matrix saved to {output_path}")
\ No newline at end of file
+def _format_of(output_path):
+    extension = os.path.splitext(output_path)[1].lower().lstrip('.')
+    return extension if extension in IMAGE_FORMATS else 'png'
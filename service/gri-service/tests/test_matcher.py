@@ -0,0 +1,84 @@
+# gri-service/tests/test_matcher.py
+
+import random
+
+import pytest
+
+from matcher import AhoCorasick, GRIMatcher
+
+
+def legacy_count(article_nouns, gri_dict):
+    """GRIMatcher 도입 전 count_gri_frequency의 기사 × 단어 × 주제 루프"""
+    gri_counts = {topic: 0 for topic in gri_dict.keys()}
+    for processed_words in article_nouns:
+        found_topics_in_article = set()
+        for word in processed_words:
+            for topic, keywords in gri_dict.items():
+                if word in keywords:
+                    found_topics_in_article.add(topic)
+        for topic in found_topics_in_article:
+            gri_counts[topic] += 1
+    return gri_counts
+
+
+def make_corpus(seed, topics=12, keywords=15, articles=300, words=40):
+    rng = random.Random(seed)
+    syllables = [chr(code) for code in range(0xAC00, 0xAC00 + 120)]
+    vocab = sorted({"".join(rng.choices(syllables, k=rng.randint(2, 3))) for _ in range(topics * keywords * 3)})
+    # 여러 주제가 같은 키워드를 공유하도록 전체 어휘에서 독립적으로 추출
+    gri_dict = {f"GRI {300 + index}": rng.sample(vocab, keywords) for index in range(topics)}
+    article_nouns = [set(rng.choices(vocab, k=words)) for _ in range(articles)]
+    return gri_dict, article_nouns
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_count_articles_matches_legacy_loop(seed):
+    gri_dict, article_nouns = make_corpus(seed)
+
+    assert GRIMatcher(gri_dict).count_articles(article_nouns) == legacy_count(article_nouns, gri_dict)
+
+
+def test_count_articles_counts_each_article_once_per_topic():
+    matcher = GRIMatcher({"GRI 305: Emissions": ["탄소", "배출"], "GRI 403: Safety": ["안전"]})
+
+    counts = matcher.count_articles([["탄소", "배출", "탄소"], ["안전"], ["무관"], []])
+
+    assert counts == {"GRI 305: Emissions": 1, "GRI 403: Safety": 1}
+
+
+def test_keywords_are_stripped_and_blank_keywords_ignored():
+    matcher = GRIMatcher({"A": [" 탄소 ", ""], "B": ["탄소"]})
+
+    assert matcher.keyword_topics == {"탄소": frozenset({0, 1})}
+    assert matcher.topic_names(matcher.match_tokens(["탄소"])) == ["A", "B"]
+
+
+def test_match_text_finds_phrases_and_overlapping_keywords():
+    matcher = GRIMatcher({"A": ["온실가스 배출"], "B": ["가스"], "C": ["없는말"]})
+
+    assert matcher.topic_names(matcher.match_text("올해 온실가스 배출량이 늘었다")) == ["A", "B"]
+
+
+def test_pure_python_automaton_matches_substring_search():
+    rng = random.Random(7)
+    alphabet = "가나다라"
+    patterns = {"".join(rng.choices(alphabet, k=rng.randint(1, 3))) for _ in range(20)}
+    automaton = AhoCorasick({pattern: frozenset({index}) for index, pattern in enumerate(sorted(patterns))})
+    ids = {pattern: index for index, pattern in enumerate(sorted(patterns))}
+
+    for _ in range(50):
+        text = "".join(rng.choices(alphabet, k=30))
+        assert automaton.search(text) == {ids[pattern] for pattern in patterns if pattern in text}
+
+
+def test_sparse_topic_counts_match_matcher():
+    vectorized = pytest.importorskip("vectorized")
+    gri_dict, article_nouns = make_corpus(5)
+    matcher = GRIMatcher(gri_dict)
+
+    assert vectorized.analyze_topics(article_nouns, matcher).topic_counts == matcher.count_articles(article_nouns)
+
+
+def test_fingerprint_changes_with_dictionary():
+    assert GRIMatcher({"A": ["탄소"]}).fingerprint == GRIMatcher({"A": ["탄소"]}).fingerprint
+    assert GRIMatcher({"A": ["탄소"]}).fingerprint != GRIMatcher({"A": ["배출"]}).fingerprint
@@ -0,0 +1,59 @@
+# gri-service/tests/test_parallel.py
+
+import pytest
+
+import parallel
+from matcher import GRIMatcher
+from parallel import _run_chunks, count_corpus_streaming, tokenize_corpus
+
+
+class StubTokenizer:
+    def __init__(self):
+        self.tokenized = []
+
+    def warmup(self):
+        pass
+
+    def preprocess_many(self, texts):
+        self.tokenized.extend(texts)
+        return [text.split() for text in texts]
+
+
+@pytest.fixture
+def tokenizer(monkeypatch):
+    stub = StubTokenizer()
+    monkeypatch.setattr(parallel, "preprocess_many", stub.preprocess_many)
+    monkeypatch.setattr(parallel, "get_tokenizer", lambda: stub)
+    return stub
+
+
+def test_run_chunks_merges_in_submission_order(tokenizer):
+    texts = [f"기사{index}" for index in range(10)]
+    chunks = []
+    merged = []
+
+    def task(chunk):
+        chunks.append(list(chunk))
+        return [text.upper() for text in chunk]
+
+    _run_chunks(iter(texts), workers=1, chunk_size=3, merge=merged.append, task=task)
+
+    assert chunks == [texts[0:3], texts[3:6], texts[6:9], texts[9:]]
+    assert merged == chunks
+    assert [text for chunk in merged for text in chunk] == texts
+
+
+def test_each_article_is_tokenized_once(tokenizer):
+    texts = ["에너지 배출", "전력", "탄소 배출", "에너지", "용수"]
+
+    tokens = tokenize_corpus(texts, workers=1, chunk_size=2)
+    assert tokenizer.tokenized == texts
+    assert tokens.article_nouns == [{"에너지", "배출"}, {"전력"}, {"탄소", "배출"}, {"에너지"}, {"용수"}]
+    assert tokens.word_counts == {"에너지": 2, "배출": 2, "전력": 1, "탄소": 1, "용수": 1}
+
+    tokenizer.tokenized.clear()
+    matcher = GRIMatcher({"GRI 302": ["에너지", "전력"], "GRI 305": ["배출", "탄소"]})
+    counts = count_corpus_streaming(texts, matcher, workers=1, chunk_size=2)
+    assert tokenizer.tokenized == texts
+    assert counts.articles == 5
+    assert counts.topic_counts == {"GRI 302": 3, "GRI 305": 2}
@@ -0,0 +1,69 @@
+# gri-service/tests/test_rendering.py
+
+import asyncio
+import os
+
+import rendering
+from rendering import RenderService, render_key
+
+
+def crash_once(kind, fmt, args):
+    """첫 호출에서 워커 프로세스를 종료시켜 풀을 깨뜨리는 _render 대체 (spawn 워커에서 실행)"""
+    marker = args[0]
+    if not os.path.exists(marker):
+        open(marker, "w").close()
+        os._exit(1)
+    return f"{kind}.{fmt}".encode("utf-8")
+
+
+def test_render_key_is_stable_for_equal_inputs():
+    first = render_key("wordcloud", "png", {"환경": 3, "노동": 1})
+    reordered = render_key("wordcloud", "png", {"노동": 1, "환경": 3})
+
+    assert first == reordered
+    assert len(first) == 64
+    assert render_key("wordcloud", "svg", {"환경": 3, "노동": 1}) != first
+    assert render_key("materiality", "png", {"환경": 3, "노동": 1}) != first
+    assert render_key("wordcloud", "png", {"환경": 4, "노동": 1}) != first
+
+
+def test_cache_evicts_least_recently_used_by_bytes():
+    service = RenderService(workers=0, cache_max_bytes=10)
+    service._cache_put("a", b"aaaa")
+    service._cache_put("b", b"bbbb")
+    assert service._cache_get("a") == b"aaaa"
+
+    # a를 최근에 조회했으므로 b가 밀려남
+    service._cache_put("c", b"cccc")
+    assert service._cache_get("b") is None
+    assert service._cache_get("a") == b"aaaa" and service._cache_get("c") == b"cccc"
+    assert service.stats()["bytes"] == 8 and service.evictions == 1
+
+    # 상한보다 큰 이미지는 캐시하지 않고 기존 항목도 밀어내지 않음
+    service._cache_put("huge", b"x" * 11)
+    assert service._cache_get("huge") is None
+    assert service.stats()["entries"] == 2
+
+    service._cache_put("d", b"dddddddddd")
+    assert service.stats()["entries"] == 1 and service.stats()["bytes"] == 10
+
+
+def test_render_rebuilds_broken_pool_and_retries_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(rendering, "_render", crash_once)
+    marker = str(tmp_path / "crashed")
+
+    async def scenario():
+        service = RenderService(workers=1)
+        service.start()
+        broken = service._executor
+        try:
+            key, image = await service.render("wordcloud", "png", marker)
+            assert service._executor is not broken
+            return key, image, service.pool_restarts
+        finally:
+            await service.stop()
+
+    key, image, restarts = asyncio.run(scenario())
+    assert image == b"wordcloud.png"
+    assert key == render_key("wordcloud", "png", marker)
+    assert restarts == 1 and os.path.exists(marker)
@@ -0,0 +1,95 @@
+# gri-service/tests/test_token_cache.py
+
+import pytest
+
+import parallel
+from matcher import GRIMatcher
+from parallel import count_corpus_incremental
+from token_cache import TokenCache
+
+GRI_DICT = {"GRI 302": ["에너지", "전력"], "GRI 305": ["배출", "탄소"]}
+
+
+class StubTokenizer:
+    """konlpy 없이 공백으로 명사를 나누고 토큰화한 기사를 기록"""
+
+    def __init__(self):
+        self.fingerprint = "stub-v1"
+        self.tokenized = []
+
+    def warmup(self):
+        pass
+
+    def preprocess_many(self, texts):
+        self.tokenized.extend(texts)
+        return [text.split() for text in texts]
+
+
+@pytest.fixture
+def tokenizer(monkeypatch):
+    stub = StubTokenizer()
+    monkeypatch.setattr(parallel, "preprocess_many", stub.preprocess_many)
+    monkeypatch.setattr(parallel, "tokenizer_fingerprint", lambda: stub.fingerprint)
+    monkeypatch.setattr(parallel, "get_tokenizer", lambda: stub)
+    return stub
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = TokenCache(str(tmp_path / "tokens.db"))
+    yield cache
+    cache.close()
+
+
+def count(texts, cache, gri_dict=GRI_DICT, **kwargs):
+    return count_corpus_incremental(texts, GRIMatcher(gri_dict), cache, workers=1, chunk_size=2, **kwargs)
+
+
+def test_cached_articles_are_not_counted_twice(tokenizer, cache):
+    first = count(["에너지 배출", "전력 전력", "에너지 배출"], cache)
+    assert (first.articles, first.new_articles) == (2, 2)
+    assert first.topic_counts == {"GRI 302": 2, "GRI 305": 1}
+    assert first.word_counts == {"에너지": 1, "배출": 1, "전력": 2}
+
+    second = count(["에너지 배출", "탄소"], cache)
+    assert (second.articles, second.new_articles) == (3, 1)
+    assert second.topic_counts == {"GRI 302": 2, "GRI 305": 2}
+    assert second.word_counts["에너지"] == 1
+    # 같은 본문은 실행을 넘어 한 번만 토큰화
+    assert tokenizer.tokenized == ["에너지 배출", "전력 전력", "탄소"]
+
+
+def test_tokenizer_fingerprint_change_clears_cache(tokenizer, cache):
+    count(["에너지", "탄소"], cache)
+    tokenizer.fingerprint = "stub-v2"
+    tokenizer.tokenized.clear()
+
+    result = count(["에너지"], cache)
+    assert cache._get_meta("tokenizer") == "stub-v2"
+    assert (result.articles, result.new_articles) == (1, 1)
+    assert result.topic_counts == {"GRI 302": 1, "GRI 305": 0}
+    assert tokenizer.tokenized == ["에너지"]
+
+
+def test_dictionary_change_only_rematches_topics(tokenizer, cache):
+    count(["에너지 배출", "탄소"], cache)
+    tokenizer.tokenized.clear()
+
+    changed = {"GRI 302": ["에너지"], "GRI 305": ["배출"], "GRI 403": ["탄소"]}
+    result = count(["에너지 배출", "탄소"], cache, gri_dict=changed)
+    assert result.new_articles == 0 and result.articles == 2
+    assert result.topic_counts == {"GRI 302": 1, "GRI 305": 1, "GRI 403": 1}
+    assert result.word_counts == {"에너지": 1, "배출": 1, "탄소": 1}
+    assert tokenizer.tokenized == []
+    assert cache.prepare(tokenizer.fingerprint, GRIMatcher(changed)) == "valid"
+    assert cache.prepare(tokenizer.fingerprint, GRIMatcher(GRI_DICT)) == "rematched"
+
+
+def test_force_rebuild_retokenizes_everything(tokenizer, cache):
+    count(["에너지", "탄소"], cache)
+    tokenizer.tokenized.clear()
+
+    result = count(["에너지", "탄소"], cache, force_rebuild=True)
+    assert (result.articles, result.new_articles) == (2, 2)
+    assert result.topic_counts == {"GRI 302": 1, "GRI 305": 1}
+    assert tokenizer.tokenized == ["에너지", "탄소"]
@@ -1,13 +1,24 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 import httpx
 import os
+import json
+import socket
 from typing import Dict, Any, List
 import logging
 from datetime import datetime
 import asyncio
 
+from metrics import QUEUE_DEPTH, MetricsMiddleware, metrics_endpoint
+from model.job_schema import JobStatusResponse
+from repository.job_repository import JobRepository
+from repository.result_repository import ResultRepository
+from service.job_service import JobService
+from service.result_service import ResultService, etag_matches
+from service.progress_service import ProgressBroker
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -21,22 +32,111 @@ ALLOWED_ORIGINS = [
     "http://localhost:8080",  # Gateway (Docker)
 ]
 
+# Gateway 서비스 레지스트리 설정
+SERVICE_NAME = "sasb"
+SASB_PUBLIC_URL = os.getenv("SASB_PUBLIC_URL", f"http://localhost:{SASB_SERVICE_PORT}")
+SASB_INSTANCE_ID = os.getenv("SASB_INSTANCE_ID", f"sasb-{socket.gethostname()}-{SASB_SERVICE_PORT}")
+# Gateway는 REGISTRY_TOKEN이 설정된 경우에만 레지스트리를 열기 때문에 토큰이 없으면 자가 등록하지 않음 (GATEWAY_ROUTES 정적 라우팅 사용)
+REGISTRY_TOKEN = os.getenv("REGISTRY_TOKEN", "")
+HEARTBEAT_INTERVAL = float(os.getenv("REGISTRY_HEARTBEAT_INTERVAL", "10"))
+
+# 분석 작업 큐 설정
+SASB_DB_PATH = os.getenv("SASB_DB_PATH", "data/sasb.db")
+SASB_WORKERS = int(os.getenv("SASB_WORKERS", str(os.cpu_count() or 2)))
+SASB_QUEUE_SIZE = int(os.getenv("SASB_QUEUE_SIZE", "100"))
+# 동시에 들어온 단일 문서 요청을 워커 배치 하나로 묶는 대기 시간 (0이면 비활성화)
+SASB_COALESCE_WINDOW_MS = float(os.getenv("SASB_COALESCE_WINDOW_MS", "10"))
+SASB_COALESCE_MAX_BATCH = int(os.getenv("SASB_COALESCE_MAX_BATCH", "32"))
+# 배치 분석 요청 한 번에 받을 수 있는 최대 문서 수
+SASB_BATCH_MAX_DOCUMENTS = int(os.getenv("SASB_BATCH_MAX_DOCUMENTS", "10000"))
+
+# 분석 결과 저장소 설정
+SASB_RESULT_CACHE_SIZE = int(os.getenv("SASB_RESULT_CACHE_SIZE", "256"))
+SASB_RESULT_TTL_SECONDS = float(os.getenv("SASB_RESULT_TTL_SECONDS", str(7 * 86400)))
+
+result_service = ResultService(
+    ResultRepository(SASB_DB_PATH),
+    cache_size=SASB_RESULT_CACHE_SIZE,
+    ttl_seconds=SASB_RESULT_TTL_SECONDS
+)
+progress_broker = ProgressBroker()
+job_service = JobService(
+    JobRepository(SASB_DB_PATH),
+    result_service,
+    progress_broker,
+    workers=SASB_WORKERS,
+    queue_size=SASB_QUEUE_SIZE,
+    coalesce_window=SASB_COALESCE_WINDOW_MS / 1000,
+    coalesce_max=SASB_COALESCE_MAX_BATCH
+)
+QUEUE_DEPTH.set_function(lambda: job_service.queue_depth)
+
+async def register_with_gateway(client: httpx.AsyncClient) -> bool:
+    """Gateway 레지스트리에 현재 인스턴스 등록"""
+    try:
+        response = await client.post(
+            f"{GATEWAY_URL}/registry/register",
+            json={
+                "service": SERVICE_NAME,
+                "url": SASB_PUBLIC_URL,
+                "instance_id": SASB_INSTANCE_ID,
+                "metadata": {"version": "1.0.0"}
+            },
+            headers={"X-Registry-Token": REGISTRY_TOKEN}
+        )
+        response.raise_for_status()
+        logger.info(f"Gateway 등록 완료: {SASB_INSTANCE_ID} -> {SASB_PUBLIC_URL}")
+        return True
+    except Exception as e:
+        logger.warning(f"Gateway 등록 실패: {e}")
+        return False
+
+async def heartbeat_loop(client: httpx.AsyncClient):
+    """주기적으로 하트비트 전송 (Gateway 재시작 등으로 등록이 사라지면 재등록)"""
+    while True:
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        try:
+            response = await client.post(
+                f"{GATEWAY_URL}/registry/heartbeat",
+                json={"service": SERVICE_NAME, "instance_id": SASB_INSTANCE_ID},
+                headers={"X-Registry-Token": REGISTRY_TOKEN}
+            )
+            if response.status_code == 404:
+                await register_with_gateway(client)
+        except Exception as e:
+            logger.warning(f"Gateway 하트비트 실패: {e}")
+
 # Gateway 서비스에 등록 (최신 방식)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 생명주기 관리"""
     # 시작 시 실행
-    try:
-        async with httpx.AsyncClient() as client:
-            # Gateway에 서비스 등록 (실제 구현에서는 서비스 디스커버리 사용)
-            logger.info(f"SASB 서비스가 포트 {SASB_SERVICE_PORT}에서 시작됨")
-            
-    except Exception as e:
-        logger.warning(f"Gateway 등록 실패: {e}")
+    logger.info(f"SASB 서비스가 포트 {SASB_SERVICE_PORT}에서 시작됨")
+    await job_service.start()
+    result_service.start()
+    client = httpx.AsyncClient(timeout=5.0)
+    heartbeat_task = None
+    if REGISTRY_TOKEN:
+        await register_with_gateway(client)
+        heartbeat_task = asyncio.create_task(heartbeat_loop(client))
+    else:
+        logger.info("REGISTRY_TOKEN 미설정: Gateway 자가 등록 생략")
     
     yield  # 애플리케이션 실행
     
     # 종료 시 실행
+    if heartbeat_task is not None:
+        heartbeat_task.cancel()
+        try:
+            await client.delete(
+                f"{GATEWAY_URL}/registry/{SERVICE_NAME}/{SASB_INSTANCE_ID}",
+                headers={"X-Registry-Token": REGISTRY_TOKEN}
+            )
+        except Exception as e:
+            logger.warning(f"Gateway 등록 해제 실패: {e}")
+    await client.aclose()
+    await job_service.stop()
+    await result_service.stop()
     logger.info("SASB 서비스 종료")
 
 app = FastAPI(
@@ -56,6 +156,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(MetricsMiddleware)
+app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
 
 # 서비스 상태 관리
 service_status = {
@@ -90,16 +192,28 @@ async def health_check():
 @app.get("/status")
 async def get_service_status():
     """서비스 상태 정보"""
-    return service_status
+    service_status["last_analysis"] = job_service.last_finished_at
+    service_status["total_analyses"] = job_service.completed
+    return {
+        **service_status,
+        "jobs": {
+            "queue_depth": job_service.queue_depth,
+            "queue_size": job_service.queue_size,
+            "workers": job_service.workers,
+            "failed": job_service.failed,
+            "pool_restarts": job_service.pool_restarts,
+            "coalesced_batches": job_service.coalesced_batches,
+            "coalesced_jobs": job_service.coalesced_jobs,
+            "by_status": job_service.repository.count_by_status()
+        },
+        "result_cache": result_service.stats()
+    }
 
 @app.post("/analyze")
-async def analyze_sasb_data(
-    data: Dict[str, Any],
-    background_tasks: BackgroundTasks
-):
+async def analyze_sasb_data(data: Dict[str, Any]):
     """SASB 분석 실행"""
     try:
-        logger.info(f"SASB 분석 요청 받음: {data}")
+        logger.info(f"SASB 분석 요청 받음: text_data {len(str(data.get('text_data', '')))}자")
         
         # 분석 데이터 검증
         if not data.get("text_data"):
@@ -108,58 +222,171 @@ async def analyze_sasb_data(
                 detail="분석할 텍스트 데이터가 필요합니다"
             )
         
-        # 백그라운드에서 분석 실행
-        background_tasks.add_task(run_sasb_analysis, data)
+        # 작업 큐에 등록 (워커 프로세스에서 분석 실행)
+        job, deduplicated = job_service.submit(data)
         
-        # 즉시 응답 반환
-        analysis_id = f"sasb_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        # 동일한 텍스트가 이미 분석되었거나 분석 중이면 기존 작업을 그대로 반환
+        if deduplicated:
+            return {
+                "message": "동일한 데이터의 기존 분석 결과를 반환합니다",
+                "analysis_id": job.job_id,
+                "status": job.status,
+                "cached": True
+            }
         
+        # 즉시 응답 반환
         return {
             "message": "SASB 분석이 시작되었습니다",
-            "analysis_id": analysis_id,
-            "status": "processing",
-            "estimated_time": "5-10분"
+            "analysis_id": job.job_id,
+            "status": job.status,
+            "queue_depth": job_service.queue_depth,
+            "cached": False
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"SASB 분석 오류: {e}")
         raise HTTPException(status_code=500, detail=f"분석 중 오류 발생: {str(e)}")
 
-@app.get("/analysis/{analysis_id}")
-async def get_analysis_result(analysis_id: str):
-    """분석 결과 조회"""
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/jsonl", "application/json-lines", "application/x-jsonlines")
+
+def _normalize_document(document: Any, index: int) -> Dict[str, Any]:
+    """배치 문서 한 건을 {"id", "text_data"} 형태로 검증"""
+    if isinstance(document, str):
+        document = {"text_data": document}
+    if not isinstance(document, dict) or not document.get("text_data"):
+        raise HTTPException(status_code=400, detail=f"{index}번째 문서에 text_data가 필요합니다")
+    return {"id": document.get("id", index), "text_data": document["text_data"]}
+
+def _append_document(documents: List[Dict[str, Any]], document: Any) -> None:
+    if len(documents) >= SASB_BATCH_MAX_DOCUMENTS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"배치 문서 수가 최대 {SASB_BATCH_MAX_DOCUMENTS}건을 초과했습니다"
+        )
+    documents.append(_normalize_document(document, len(documents)))
+
+async def _read_ndjson_documents(request: Request) -> List[Dict[str, Any]]:
+    """NDJSON 본문을 스트리밍으로 읽으며 한 줄씩 파싱 (본문 전체를 한 번에 버퍼링하지 않음)"""
+    documents: List[Dict[str, Any]] = []
+    buffer = b""
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                _append_document(documents, json.loads(line))
+    if buffer.strip():
+        _append_document(documents, json.loads(buffer))
+    return documents
+
+@app.post("/analyze/batch")
+async def analyze_sasb_batch(request: Request):
+    """
+    여러 문서를 한 번에 SASB 분석 (문서 전체가 하나의 작업)
+
+    - application/json: {"documents": [{"id": ..., "text_data": ...}, ...]} 또는 문서 배열
+    - application/x-ndjson: 한 줄에 문서 하나 ({"id": ..., "text_data": ...})
+    결과는 GET /analysis/{analysis_id}에서 문서별 결과와 요약으로 조회합니다.
+    """
     try:
-        # 실제 구현에서는 데이터베이스나 파일 시스템에서 결과 조회
-        # 여기서는 샘플 응답
+        content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+        if content_type in NDJSON_CONTENT_TYPES:
+            documents = await _read_ndjson_documents(request)
+        else:
+            body = await request.json()
+            raw_documents = body.get("documents") if isinstance(body, dict) else body
+            if not isinstance(raw_documents, list):
+                raise HTTPException(status_code=400, detail="documents 배열이 필요합니다")
+            documents = []
+            for document in raw_documents:
+                _append_document(documents, document)
+
+        if not documents:
+            raise HTTPException(status_code=400, detail="분석할 문서가 필요합니다")
+        logger.info(f"SASB 배치 분석 요청 받음: 문서 {len(documents)}건")
+
+        job, deduplicated = job_service.submit({"documents": documents})
         return {
-            "analysis_id": analysis_id,
-            "status": "completed",
-            "results": {
-                "sasb_topics": [
-                    "GHG Emissions",
-                    "Energy Management", 
-                    "Water Management",
-                    "Waste Management"
-                ],
-                "materiality_scores": {
-                    "GHG Emissions": 8.5,
-                    "Energy Management": 7.2,
-                    "Water Management": 6.8,
-                    "Waste Management": 5.9
-                },
-                "recommendations": [
-                    "온실가스 배출량 감축 계획 수립 필요",
-                    "에너지 효율성 개선 방안 검토",
-                    "물 사용량 최적화 전략 개발"
-                ]
-            },
-            "generated_at": datetime.now().isoformat()
+            "message": "동일한 배치의 기존 분석 결과를 반환합니다" if deduplicated else "SASB 배치 분석이 시작되었습니다",
+            "analysis_id": job.job_id,
+            "status": job.status,
+            "document_count": len(documents),
+            "queue_depth": job_service.queue_depth,
+            "cached": deduplicated
         }
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        # JSON 파싱 오류 (json.JSONDecodeError는 ValueError의 하위 클래스)
+        raise HTTPException(status_code=400, detail=f"잘못된 JSON 형식: {str(e)}")
+    except Exception as e:
+        logger.error(f"SASB 배치 분석 오류: {e}")
+        raise HTTPException(status_code=500, detail=f"분석 중 오류 발생: {str(e)}")
+
+@app.get("/jobs/{job_id}", response_model=JobStatusResponse)
+async def get_job_status(job_id: str):
+    """분석 작업 상태 조회 (queued/running/done/failed)"""
+    job = job_service.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="분석 작업을 찾을 수 없습니다")
+    return JobStatusResponse(**job.model_dump(exclude={"payload"}))
+
+@app.get("/analysis/{analysis_id}")
+async def get_analysis_result(analysis_id: str, request: Request):
+    """분석 결과 조회 (ETag / If-None-Match 지원)"""
+    try:
+        stored = result_service.get(analysis_id)
+        if stored is not None:
+            etag, body = stored
+            headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+            if etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=304, headers=headers)
+            return Response(content=body, media_type="application/json", headers=headers)
         
+        # 결과가 아직 없으면 작업 상태를 반환
+        job = job_service.get(analysis_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="분석 결과를 찾을 수 없습니다")
+        if job.status == "done":
+            # 완료되었지만 결과가 TTL로 삭제된 경우 (작업 기록은 다음 정리 주기에 삭제됨)
+            raise HTTPException(status_code=410, detail="분석 결과 보관 기간이 만료되었습니다")
+        return Response(
+            content=JobStatusResponse(**job.model_dump(exclude={"payload"})).model_dump_json(),
+            media_type="application/json",
+            status_code=202 if job.status in ("queued", "running") else 200
+        )
+        
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"분석 결과 조회 오류: {e}")
         raise HTTPException(status_code=500, detail=f"결과 조회 중 오류 발생: {str(e)}")
 
+@app.get("/analysis/{analysis_id}/events")
+async def stream_analysis_progress(analysis_id: str):
+    """
+    분석 진행 상황 스트리밍 (Server-Sent Events)
+    
+    단계 전환, 진행률, 주제별 중간 점수를 push하며 done/failed 이벤트 후 종료됩니다.
+    Gateway 경유 시: /api/sasb/analysis/{analysis_id}/events
+    """
+    job = job_service.get(analysis_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="분석 작업을 찾을 수 없습니다")
+    
+    initial = {"stage": job.status.value, "percent": 100 if job.status in ("done", "failed") else 0, "partial": {}}
+    if job.error:
+        initial["error"] = job.error
+    
+    return StreamingResponse(
+        progress_broker.stream(analysis_id, initial),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.get("/sasb-topics")
 async def get_sasb_topics():
     """SASB 주제 목록 조회"""
@@ -196,23 +423,6 @@ async def get_sasb_topics():
         "total_count": len(sasb_topics)
     }
 
-async def run_sasb_analysis(data: Dict[str, Any]):
-    """백그라운드에서 실행되는 SASB 분석 함수"""
-    try:
-        logger.info("SASB 분석 백그라운드 작업 시작")
-        
-        # 실제 분석 로직 (시뮬레이션)
-        await asyncio.sleep(2)  # 분석 시뮬레이션
-        
-        # 분석 완료 후 상태 업데이트
-        service_status["last_analysis"] = datetime.now().isoformat()
-        service_status["total_analyses"] += 1
-        
-        logger.info("SASB 분석 완료")
-        
-    except Exception as e:
-        logger.error(f"SASB 분석 백그라운드 작업 오류: {e}")
-
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -0,0 +1,24 @@
+# sasb-service/app/metrics.py
+
+from prometheus_client import Gauge, Histogram
+
+# 공통 HTTP 메트릭과 미들웨어는 common/metrics_base.py의 복사본 (make sync-common)
+from metrics_base import (  # noqa: F401
+    LATENCY_BUCKETS, REQUEST_LATENCY, REQUESTS_IN_FLIGHT, MetricsMiddleware, metrics_endpoint, route_template,
+)
+
+JOB_DURATION = Histogram(
+    "sasb_job_duration_seconds",
+    "SASB 분석 작업 실행 시간 (워커 디스패치부터 결과 저장까지)",
+    ["outcome"],
+    buckets=LATENCY_BUCKETS,
+)
+QUEUE_DEPTH = Gauge(
+    "sasb_queue_depth",
+    "SASB 분석 대기열 길이",
+)
+DISPATCH_BATCH_SIZE = Histogram(
+    "sasb_dispatch_batch_size",
+    "워커 호출 한 번에 묶인 작업 수",
+    buckets=(1, 2, 4, 8, 16, 32, 64),
+)
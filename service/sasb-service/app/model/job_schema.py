@@ -0,0 +1,33 @@
+# sasb-service/app/model/job_schema.py
+
+from enum import Enum
+from typing import Optional, Dict, Any
+from pydantic import BaseModel, Field
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class Job(BaseModel):
+    job_id: str = Field(..., description="분석 작업 ID")
+    status: JobStatus
+    payload: Dict[str, Any] = Field(default_factory=dict, description="분석 요청 데이터")
+    error: Optional[str] = None
+    attempts: int = 0
+    created_at: str
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+
+
+class JobStatusResponse(BaseModel):
+    job_id: str
+    status: JobStatus
+    error: Optional[str] = None
+    attempts: int = 0
+    created_at: str
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
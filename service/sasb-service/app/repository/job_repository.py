@@ -0,0 +1,124 @@
+# sasb-service/app/repository/job_repository.py
+
+import os
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Optional, List, Dict, Any
+
+from model.job_schema import Job, JobStatus
+
+
+class JobRepository:
+    """분석 작업 상태를 로컬 SQLite에 영속화하는 저장소"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                error TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                created_at TEXT NOT NULL,
+                started_at TEXT,
+                finished_at TEXT
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status)")
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now().isoformat()
+
+    @staticmethod
+    def _to_job(row: sqlite3.Row) -> Job:
+        return Job(
+            job_id=row["job_id"],
+            status=JobStatus(row["status"]),
+            payload=json.loads(row["payload"]),
+            error=row["error"],
+            attempts=row["attempts"],
+            created_at=row["created_at"],
+            started_at=row["started_at"],
+            finished_at=row["finished_at"],
+        )
+
+    def create(self, job_id: str, payload: Dict[str, Any]) -> Job:
+        now = self._now()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (job_id, status, payload, created_at) VALUES (?, ?, ?, ?)",
+                (job_id, JobStatus.QUEUED.value, json.dumps(payload, ensure_ascii=False), now),
+            )
+        return Job(job_id=job_id, status=JobStatus.QUEUED, payload=payload, created_at=now)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._to_job(row) if row else None
+
+    def mark_running(self, job_id: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, started_at = ?, attempts = attempts + 1 WHERE job_id = ?",
+                (JobStatus.RUNNING.value, self._now(), job_id),
+            )
+
+    # 끝난 작업은 다시 실행되지 않으므로 입력 본문(payload)을 비워 저장 공간을 돌려받음
+    def mark_done(self, job_id: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, error = NULL, payload = '{}' WHERE job_id = ?",
+                (JobStatus.DONE.value, self._now(), job_id),
+            )
+
+    def mark_failed(self, job_id: str, error: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, error = ?, payload = '{}' WHERE job_id = ?",
+                (JobStatus.FAILED.value, self._now(), error, job_id),
+            )
+
+    def recover_unfinished(self) -> List[Job]:
+        """재시작 시 완료되지 않은 작업(queued/running)을 queued로 되돌려 반환"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, started_at = NULL WHERE status = ?",
+                (JobStatus.QUEUED.value, JobStatus.RUNNING.value),
+            )
+            rows = self._conn.execute(
+                "SELECT * FROM jobs WHERE status = ? ORDER BY created_at", (JobStatus.QUEUED.value,)
+            ).fetchall()
+        return [self._to_job(row) for row in rows]
+
+    def purge_finished_before(self, cutoff: float) -> int:
+        """cutoff(epoch 초) 이전에 끝난(done/failed) 작업 삭제"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND finished_at < ?",
+                (JobStatus.DONE.value, JobStatus.FAILED.value, datetime.fromtimestamp(cutoff).isoformat()),
+            )
+        return cursor.rowcount
+
+    def count_by_status(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) AS cnt FROM jobs GROUP BY status").fetchall()
+        return {row["status"]: row["cnt"] for row in rows}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,75 @@
+# sasb-service/app/repository/result_repository.py
+
+import os
+import time
+import sqlite3
+import threading
+from typing import Optional, Tuple
+
+
+class ResultRepository:
+    """
+    분석 결과를 로컬 SQLite에 보관하는 저장소
+
+    결과 본문은 직렬화된 JSON 바이트 그대로 저장하여 조회 시 재직렬화를 피합니다.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS results (
+                analysis_id TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                etag TEXT NOT NULL,
+                body BLOB NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_results_hash ON results (content_hash)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_results_created ON results (created_at)")
+
+    def save(self, analysis_id: str, content_hash: str, etag: str, body: bytes) -> float:
+        created_at = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (analysis_id, content_hash, etag, body, created_at) VALUES (?, ?, ?, ?, ?)",
+                (analysis_id, content_hash, etag, body, created_at),
+            )
+        return created_at
+
+    def get(self, analysis_id: str) -> Optional[Tuple[str, bytes, float]]:
+        """(etag, body, created_at) 반환"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, body, created_at FROM results WHERE analysis_id = ?", (analysis_id,)
+            ).fetchone()
+        return (row[0], bytes(row[1]), row[2]) if row else None
+
+    def find_by_hash(self, content_hash: str, min_created_at: float) -> Optional[str]:
+        """동일 입력에 대한 최신 결과의 analysis_id 반환"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT analysis_id FROM results WHERE content_hash = ? AND created_at >= ? "
+                "ORDER BY created_at DESC LIMIT 1",
+                (content_hash, min_created_at),
+            ).fetchone()
+        return row[0] if row else None
+
+    def purge_older_than(self, cutoff: float) -> int:
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM results WHERE created_at < ?", (cutoff,))
+        return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
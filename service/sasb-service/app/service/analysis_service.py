@@ -0,0 +1,147 @@
+# sasb-service/app/service/analysis_service.py
+
+import re
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Any, List, Callable, Optional, Tuple
+
+# 진행 상황 콜백: (stage, percent, partial_scores)
+ProgressCallback = Callable[[str, int, Dict[str, Any]], None]
+
+# SASB 주제별 키워드 (한/영)
+SASB_TOPIC_KEYWORDS: Dict[str, List[str]] = {
+    "GHG Emissions": ["온실가스", "탄소", "배출", "탄소중립", "넷제로", "ghg", "emission", "co2", "carbon"],
+    "Energy Management": ["에너지", "전력", "재생에너지", "효율", "태양광", "풍력", "energy", "renewable", "electricity"],
+    "Water Management": ["용수", "수자원", "폐수", "취수", "water", "wastewater"],
+    "Waste Management": ["폐기물", "재활용", "매립", "순환", "waste", "recycling", "landfill"],
+    "Labor Practices": ["노동", "근로자", "안전", "산재", "인권", "임금", "labor", "safety", "human rights"],
+}
+
+SASB_RECOMMENDATIONS: Dict[str, str] = {
+    "GHG Emissions": "온실가스 배출량 감축 계획 수립 필요",
+    "Energy Management": "에너지 효율성 개선 방안 검토",
+    "Water Management": "물 사용량 최적화 전략 개발",
+    "Waste Management": "폐기물 감축 및 재활용률 제고 방안 마련",
+    "Labor Practices": "근로자 안전 및 인권 관리 체계 점검",
+}
+
+_TOKEN_PATTERN = re.compile(r"[0-9A-Za-z가-힣]+")
+
+
+def _normalize_text(text_data: Any) -> str:
+    if isinstance(text_data, list):
+        return "\n".join(str(item) for item in text_data)
+    return str(text_data)
+
+
+def run_sasb_analysis(data: Dict[str, Any], progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+    """
+    SASB 주제별 중대성 점수 계산 (워커 프로세스에서 실행되는 CPU 작업)
+
+    텍스트 내 주제 키워드 출현 빈도를 0~10 점수로 정규화합니다.
+    `progress`가 주어지면 단계 전환과 주제별 중간 점수를 보고합니다.
+    """
+    report = progress or (lambda stage, percent, partial: None)
+
+    report("tokenize", 5, {})
+    text = _normalize_text(data.get("text_data", "")).lower()
+    tokens = Counter(_TOKEN_PATTERN.findall(text))
+    report("tokenize", 20, {})
+
+    raw_scores: Dict[str, int] = {}
+    topic_count = len(SASB_TOPIC_KEYWORDS)
+    for index, (topic, keywords) in enumerate(SASB_TOPIC_KEYWORDS.items(), start=1):
+        hits = 0
+        for keyword in keywords:
+            if " " in keyword:
+                hits += text.count(keyword)
+            else:
+                # 한국어는 조사가 붙으므로 토큰 접두 일치로 계산
+                hits += sum(count for token, count in tokens.items() if token.startswith(keyword))
+        raw_scores[topic] = hits
+        report("score", 20 + int(70 * index / topic_count), {"keyword_hits": dict(raw_scores)})
+
+    max_hits = max(raw_scores.values()) if raw_scores else 0
+    materiality_scores = {
+        topic: round(10.0 * hits / max_hits, 1) if max_hits else 0.0
+        for topic, hits in raw_scores.items()
+    }
+    ranked_topics = [topic for topic, score in sorted(materiality_scores.items(), key=lambda x: -x[1]) if score > 0]
+    report("finalize", 95, {"materiality_scores": materiality_scores})
+
+    return {
+        "sasb_topics": ranked_topics,
+        "materiality_scores": materiality_scores,
+        "keyword_hits": raw_scores,
+        "recommendations": [SASB_RECOMMENDATIONS[topic] for topic in ranked_topics[:3]],
+        "generated_at": datetime.now().isoformat(),
+    }
+
+
+def run_sasb_batch_analysis(documents: List[Dict[str, Any]], progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+    """
+    여러 문서를 한 작업으로 분석
+
+    문서별 결과와 함께 전체 문서의 주제별 평균 중대성 점수를 요약으로 반환합니다.
+    """
+    report = progress or (lambda stage, percent, partial: None)
+    total = len(documents)
+    report("score", 5, {"documents_done": 0, "documents_total": total})
+
+    results: List[Dict[str, Any]] = []
+    score_sums: Counter = Counter()
+    for index, document in enumerate(documents, start=1):
+        result = run_sasb_analysis(document)
+        result["id"] = document.get("id", index - 1)
+        results.append(result)
+        score_sums.update(result["materiality_scores"])
+        report("score", 5 + int(90 * index / total), {"documents_done": index, "documents_total": total})
+
+    average_scores = {
+        topic: round(score_sums[topic] / total, 2) if total else 0.0
+        for topic in SASB_TOPIC_KEYWORDS
+    }
+    ranked_topics = [topic for topic, score in sorted(average_scores.items(), key=lambda x: -x[1]) if score > 0]
+    report("finalize", 95, {"materiality_scores": average_scores})
+
+    return {
+        "documents": results,
+        "summary": {
+            "document_count": total,
+            "sasb_topics": ranked_topics,
+            "average_materiality_scores": average_scores,
+            "recommendations": [SASB_RECOMMENDATIONS[topic] for topic in ranked_topics[:3]],
+        },
+        "generated_at": datetime.now().isoformat(),
+    }
+
+
+def is_batch_payload(data: Dict[str, Any]) -> bool:
+    return isinstance(data.get("documents"), list)
+
+
+def run_sasb_analysis_job(job_id: str, data: Dict[str, Any], progress_queue=None) -> Dict[str, Any]:
+    """워커 프로세스 진입점: 진행 상황을 프로세스 간 큐로 전달"""
+    report = None
+    if progress_queue is not None:
+        def report(stage: str, percent: int, partial: Dict[str, Any]) -> None:
+            progress_queue.put((job_id, {"stage": stage, "percent": percent, "partial": partial}))
+
+    if is_batch_payload(data):
+        return run_sasb_batch_analysis(data["documents"], report)
+    return run_sasb_analysis(data, report)
+
+
+def run_sasb_analysis_jobs(jobs: List[Tuple[str, Dict[str, Any]]], progress_queue=None) -> List[Tuple[str, Optional[Dict[str, Any]], Optional[str]]]:
+    """
+    병합(coalesced)된 여러 작업을 워커 한 번의 호출로 처리
+
+    작업별로 (job_id, 결과, 오류 메시지)를 반환하며 한 작업의 실패가 다른 작업에 영향을 주지 않습니다.
+    """
+    outcomes = []
+    for job_id, data in jobs:
+        try:
+            outcomes.append((job_id, run_sasb_analysis_job(job_id, data, progress_queue), None))
+        except Exception as e:
+            outcomes.append((job_id, None, str(e)))
+    return outcomes
@@ -0,0 +1,264 @@
+# sasb-service/app/service/job_service.py
+
+import time
+import uuid
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Tuple
+
+from fastapi import HTTPException
+
+from metrics import DISPATCH_BATCH_SIZE, JOB_DURATION
+from model.job_schema import Job
+from repository.job_repository import JobRepository
+from service.analysis_service import is_batch_payload, run_sasb_analysis_jobs
+from service.result_service import ResultService, content_hash
+from service.progress_service import ProgressBroker
+
+logger = logging.getLogger(__name__)
+
+# 큐 항목: (job_id, payload, data_hash)
+QueueItem = Tuple[str, Dict[str, Any], str]
+
+
+class JobService:
+    """
+    SASB 분석 작업 큐 및 워커 풀
+
+    - 작업 상태는 SQLite에 기록되어 재시작 후에도 이어서 처리됩니다.
+    - 큐가 가득 차면 429로 즉시 거절하여 백프레셔를 겁니다.
+    - 분석은 이벤트 루프와 분리된 프로세스 풀에서 실행됩니다.
+    - 동일한 text_data는 기존 결과(또는 진행 중인 작업)를 재사용합니다.
+    - 짧은 시간 안에 들어온 단일 문서 작업은 워커 배치 하나로 묶어 디스패치 비용을 줄입니다.
+    - 워커 프로세스가 비정상 종료되어 풀이 깨지면 진행 중이던 작업을 실패 처리하고 풀을 새로 만듭니다.
+    - 끝난 작업 기록은 결과 TTL이 지나면 결과와 같은 정리 주기에 삭제됩니다.
+    """
+
+    def __init__(
+        self,
+        repository: JobRepository,
+        result_service: ResultService,
+        progress_broker: Optional[ProgressBroker] = None,
+        workers: int = 2,
+        queue_size: int = 100,
+        coalesce_window: float = 0.0,
+        coalesce_max: int = 32,
+    ):
+        self.repository = repository
+        self.result_service = result_service
+        self.progress_broker = progress_broker or ProgressBroker()
+        self.workers = max(1, workers)
+        self.queue_size = max(1, queue_size)
+        self.coalesce_window = max(0.0, coalesce_window)
+        self.coalesce_max = max(1, coalesce_max)
+
+        self.queue: Optional[asyncio.Queue] = None
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self._dispatchers: List[asyncio.Task] = []
+        self._recovery_task: Optional[asyncio.Task] = None
+        self._inflight: Dict[str, str] = {}
+        self.accepting = False
+
+        self.completed = 0
+        self.failed = 0
+        self.last_finished_at: Optional[str] = None
+        self.coalesced_batches = 0
+        self.coalesced_jobs = 0
+        self.pool_restarts = 0
+
+        self.result_service.purge_listeners.append(self.purge_finished)
+
+    @staticmethod
+    def new_job_id() -> str:
+        """충돌 없는 작업 ID 생성"""
+        return f"sasb_{uuid.uuid4().hex}"
+
+    async def start(self) -> None:
+        self.queue = asyncio.Queue(maxsize=self.queue_size)
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        self.progress_broker.start()
+        self._dispatchers = [asyncio.create_task(self._dispatch_loop(i)) for i in range(self.workers)]
+        self.accepting = True
+
+        # 이전 실행에서 끝나지 않은 작업 복구 (큐 여유가 생길 때까지 대기하며 적재)
+        unfinished = self.repository.recover_unfinished()
+        if unfinished:
+            logger.info(f"미완료 작업 {len(unfinished)}건 복구")
+            self._recovery_task = asyncio.create_task(self._requeue(unfinished))
+
+        logger.info(f"작업 워커 풀 시작: workers={self.workers}, queue_size={self.queue_size}")
+
+    async def stop(self) -> None:
+        self.accepting = False
+        tasks = self._dispatchers + ([self._recovery_task] if self._recovery_task else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._dispatchers = []
+        self._recovery_task = None
+
+        if self.executor is not None:
+            # 실행 중이던 작업은 running 상태로 남아 다음 시작 시 복구됨
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+        self.progress_broker.stop()
+
+    def _replace_executor(self, broken: ProcessPoolExecutor) -> None:
+        """
+        깨진 프로세스 풀 교체
+
+        같은 풀에서 실패한 디스패처가 여럿이어도 한 번만 교체되도록 현재 풀이 깨진 풀일 때만 새로 만듭니다.
+        """
+        if self.executor is not broken or not self.accepting:
+            return
+        broken.shutdown(wait=False, cancel_futures=True)
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        self.pool_restarts += 1
+        logger.warning(f"작업 워커 풀이 깨져 새로 생성했습니다 (누적 {self.pool_restarts}회)")
+
+    def purge_finished(self, cutoff: float) -> int:
+        """결과 TTL이 지난 완료/실패 작업 기록 삭제"""
+        removed = self.repository.purge_finished_before(cutoff)
+        if removed:
+            logger.info(f"만료된 분석 작업 {removed}건 삭제")
+        return removed
+
+    async def _requeue(self, jobs: List[Job]) -> None:
+        for job in jobs:
+            data_hash = content_hash(job.payload)
+            self._inflight.setdefault(data_hash, job.job_id)
+            await self.queue.put((job.job_id, job.payload, data_hash))
+
+    def find_duplicate(self, data_hash: str) -> Optional[Job]:
+        """같은 내용의 완료된 결과 또는 진행 중인 작업 조회"""
+        job_id = self._inflight.get(data_hash) or self.result_service.find_by_hash(data_hash)
+        return self.repository.get(job_id) if job_id else None
+
+    def submit(self, payload: Dict[str, Any]) -> Tuple[Job, bool]:
+        """
+        작업 등록 (큐가 가득 차면 429, 종료 중이면 503)
+
+        반환값의 두 번째 항목은 기존 작업을 재사용했는지 여부입니다.
+        """
+        data_hash = content_hash(payload)
+        duplicate = self.find_duplicate(data_hash)
+        if duplicate is not None:
+            return duplicate, True
+
+        if not self.accepting or self.queue is None:
+            raise HTTPException(status_code=503, detail="분석 작업을 받을 수 없는 상태입니다")
+        if self.queue.full():
+            raise HTTPException(
+                status_code=429,
+                detail="분석 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요",
+                headers={"Retry-After": "5"},
+            )
+
+        job = self.repository.create(self.new_job_id(), payload)
+        self._inflight[data_hash] = job.job_id
+        self.queue.put_nowait((job.job_id, payload, data_hash))
+        self.progress_broker.publish(job.job_id, {"stage": "queued", "percent": 0, "partial": {}})
+        return job, False
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self.repository.get(job_id)
+
+    @property
+    def queue_depth(self) -> int:
+        return self.queue.qsize() if self.queue is not None else 0
+
+    def _finish(self, job_id: str, data_hash: str, results: Optional[Dict[str, Any]], error: Optional[str],
+                started: Optional[float] = None) -> None:
+        """작업 결과 저장 및 완료/실패 이벤트 발행 (started가 있으면 실행 시간 기록)"""
+        if started is not None:
+            JOB_DURATION.labels("done" if error is None else "failed").observe(time.perf_counter() - started)
+        if error is None:
+            self.result_service.save(job_id, data_hash, results)
+            self.repository.mark_done(job_id)
+            # 배치 작업은 문서 평균 점수를 최종 점수로 전달
+            scores = results.get("materiality_scores") or results.get("summary", {}).get("average_materiality_scores", {})
+            self.progress_broker.publish(job_id, {
+                "stage": "done",
+                "percent": 100,
+                "partial": {"materiality_scores": scores}
+            })
+            self.completed += 1
+            logger.info(f"SASB 분석 완료: {job_id}")
+        else:
+            self.repository.mark_failed(job_id, error)
+            self.progress_broker.publish(job_id, {"stage": "failed", "percent": 100, "partial": {}, "error": error})
+            self.failed += 1
+            logger.error(f"SASB 분석 실패 ({job_id}): {error}")
+        self.last_finished_at = datetime.now().isoformat()
+
+    async def _next_batch(self, carry: Optional[QueueItem]) -> Tuple[List[QueueItem], Optional[QueueItem]]:
+        """
+        큐에서 다음 워커 배치를 꺼냄
+
+        단일 문서 작업은 coalesce_window 동안 함께 도착한 단일 문서 작업과 묶어 워커 한 번의 호출로 처리합니다.
+        묶는 도중 꺼낸 배치 작업은 다음 차례로 넘깁니다.
+        """
+        item = carry if carry is not None else await self.queue.get()
+        batch = [item]
+        if self.coalesce_window <= 0 or self.coalesce_max <= 1 or is_batch_payload(item[1]):
+            return batch, None
+
+        if self.queue.empty():
+            # 잠시 기다려 동시에 들어오는 요청을 모음
+            await asyncio.sleep(self.coalesce_window)
+        while len(batch) < self.coalesce_max and not self.queue.empty():
+            next_item = self.queue.get_nowait()
+            if is_batch_payload(next_item[1]):
+                return batch, next_item
+            batch.append(next_item)
+        return batch, None
+
+    async def _dispatch_loop(self, worker_index: int) -> None:
+        loop = asyncio.get_running_loop()
+        carry: Optional[QueueItem] = None
+        while True:
+            batch, carry = await self._next_batch(carry)
+            finished = set()
+            started = time.perf_counter()
+            DISPATCH_BATCH_SIZE.observe(len(batch))
+            executor = self.executor
+            try:
+                for job_id, _, _ in batch:
+                    self.repository.mark_running(job_id)
+                    self.progress_broker.publish(job_id, {"stage": "running", "percent": 1, "partial": {}})
+                if len(batch) > 1:
+                    self.coalesced_batches += 1
+                    self.coalesced_jobs += len(batch)
+
+                outcomes = await loop.run_in_executor(
+                    executor,
+                    run_sasb_analysis_jobs,
+                    [(job_id, payload) for job_id, payload, _ in batch],
+                    self.progress_broker.worker_queue
+                )
+                hashes = {job_id: data_hash for job_id, _, data_hash in batch}
+                for job_id, results, error in outcomes:
+                    self._finish(job_id, hashes[job_id], results, error, started)
+                    finished.add(job_id)
+            except asyncio.CancelledError:
+                raise
+            except BrokenProcessPool as e:
+                # 워커 프로세스가 죽으면 풀 전체가 깨져 이후 제출도 모두 실패하므로 풀을 교체
+                error = f"분석 워커 프로세스가 비정상 종료되었습니다: {e}"
+                for job_id, _, data_hash in batch:
+                    if job_id not in finished:
+                        self._finish(job_id, data_hash, None, error, started)
+                self._replace_executor(executor)
+            except Exception as e:
+                # 워커 프로세스 자체가 실패한 경우 배치 내 남은 작업을 모두 실패 처리
+                for job_id, _, data_hash in batch:
+                    if job_id not in finished:
+                        self._finish(job_id, data_hash, None, str(e), started)
+            finally:
+                for job_id, _, data_hash in batch:
+                    if self._inflight.get(data_hash) == job_id:
+                        del self._inflight[data_hash]
+                    self.queue.task_done()
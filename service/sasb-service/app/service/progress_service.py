@@ -0,0 +1,119 @@
+# sasb-service/app/service/progress_service.py
+
+import json
+import queue
+import asyncio
+import logging
+import threading
+import multiprocessing
+from collections import deque
+from typing import Dict, Any, Optional, Set, AsyncIterator
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STAGES = frozenset({"done", "failed"})
+
+
+class ProgressBroker:
+    """
+    분석 작업 진행 이벤트를 구독자(SSE 스트림)에게 팬아웃
+
+    워커 프로세스는 Manager 큐로 이벤트를 보내고, 수신 스레드가 이를 이벤트 루프로 넘깁니다.
+    각 작업의 마지막 이벤트를 보관하여 늦게 연결한 구독자도 현재 상태를 즉시 받습니다.
+    """
+
+    def __init__(self, subscriber_queue_size: int = 64, retain_terminal: int = 1024):
+        self.subscriber_queue_size = subscriber_queue_size
+        self.retain_terminal = retain_terminal
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._last_event: Dict[str, Dict[str, Any]] = {}
+        self._finished: deque = deque()
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._manager = None
+        self.worker_queue = None
+        self._reader: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    def start(self) -> None:
+        """워커 프로세스용 큐 생성 및 수신 스레드 시작"""
+        self._loop = asyncio.get_running_loop()
+        self._manager = multiprocessing.Manager()
+        self.worker_queue = self._manager.Queue()
+        self._stopping.clear()
+        self._reader = threading.Thread(target=self._read_worker_events, name="sasb-progress-reader", daemon=True)
+        self._reader.start()
+
+    def stop(self) -> None:
+        self._stopping.set()
+        if self._reader is not None:
+            self._reader.join(timeout=2)
+            self._reader = None
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+            self.worker_queue = None
+
+    def _read_worker_events(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                job_id, event = self.worker_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            except (EOFError, OSError):
+                break
+            self._loop.call_soon_threadsafe(self.publish, job_id, event)
+
+    def publish(self, job_id: str, event: Dict[str, Any]) -> None:
+        """이벤트 발행 (이벤트 루프 스레드에서 호출)"""
+        previous = self._last_event.get(job_id)
+        if previous is not None and previous.get("stage") in TERMINAL_STAGES:
+            # 워커 큐를 거쳐 늦게 도착한 중간 이벤트는 완료 이벤트를 덮어쓰지 않음
+            return
+        self._last_event[job_id] = event
+        if event.get("stage") in TERMINAL_STAGES:
+            self._finished.append(job_id)
+            while len(self._finished) > self.retain_terminal:
+                self._last_event.pop(self._finished.popleft(), None)
+
+        for subscriber in list(self._subscribers.get(job_id, ())):
+            try:
+                subscriber.put_nowait(event)
+            except asyncio.QueueFull:
+                # 느린 구독자는 중간 이벤트를 건너뛰고 최신 이벤트만 받음
+                try:
+                    subscriber.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+                subscriber.put_nowait(event)
+
+    def last_event(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return self._last_event.get(job_id)
+
+    @staticmethod
+    def format_sse(event: Dict[str, Any]) -> str:
+        return f"event: {event.get('stage', 'progress')}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+    async def stream(self, job_id: str, initial: Dict[str, Any], keepalive: float = 15.0) -> AsyncIterator[str]:
+        """작업 완료/실패 시까지 SSE 형식 이벤트를 생성"""
+        subscriber: asyncio.Queue = asyncio.Queue(maxsize=self.subscriber_queue_size)
+        self._subscribers.setdefault(job_id, set()).add(subscriber)
+        try:
+            event = initial
+            if initial.get("stage") not in TERMINAL_STAGES:
+                event = self._last_event.get(job_id, initial)
+            yield self.format_sse(event)
+            while event.get("stage") not in TERMINAL_STAGES:
+                try:
+                    event = await asyncio.wait_for(subscriber.get(), timeout=keepalive)
+                except asyncio.TimeoutError:
+                    # 프록시 유휴 타임아웃 방지용 주석 라인
+                    yield ": keep-alive\n\n"
+                    continue
+                yield self.format_sse(event)
+        finally:
+            subscribers = self._subscribers.get(job_id)
+            if subscribers is not None:
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    del self._subscribers[job_id]
@@ -0,0 +1,160 @@
+# sasb-service/app/service/result_service.py
+
+import json
+import time
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Any, Optional, Tuple, List, Callable
+
+from repository.result_repository import ResultRepository
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(data: Dict[str, Any]) -> str:
+    """분석 입력(text_data 또는 배치 documents)의 내용 해시 (중복 분석 방지용)"""
+    if isinstance(data.get("documents"), list):
+        # 배치 작업은 단일 문서 작업과 키가 겹치지 않도록 접두어를 붙임
+        text_data = "batch:" + json.dumps(data["documents"], ensure_ascii=False, sort_keys=True)
+    else:
+        text_data = data.get("text_data", "")
+        if not isinstance(text_data, str):
+            text_data = json.dumps(text_data, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(text_data.encode("utf-8")).hexdigest()
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match 헤더가 etag와 일치하는지 검사 (RFC 7232 약한 비교)
+
+    `*`, 쉼표로 구분된 여러 태그, `W/` 약한 태그를 모두 처리합니다.
+    """
+    if not if_none_match:
+        return False
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == opaque:
+            return True
+    return False
+
+
+class ResultService:
+    """
+    분석 결과 저장소 + 메모리 LRU 캐시
+
+    - 워커가 완료한 결과를 SQLite에 기록하고, 최근 조회 결과는 메모리에 유지합니다.
+    - ETag는 결과 본문의 해시로 만들어 If-None-Match 조건부 요청에 사용합니다.
+    - TTL이 지난 결과는 주기적으로 삭제되며, 같은 주기에 purge_listeners도 cutoff와 함께 호출됩니다.
+    """
+
+    def __init__(self, repository: ResultRepository, cache_size: int = 256, ttl_seconds: float = 7 * 86400):
+        self.repository = repository
+        self.cache_size = max(0, cache_size)
+        self.ttl_seconds = ttl_seconds
+        self._cache: "OrderedDict[str, Tuple[str, bytes, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._purge_task: Optional[asyncio.Task] = None
+        # 결과와 함께 만료시킬 데이터 정리 함수 (cutoff 이전 항목을 지우고 삭제 건수 반환)
+        self.purge_listeners: List[Callable[[float], int]] = []
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_etag(body: bytes) -> str:
+        return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+    def _cache_put(self, analysis_id: str, entry: Tuple[str, bytes, float]) -> None:
+        if not self.cache_size:
+            return
+        with self._lock:
+            self._cache[analysis_id] = entry
+            self._cache.move_to_end(analysis_id)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def save(self, analysis_id: str, data_hash: str, results: Dict[str, Any]) -> str:
+        """분석 결과 저장 후 ETag 반환"""
+        body = json.dumps({
+            "analysis_id": analysis_id,
+            "status": "done",
+            "results": results,
+            "generated_at": results.get("generated_at", datetime.now().isoformat())
+        }, ensure_ascii=False).encode("utf-8")
+        etag = self.make_etag(body)
+        created_at = self.repository.save(analysis_id, data_hash, etag, body)
+        self._cache_put(analysis_id, (etag, body, created_at))
+        return etag
+
+    def get(self, analysis_id: str) -> Optional[Tuple[str, bytes]]:
+        """(etag, JSON 본문) 반환, 없거나 만료되었으면 None"""
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            entry = self._cache.get(analysis_id)
+            if entry is not None:
+                self._cache.move_to_end(analysis_id)
+
+        if entry is None:
+            self.misses += 1
+            entry = self.repository.get(analysis_id)
+            if entry is None:
+                return None
+            self._cache_put(analysis_id, entry)
+        else:
+            self.hits += 1
+
+        etag, body, created_at = entry
+        if created_at < cutoff:
+            with self._lock:
+                self._cache.pop(analysis_id, None)
+            return None
+        return etag, body
+
+    def find_by_hash(self, data_hash: str) -> Optional[str]:
+        """동일 내용으로 이미 분석된 결과의 analysis_id 조회"""
+        return self.repository.find_by_hash(data_hash, time.time() - self.ttl_seconds)
+
+    def purge_expired(self) -> int:
+        cutoff = time.time() - self.ttl_seconds
+        removed = self.repository.purge_older_than(cutoff)
+        with self._lock:
+            for analysis_id in [key for key, entry in self._cache.items() if entry[2] < cutoff]:
+                del self._cache[analysis_id]
+        if removed:
+            logger.info(f"만료된 분석 결과 {removed}건 삭제")
+        for listener in self.purge_listeners:
+            listener(cutoff)
+        return removed
+
+    async def _purge_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self.purge_expired()
+            except Exception as e:
+                logger.error(f"분석 결과 정리 실패: {e}")
+
+    def start(self, interval: float = 3600) -> None:
+        if self._purge_task is None:
+            self.purge_expired()
+            self._purge_task = asyncio.create_task(self._purge_loop(interval))
+
+    async def stop(self) -> None:
+        if self._purge_task is not None:
+            self._purge_task.cancel()
+            try:
+                await self._purge_task
+            except asyncio.CancelledError:
+                pass
+            self._purge_task = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {"cache_size": len(self._cache), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,7 @@
+# sasb-service/tests/conftest.py
+
+import os
+import sys
+
+# 서비스 모듈은 app 디렉터리를 최상위 경로로 두고 서로 절대 경로로 import 함 (uvicorn main:app과 동일)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
@@ -0,0 +1,51 @@
+# sasb-service/tests/test_analysis_api.py
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(scope="module")
+def main_module(tmp_path_factory):
+    # main은 import 시점에 SASB_DB_PATH로 저장소를 열기 때문에 임시 경로를 먼저 지정
+    monkeypatch = pytest.MonkeyPatch()
+    monkeypatch.setenv("SASB_DB_PATH", str(tmp_path_factory.mktemp("sasb") / "sasb.db"))
+    import main
+    yield main
+    monkeypatch.undo()
+
+
+@pytest.fixture
+def client(main_module):
+    # lifespan(워커 풀, 레지스트리 등록)은 띄우지 않고 조회 경로만 사용
+    return TestClient(main_module.app)
+
+
+def test_expired_result_of_done_job_returns_410(main_module, client):
+    repository = main_module.job_service.repository
+    repository.create("expired", {"text_data": "가"})
+    repository.mark_done("expired")
+
+    assert client.get("/analysis/expired").status_code == 410
+    assert client.get("/analysis/unknown").status_code == 404
+
+
+def test_pending_job_returns_202(main_module, client):
+    main_module.job_service.repository.create("pending", {"text_data": "나"})
+
+    response = client.get("/analysis/pending")
+    assert response.status_code == 202
+    assert response.json()["status"] == "queued"
+
+
+def test_if_none_match_uses_weak_comparison(main_module, client):
+    repository = main_module.job_service.repository
+    repository.create("cached", {"text_data": "다"})
+    repository.mark_done("cached")
+    etag = main_module.result_service.save("cached", "hash-cached", {"materiality_scores": {}})
+
+    assert client.get("/analysis/cached").headers["etag"] == etag
+    for header in (etag, f"W/{etag}", f'"stale", {etag}', "*"):
+        response = client.get("/analysis/cached", headers={"If-None-Match": header})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+    assert client.get("/analysis/cached", headers={"If-None-Match": '"stale"'}).status_code == 200
@@ -0,0 +1,75 @@
+# sasb-service/tests/test_job_repository.py
+
+import time
+
+from model.job_schema import JobStatus
+from repository.job_repository import JobRepository
+
+
+def test_status_transitions(tmp_path):
+    repository = JobRepository(str(tmp_path / "jobs.db"))
+    job = repository.create("job-1", {"text_data": "가"})
+    assert job.status == JobStatus.QUEUED
+
+    repository.mark_running("job-1")
+    running = repository.get("job-1")
+    assert running.status == JobStatus.RUNNING
+    assert running.attempts == 1 and running.started_at is not None
+
+    repository.mark_done("job-1")
+    done = repository.get("job-1")
+    assert done.status == JobStatus.DONE
+    assert done.finished_at is not None and done.error is None
+
+    repository.create("job-2", {"text_data": "나"})
+    repository.mark_running("job-2")
+    repository.mark_failed("job-2", "boom")
+    failed = repository.get("job-2")
+    assert failed.status == JobStatus.FAILED and failed.error == "boom"
+
+    assert repository.count_by_status() == {"done": 1, "failed": 1}
+    assert repository.get("missing") is None
+
+
+def test_recover_unfinished_requeues_running_jobs_in_creation_order(tmp_path):
+    path = str(tmp_path / "jobs.db")
+    repository = JobRepository(path)
+    repository.create("first", {"text_data": "1"})
+    time.sleep(0.001)
+    repository.create("second", {"text_data": "2"})
+    time.sleep(0.001)
+    repository.create("finished", {"text_data": "3"})
+    repository.mark_running("first")
+    repository.mark_running("finished")
+    repository.mark_done("finished")
+    repository.close()
+
+    # 재시작 후 새 연결에서도 상태가 유지되어야 함
+    reopened = JobRepository(path)
+    recovered = reopened.recover_unfinished()
+
+    assert [job.job_id for job in recovered] == ["first", "second"]
+    assert all(job.status == JobStatus.QUEUED for job in recovered)
+    assert recovered[0].started_at is None and recovered[0].attempts == 1
+    assert reopened.get("finished").status == JobStatus.DONE
+    assert reopened.count_by_status() == {"queued": 2, "done": 1}
+    reopened.close()
+
+
+def test_finished_jobs_drop_payload_and_are_purged_after_cutoff(tmp_path):
+    repository = JobRepository(str(tmp_path / "jobs.db"))
+    repository.create("done", {"text_data": "가" * 1000})
+    repository.create("failed", {"text_data": "나"})
+    repository.create("queued", {"text_data": "다"})
+    repository.mark_done("done")
+    repository.mark_failed("failed", "boom")
+
+    assert repository.get("done").payload == {}
+    assert repository.get("failed").payload == {}
+    assert repository.get("queued").payload == {"text_data": "다"}
+
+    assert repository.purge_finished_before(time.time() - 60) == 0
+    assert repository.purge_finished_before(time.time() + 1) == 2
+    assert repository.get("done") is None and repository.get("failed") is None
+    # 끝나지 않은 작업은 cutoff와 무관하게 유지
+    assert repository.get("queued") is not None
@@ -0,0 +1,194 @@
+# sasb-service/tests/test_job_service.py
+
+import asyncio
+import os
+import time
+
+import pytest
+from fastapi import HTTPException
+
+import service.job_service as job_service
+from model.job_schema import JobStatus
+from repository.job_repository import JobRepository
+from repository.result_repository import ResultRepository
+from service.result_service import ResultService
+
+
+def stub_analysis(jobs, progress_queue):
+    """
+    run_sasb_analysis_jobs 대체 (워커 프로세스에서 실행)
+
+    text_data 접두사로 동작을 고름: crash는 워커 종료, fail은 작업 실패, wait:<경로>는 파일이 생길 때까지 대기
+    """
+    outcomes = []
+    for job_id, payload in jobs:
+        text = payload.get("text_data", "")
+        if text == "crash":
+            os._exit(1)
+        if text.startswith("wait:"):
+            deadline = time.time() + 10
+            while not os.path.exists(text[len("wait:"):]) and time.time() < deadline:
+                time.sleep(0.01)
+        if text == "fail":
+            outcomes.append((job_id, None, "분석 실패"))
+        else:
+            outcomes.append((job_id, {"materiality_scores": {"topic": len(text)}}, None))
+    return outcomes
+
+
+@pytest.fixture
+def make_service(tmp_path, monkeypatch):
+    monkeypatch.setattr(job_service, "run_sasb_analysis_jobs", stub_analysis)
+
+    def factory(**kwargs):
+        kwargs.setdefault("workers", 1)
+        return job_service.JobService(
+            JobRepository(str(tmp_path / "jobs.db")),
+            ResultService(ResultRepository(str(tmp_path / "results.db"))),
+            **kwargs,
+        )
+
+    return factory
+
+
+async def drain(service):
+    await asyncio.wait_for(service.queue.join(), timeout=30)
+
+
+async def wait_for_status(service, job_id, status):
+    deadline = time.time() + 10
+    while service.get(job_id).status != status:
+        assert time.time() < deadline, f"{job_id} did not reach {status}"
+        await asyncio.sleep(0.01)
+
+
+def test_submit_rejected_with_503_when_not_accepting(make_service):
+    async def scenario():
+        service = make_service()
+        with pytest.raises(HTTPException) as before_start:
+            service.submit({"text_data": "가"})
+        assert before_start.value.status_code == 503
+
+        await service.start()
+        await service.stop()
+        with pytest.raises(HTTPException) as after_stop:
+            service.submit({"text_data": "가"})
+        assert after_stop.value.status_code == 503
+
+    asyncio.run(scenario())
+
+
+def test_submit_rejected_with_429_when_queue_full(make_service):
+    async def scenario():
+        # 디스패처 없이 큐만 열어 두면 대기열이 비워지지 않음
+        service = make_service(queue_size=1)
+        service.queue = asyncio.Queue(maxsize=service.queue_size)
+        service.accepting = True
+
+        first, reused = service.submit({"text_data": "가"})
+        assert not reused and first.status == JobStatus.QUEUED
+        with pytest.raises(HTTPException) as full:
+            service.submit({"text_data": "나"})
+        assert full.value.status_code == 429
+        assert full.value.headers["Retry-After"] == "5"
+        # 같은 내용은 큐가 가득 차도 진행 중인 작업을 재사용
+        assert service.submit({"text_data": "가"}) == (first, True)
+
+    asyncio.run(scenario())
+
+
+def test_job_transitions_queued_running_done_and_failed(make_service, tmp_path):
+    release = tmp_path / "release"
+
+    async def scenario():
+        service = make_service()
+        await service.start()
+        try:
+            job, reused = service.submit({"text_data": f"wait:{release}"})
+            assert not reused and job.status == JobStatus.QUEUED
+            await wait_for_status(service, job.job_id, JobStatus.RUNNING)
+            release.touch()
+
+            failed, _ = service.submit({"text_data": "fail"})
+            await drain(service)
+
+            done = service.get(job.job_id)
+            assert done.status == JobStatus.DONE and done.attempts == 1
+            assert service.result_service.get(job.job_id) is not None
+            assert service.get(failed.job_id).status == JobStatus.FAILED
+            assert service.get(failed.job_id).error == "분석 실패"
+            assert (service.completed, service.failed) == (1, 1)
+            assert service.progress_broker.last_event(job.job_id)["stage"] == "done"
+
+            # 완료된 결과가 있는 같은 내용은 새 작업을 만들지 않음
+            assert service.submit({"text_data": f"wait:{release}"}) == (service.get(job.job_id), True)
+        finally:
+            await service.stop()
+
+    asyncio.run(scenario())
+
+
+def test_start_recovers_unfinished_jobs(make_service, tmp_path):
+    repository = JobRepository(str(tmp_path / "jobs.db"))
+    repository.create("interrupted", {"text_data": "가"})
+    repository.mark_running("interrupted")
+    repository.create("pending", {"text_data": "나"})
+    repository.close()
+
+    async def scenario():
+        service = make_service()
+        await service.start()
+        try:
+            await asyncio.wait_for(service._recovery_task, timeout=10)
+            await drain(service)
+            interrupted = service.get("interrupted")
+            assert interrupted.status == JobStatus.DONE and interrupted.attempts == 2
+            assert service.get("pending").status == JobStatus.DONE
+        finally:
+            await service.stop()
+
+    asyncio.run(scenario())
+
+
+def test_broken_process_pool_is_replaced(make_service):
+    async def scenario():
+        service = make_service()
+        await service.start()
+        try:
+            broken_executor = service.executor
+            crashed, _ = service.submit({"text_data": "crash"})
+            await drain(service)
+
+            assert service.get(crashed.job_id).status == JobStatus.FAILED
+            assert service.pool_restarts == 1
+            assert service.executor is not broken_executor
+
+            # 교체된 풀에서 이후 작업이 정상 처리되어야 함
+            ok, _ = service.submit({"text_data": "가"})
+            await drain(service)
+            assert service.get(ok.job_id).status == JobStatus.DONE
+            assert service.pool_restarts == 1
+        finally:
+            await service.stop()
+
+    asyncio.run(scenario())
+
+
+def test_result_purge_also_purges_finished_jobs(make_service):
+    async def scenario():
+        service = make_service()
+        await service.start()
+        try:
+            job, _ = service.submit({"text_data": "가"})
+            await drain(service)
+        finally:
+            await service.stop()
+        return job
+
+    job = asyncio.run(scenario())
+    service = make_service()
+    assert service.get(job.job_id).status == JobStatus.DONE
+
+    service.result_service.ttl_seconds = -1
+    assert service.result_service.purge_expired() == 1
+    assert service.get(job.job_id) is None
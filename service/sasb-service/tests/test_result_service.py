@@ -0,0 +1,22 @@
+# sasb-service/tests/test_result_service.py
+
+import pytest
+
+from service.result_service import etag_matches
+
+ETAG = '"0123456789abcdef"'
+
+
+@pytest.mark.parametrize("header, expected", [
+    (None, False),
+    ("", False),
+    (ETAG, True),
+    ("*", True),
+    (f"W/{ETAG}", True),
+    (f'"other", {ETAG}', True),
+    (f'"other",W/{ETAG} , "another"', True),
+    ('"other", W/"another"', False),
+    ('"0123456789abcdef', False),
+])
+def test_etag_matches(header, expected):
+    assert etag_matches(header, ETAG) is expected